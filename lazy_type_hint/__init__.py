@@ -1,3 +1,4 @@
 from lazy_type_hint.generators.lazy_type_hint import LazyTypeHint as LazyTypeHint
 from lazy_type_hint.generators.lazy_type_hint_live import LazyTypeHintLive as LazyTypeHintLive
+from lazy_type_hint.generators.lazy_type_hint_session import LazyTypeHintSession as LazyTypeHintSession
 from lazy_type_hint.strategies import ParsingStrategies as ParsingStrategies
@@ -4,29 +4,46 @@ This data can then be parsed to a .py compatible file that will type hint your c
 """
 from __future__ import annotations
 
+import hashlib
+import importlib
+import itertools
 import re
 from abc import ABC, abstractmethod
+from contextlib import suppress
+from types import GeneratorType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
+    Dict,
     FrozenSet,
+    Generator,
     Hashable,
+    Iterable,
+    Iterator,
+    List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
     final,
 )
 
 from lazy_type_hint.strategies import ParsingStrategies
 from lazy_type_hint.utils import (
     ImportManager,
+    Instrumentation,
     OrderedSet,
-    cache_returned_value_per_instance,
+    cached_property,
+    get_stable_repr,
+    invalidate_cached_properties,
     is_string_python_keyword_compatible,
 )
 from lazy_type_hint.utils.utils import TAB
@@ -44,8 +61,53 @@ ChildrenStructure = Union[FrozenSet[DataTypeT], Sequence[DataTypeT], Mapping[Has
 """Different child structures that the Tree can hold."""
 
 
+class ChildSpec(NamedTuple):
+    """Child requested by a node while instantiating its children."""
+
+    data: object
+    name: str
+
+
+ChildrenBuilder = Generator[ChildSpec, "DataTypeTree", Optional[ChildrenStructure["DataTypeTree"]]]
+"""Generator that yields the children to be built and returns the child structure once all of them were received."""
+
+
+class _BuildFrame(NamedTuple):
+    """Node whose children are being built."""
+
+    node: DataTypeTree
+    builder: ChildrenBuilder
+    start: float
+    """Value returned by `Instrumentation.start` when the construction of the node started."""
+    data: object
+    """Data given to build the node. It is kept so that its `id` is not reused by any other object meanwhile."""
+    leaves: Dict[Type[object], DataTypeTree]
+    """Children built so far that are shared among siblings (see `DataTypeTree.shared_among_siblings`), by type."""
+    containers: Dict[int, DataTypeTree]
+    """Children built so far from a generator, by the `id` of their data."""
+
+
 class DataTypeTree(ABC):
-    """Tree that represents any kind of data with its inner structures."""
+    """Tree that represents any kind of data with its inner structures.
+
+    Nodes define `__slots__` (as every subclass must do), so that they do not hold any instance `__dict__`. Cached
+    properties (see `CachedProperty`) are stored within their own slot as well.
+    """
+
+    __slots__ = (
+        "name",
+        "depth",
+        "height",
+        "data",
+        "imports",
+        "parent",
+        "children",
+        "holding_type",
+        "strategies",
+        "is_recursive",
+        "_cached_hash",
+        "_cached_strs_all_nodes",
+    )
 
     name: str
     """Name that represents this node."""
@@ -68,11 +130,27 @@ class DataTypeTree(ABC):
     """Type of input data given."""
     strategies: ParsingStrategies
     """Strategies to follow when parsing the data."""
+    is_recursive: bool
+    """Whether any of the descendants refers back to the current node, as the data contains a cycle."""
 
     subclasses: ClassVar[Mapping[Type[object], Type[DataTypeTree]]] = {}
     """Available subclasses according to the type they are able to parse."""
+    _resolved_subclasses: ClassVar[Dict[Type[object], Type[DataTypeTree]]] = {}
+    """Subclass found for each type that is not directly registered, so that it is only searched once."""
+    lazy_subclasses: ClassVar[Dict[str, List[str]]] = {}
+    """Modules defining subclasses that parse third-party types, by the top-level package of these types.
+
+    They are only imported the first time data from that package is found, so that heavy libraries are not imported
+    by this one unless they are actually used.
+    """
     wraps: ClassVar[Sequence[Type[object]]] = (object,)
     """Object type that the tree is able to parse."""
+    shared_among_siblings: ClassVar[bool] = False
+    """Whether the representation of a leaf only depends on the type of its data.
+
+    If so, all children of the same node whose data has the same type share a single leaf, so that one is built per
+    type instead of one per element.
+    """
 
     @final
     def __init__(
@@ -85,32 +163,174 @@ class DataTypeTree(ABC):
         strategies: ParsingStrategies = ParsingStrategies(),  # noqa: B008
         parent: Optional[DataTypeTree] = None,
     ) -> None:
+        self._build(ChildSpec(data, name), imports=imports, depth=depth, strategies=strategies, parent=parent)
+
+    @final
+    def _build(
+        self,
+        spec: ChildSpec,
+        *,
+        imports: Optional[ImportManager],
+        depth: int,
+        strategies: ParsingStrategies,
+        parent: Optional[DataTypeTree],
+    ) -> None:
+        """Build the current node and all its descendants.
+
+        Subclasses whose children are built from a generator (see `ChildrenBuilder`) are built with an explicit stack
+        instead of recursion, so that the depth of the data is not limited by the recursion limit.
+
+        These nodes are also memoized by the `id` of their data among siblings, so that an object referenced multiple
+        times by the same container (such as YAML aliases) is only parsed once. Nodes are not shared among different
+        parents, as their depth and name would not match. An object referenced from within itself is represented by a
+        `ReferenceDataTypeTree` instead, which makes the ancestor be defined as a recursive type alias. Leaves whose
+        subclass is `shared_among_siblings` are reused by all siblings whose data has the same type.
+        """
+        from lazy_type_hint.data_type_tree.simple_data_type_tree.reference_data_type_tree import (
+            ReferenceDataTypeTree,
+        )
+
+        instrumentation = Instrumentation.active
+        stack: List[_BuildFrame] = []
+        in_progress: Dict[int, DataTypeTree] = {}
+        node: DataTypeTree = self
+        try:
+            while True:
+                start = instrumentation.start() if instrumentation is not None else 0.0
+                children = node._initialize(spec, imports=imports, depth=depth, strategies=strategies, parent=parent)
+                if isinstance(children, GeneratorType):
+                    stack.append(_BuildFrame(node, children, start, spec.data, {}, {}))
+                    in_progress[id(spec.data)] = node
+                    built: Optional[DataTypeTree] = None
+                else:
+                    node._finalize(cast(Optional[ChildrenStructure[DataTypeTree]], children), start)
+                    if not stack:
+                        return
+                    if node.shared_among_siblings:
+                        stack[-1].leaves[node.holding_type] = node
+                    built = node
+
+                # Resume the nodes waiting for their children until one of them requests a child not built yet
+                while True:
+                    frame = stack[-1]
+                    try:
+                        spec = frame.builder.send(built)  # type: ignore[arg-type]
+                    except StopIteration as stop:
+                        stack.pop()
+                        del in_progress[id(frame.data)]
+                        frame.node._finalize(stop.value, frame.start)
+                        if not stack:
+                            return
+                        stack[-1].containers[id(frame.data)] = frame.node
+                        built = frame.node
+                        continue
+                    memoized = frame.leaves.get(type(spec.data))
+                    if memoized is None:
+                        memoized = frame.containers.get(id(spec.data))
+                    if memoized is None:
+                        break
+                    built = memoized
+
+                parent = frame.node
+                if id(spec.data) in in_progress:
+                    node = ReferenceDataTypeTree.__new__(ReferenceDataTypeTree)
+                    node.target = in_progress[id(spec.data)]
+                else:
+                    subclass = DataTypeTree.select_subclass(spec.data, strategies=parent.strategies)
+                    node = subclass.__new__(subclass)
+                imports, depth, strategies = parent.imports, parent.depth + 1, parent.strategies
+        except BaseException:
+            if instrumentation is not None:  # Close the measurements of all nodes left unfinished
+                for frame in reversed(stack):
+                    instrumentation.stop(type(frame.node).__name__, "construction", frame.start)
+            raise
+
+    @final
+    def _initialize(
+        self,
+        spec: ChildSpec,
+        *,
+        imports: Optional[ImportManager],
+        depth: int,
+        strategies: ParsingStrategies,
+        parent: Optional[DataTypeTree],
+    ) -> Union[Optional[ChildrenStructure[DataTypeTree]], ChildrenBuilder]:
+        """Initialize the attributes of the current node and start instantiating its children."""
         # Validation
-        self._validate_name(name)
-        self._check_tree_is_correct_one(data)
+        self._validate_name(spec.name)
+        self._check_tree_is_correct_one(spec.data)
 
-        self.data = data
-        self.name = name
-        self.holding_type = type(data)
+        self.data = spec.data
+        self.name = spec.name
+        self.holding_type = type(spec.data)
         self.strategies = strategies
         self.depth = depth
         self.imports = ImportManager() if imports is None else imports
         self.parent = parent
+        self.is_recursive = False
         self.__pre_child_instantiation__()
-        self.children = self._instantiate_children(self.data)
+        return self._instantiate_children(self.data)
+
+    @final
+    def _finalize(self, children: Optional[ChildrenStructure[DataTypeTree]], start: float) -> None:
+        """Finish the initialization of the current node once all its children were built."""
+        self.children = children
         self.height = self._get_height()
         self.__post_child_instantiation__()
+        if Instrumentation.active is not None:
+            Instrumentation.active.stop(type(self).__name__, "construction", start)
+
+    @staticmethod
+    def select_subclass(data: object, *, strategies: ParsingStrategies) -> Type[DataTypeTree]:
+        """Get the subclass that parses the given data according to the strategies."""
+        subclass = DataTypeTree.get_subclass(data)
+        if strategies.instance_strategy == "Protocol":
+            from lazy_type_hint.data_type_tree.generic_type.object_data_type_tree import ObjectDataTypeTree
+
+            if ObjectDataTypeTree.get_layout(data) is not None:
+                return ObjectDataTypeTree
+        return subclass
 
     @classmethod
     def get_subclass(cls, data: object) -> Type[DataTypeTree]:
         if type(data) in DataTypeTree.subclasses:
             return DataTypeTree.subclasses[type(data)]
+        if type(data) in DataTypeTree._resolved_subclasses:
+            return DataTypeTree._resolved_subclasses[type(data)]
+        if DataTypeTree.lazy_subclasses and cls._import_lazy_subclasses(type(data)):
+            return cls.get_subclass(data)
+
+        subclass = next(
+            (subclass for subclass in DataTypeTree.subclasses.values() if isinstance(data, tuple(subclass.wraps))),
+            DataTypeTree.subclasses[int],  # For instances created from any custom class.
+        )
+        DataTypeTree._resolved_subclasses[type(data)] = subclass
+        return subclass
+
+    @staticmethod
+    def register_lazy_subclass(package: str, module: str) -> None:
+        """
+        Register a module that defines a subclass to parse the types of a third-party package.
+
+        Args:
+            package (str): Top-level package of the types parsed (e.g. `pandas`).
+            module (str): Module that defines the subclass. It is imported the first time data whose type (or any of
+                its bases) belongs to `package` is parsed.
+        """
+        DataTypeTree.lazy_subclasses.setdefault(package, []).append(module)
 
-        for subclass in DataTypeTree.subclasses.values():
-            for wrap in subclass.wraps:
-                if isinstance(data, wrap):
-                    return subclass
-        return DataTypeTree.subclasses[int]  # For instances created from any custom class.
+    @staticmethod
+    def _import_lazy_subclasses(type_: Type[object]) -> bool:
+        """Import the subclasses registered for the packages of the given type or its bases, if any."""
+        modules = [
+            module
+            for base in type_.__mro__
+            for module in DataTypeTree.lazy_subclasses.pop(base.__module__.partition(".")[0], [])
+        ]
+        for module in modules:
+            with suppress(ImportError):  # The third-party package might not be installed
+                importlib.import_module(module)
+        return bool(modules)
 
     def _check_tree_is_correct_one(self, data: object) -> None:
         if not any(isinstance(data, wraps_) for wraps_ in self.wraps):
@@ -140,10 +360,12 @@ class DataTypeTree(ABC):
             raise DataTypeTreeError(f"The given name ({name}) is not Python-keyword compatible")
 
     @abstractmethod
-    def _instantiate_children(self, data: object) -> Optional[ChildrenStructure[DataTypeTree]]:
+    def _instantiate_children(self, data: object) -> Union[Optional[ChildrenStructure[DataTypeTree]], ChildrenBuilder]:
         """Instantiate the child structure that will be assigned to `self.children`.
 
-        This one will depend on how each subclass manage the child structure.
+        This one will depend on how each subclass manage the child structure. Instead of building the children with
+        `data_type_tree_factory`, subclasses can return a generator that yields a `ChildSpec` for each child to be
+        built, receives the child built and finally returns the child structure.
         """
 
     @final
@@ -161,10 +383,115 @@ class DataTypeTree(ABC):
         """Get a unique hash that identifies the current data type."""
 
     @final
-    @cache_returned_value_per_instance
     def __hash__(self) -> int:
-        """Unique hash that identifies whether the current tree is considered to be unique."""
-        return hash(self._get_hash())
+        """Unique hash that identifies whether the current tree is considered to be unique.
+
+        It is only computed once. The hashes of the descendants are computed beforehand, from the deepest ones, so
+        that `_get_hash` can rely on `hash(child)` without recursing.
+        """
+        cached_hash = DataTypeTree._hash
+        if not cached_hash.is_cached(self):
+            for node in self._iter_post_order(skip=cached_hash.is_cached):
+                node._hash  # noqa: B018
+        return self._hash
+
+    @final
+    @cached_property(depends_on=("children", "data"))
+    def _hash(self) -> int:
+        instrumentation = Instrumentation.active
+        if instrumentation is None:
+            return hash(self._get_hash())
+        start = instrumentation.start()
+        try:
+            return hash(self._get_hash())
+        finally:
+            instrumentation.stop(type(self).__name__, "hash", start)
+
+    @final
+    def invalidate(self, *changed: str) -> None:
+        """
+        Drop the cached values that depend on the attributes that changed within the current node.
+
+        The ones of the ancestors are dropped as well, as they are built from the ones of their descendants.
+
+        Args:
+            *changed (str): Attributes that changed. If none is given, all cached values are dropped.
+        """
+        node: Optional[DataTypeTree] = self
+        while node is not None:
+            invalidate_cached_properties(node, *changed)
+            node = node.parent
+
+    @final
+    def _iter_post_order(self, *, skip: Callable[[DataTypeTree], bool] = lambda _: False) -> Iterator[DataTypeTree]:
+        """
+        Iterate, without recursion, over all nodes of the tree, children first. Each node is only visited once.
+
+        Args:
+            skip (Callable[[DataTypeTree], bool], optional): Whether a node (and all its descendants) must be skipped.
+                Defaults to never.
+        """
+        visited: Set[int] = set()
+        stack: List[Tuple[DataTypeTree, bool]] = [(self, False)]
+        while stack:
+            node, children_visited = stack.pop()
+            if children_visited:
+                yield node
+            elif id(node) not in visited and not skip(node):
+                visited.add(id(node))
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.get_children()))
+
+    @final
+    def get_children(self) -> Tuple[DataTypeTree, ...]:
+        """Children of the current node, in the same order as they are iterated."""
+        if not self.children:
+            return ()
+        return tuple(self)
+
+    def _get_fingerprint(self) -> Hashable:
+        """Identify what changes the string representation of the current node apart from its type, name and children.
+
+        It must be built from types, tuples, frozensets and literals so that its representation is stable. Subclasses
+        whose representation depends on any other information from the data must override it.
+        """
+        return ()
+
+    def _get_docstrings(self) -> Hashable:
+        """Docstrings included in the string representation of the current node, excluding its children."""
+        return ()
+
+    @final
+    def get_fingerprint(self, *, include_docstrings: bool = True) -> str:
+        """Digest that identifies the string representation of the whole tree.
+
+        Unlike the hash, it does not change across interpreters, so it can be persisted and compared later on to
+        know whether the type hints would change without having to render them again.
+
+        Args:
+            include_docstrings (bool, optional): Whether the docstrings are taken into account. If False, only the
+                structure of the type hints is identified. Defaults to True.
+        """
+        fingerprints: Dict[int, str] = {}
+        for node in self._iter_post_order():
+            if node.children is None:
+                children: Sequence[str] = ()
+            elif isinstance(node.children, Mapping):
+                children = [f"{get_stable_repr(key)}:{fingerprints[id(child)]}" for key, child in node.children.items()]
+            else:  # Ordered by hash, so sort them. Subclasses where order matters include it in `_get_fingerprint`
+                children = sorted(fingerprints[id(child)] for child in node.children)
+            content = "|".join(
+                (
+                    type(node).__qualname__,
+                    node.name,
+                    get_stable_repr(node.holding_type),
+                    get_stable_repr(node._get_fingerprint()),
+                    get_stable_repr(node._get_docstrings() if include_docstrings else ()),
+                    *children,
+                )
+            )
+            fingerprints[id(node)] = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return fingerprints[id(self)]
 
     @abstractmethod
     def _get_str_top_node(self) -> str:
@@ -180,7 +507,7 @@ class DataTypeTree(ABC):
         This will depend on the parsing strategy and on the fact that some trees require a type
         alias no matter its height.
         """
-        if self.parent is None:
+        if self.parent is None or self.is_recursive:
             return True
         return bool(self.height > self.strategies.min_height_to_define_type_alias)
 
@@ -191,39 +518,82 @@ class DataTypeTree(ABC):
 
     @final
     def get_str_top_node(self) -> str:
-        return self._get_str_top_node()
+        instrumentation = Instrumentation.active
+        if instrumentation is None:
+            return self._get_str_top_node()
+        start = instrumentation.start()
+        try:
+            return self._get_str_top_node()
+        finally:
+            instrumentation.stop(type(self).__name__, "render", start)
 
     @final
     def get_str_all_nodes(
         self, include_imports: bool = True, make_parent_class_inherit_from_original_type: bool = False
     ) -> str:
         """String that represents the .py file created from the tree."""
-        return self._format_node_strings(
-            self.get_strs_all_nodes_unformatted(
+        return "".join(
+            self.iter_str_all_nodes(
+                include_imports=include_imports,
+                make_parent_class_inherit_from_original_type=make_parent_class_inherit_from_original_type,
+            )
+        )
+
+    @final
+    def iter_str_all_nodes(
+        self, include_imports: bool = True, make_parent_class_inherit_from_original_type: bool = False
+    ) -> Iterator[str]:
+        """
+        Iterate over the pieces of the string that represents the .py file created from the tree.
+
+        Joined, they are equal to `get_str_all_nodes`. They are yielded in order, so that the output can be written
+        piece by piece without ever building the whole string. All nodes are rendered before returning, as the imports
+        they require come first.
+
+        Args:
+            include_imports (bool, optional): Whether the imports are included. Defaults to True.
+            make_parent_class_inherit_from_original_type (bool, optional): Whether the top node is renamed to
+                `_<name>` and a class `<name>` inheriting from it is added. Defaults to False.
+
+        Returns:
+            Iterator[str]: Pieces of the string, in order.
+        """
+        return self._iter_formatted_node_strings(
+            self._iter_strs_all_nodes_unformatted(
                 include_imports=include_imports,
                 make_parent_class_inherit_from_original_type=make_parent_class_inherit_from_original_type,
             )
         )
 
     @final
-    @cache_returned_value_per_instance
     def get_strs_all_nodes_unformatted(
         self, *, include_imports: bool = True, make_parent_class_inherit_from_original_type: bool = False
     ) -> Tuple[str, ...]:
         """Get, ordered by dependencies, all strings representing the whole tree."""
-        strings: OrderedSet[str] = OrderedSet()
-        self._get_strs_all_nodes_unformatted(types=strings)
-        strings_lst = strings.as_list()
-        if not strings_lst:
-            raise DataTypeTreeError("No type hints could be built")
+        return tuple(
+            self._iter_strs_all_nodes_unformatted(
+                include_imports=include_imports,
+                make_parent_class_inherit_from_original_type=make_parent_class_inherit_from_original_type,
+            )
+        )
 
-        if include_imports:
-            strings_lst.insert(0, self.imports.format())
+    @final
+    def _iter_strs_all_nodes_unformatted(
+        self, *, include_imports: bool, make_parent_class_inherit_from_original_type: bool
+    ) -> Iterator[str]:
+        """Iterate, ordered by dependencies, over all strings representing the whole tree without copying them."""
+        strings = self._strs_all_nodes
+        if not strings:
+            raise DataTypeTreeError("No type hints could be built")
 
+        head: Tuple[str, ...] = (self.imports.format(),) if include_imports else ()
+        tail: Tuple[str, ...] = ()
+        n_strings = len(strings)
         if make_parent_class_inherit_from_original_type:
-            strings_lst[-1], old_name = self.rename_declaration(strings_lst[-1], new_name="_{name}")
-            strings_lst.append(f"class {old_name}(_{old_name}):\n{TAB}...")
-        return tuple(strings_lst)
+            last_string, old_name = self.rename_declaration(strings[-1], new_name="_{name}")
+            tail = (last_string, f"class {old_name}(_{old_name}):\n{TAB}...")
+            n_strings -= 1
+        return itertools.chain(head, itertools.islice(strings, n_strings), tail)
 
     @staticmethod
     def rename_declaration(declaration: str, new_name: str) -> Tuple[str, str]:
@@ -243,45 +613,34 @@ class DataTypeTree(ABC):
             old_name = ""
         return declaration, old_name
 
+    @final
+    @cached_property(depends_on=("name", "children", "data"))
+    def _strs_all_nodes(self) -> Tuple[str, ...]:
+        """Strings of all type aliases of the tree, ordered by dependencies. They are only built once."""
+        strings: OrderedSet[str] = OrderedSet()
+        self._get_strs_all_nodes_unformatted(types=strings)
+        return tuple(strings.as_list())
+
     @final
     def _get_strs_all_nodes_unformatted(self, *, types: Optional[OrderedSet[str]] = None) -> None:
+        """Add the type aliases of all nodes, so that each one is added after the ones it depends on."""
         if types is None:
             types = OrderedSet()
+        for node in self._iter_post_order():
+            if node.permission_to_be_created_as_type_alias:
+                types.add(node.get_str_top_node())
 
-        if self.depth == 0 and not self.children:
-            if self.permission_to_be_created_as_type_alias:
-                types.add(self.get_str_top_node())
-            return
-        if not self.children:
-            return
-
-        for child in self:
-            child._get_strs_all_nodes_unformatted(types=types)
-            if child.permission_to_be_created_as_type_alias:
-                types.add(child.get_str_top_node())
-        if self.permission_to_be_created_as_type_alias:
-            types.add(self.get_str_top_node())
-        return
-
-    @final
-    def _format_node_strings(self, strs_py: Sequence[str]) -> str:
-        """Get the string representation of the type hints that represent the whole tree."""
-        strs_py = list(strs_py)
-        if not strs_py:
-            return ""
-
-        # Add extra separation between imports and first line
-        for idx, line in enumerate(strs_py):  # noqa: B007
-            if "" in line:
-                break
-        strs_py[idx] = strs_py[idx] + "\n"
-
-        # 2 empty lines before defining a class
-        for idx, line in enumerate(strs_py[2:], start=2):
-            if line.startswith("class"):
-                strs_py[idx] = "\n" + strs_py[idx]
-
-        return "\n\n".join(strs_py)
+    @staticmethod
+    def _iter_formatted_node_strings(strs_py: Iterable[str]) -> Iterator[str]:
+        """Iterate over the pieces of the string representation of the type hints that represent the whole tree."""
+        for idx, line in enumerate(strs_py):
+            if idx:
+                yield "\n\n"
+            if idx >= 2 and line.startswith("class"):
+                yield "\n"  # 2 empty lines before defining a class
+            yield line
+            if not idx:
+                yield "\n"  # Add extra separation between imports and first line
 
     @final
     def __str__(self) -> str:
@@ -309,11 +668,12 @@ class DataTypeTree(ABC):
 
     @final
     def print_all_children(self, *, recursive: bool = True) -> None:
-        print("    " * self.depth + repr(self))
-        if not self.children:
-            return
-        for child in self:
-            child.print_all_children(recursive=recursive)
+        stack: List[DataTypeTree] = [self]
+        while stack:
+            node = stack.pop()
+            print("    " * node.depth + repr(node))
+            if recursive or node is self:
+                stack.extend(reversed(node.get_children()))
 
     @final
     def __eq__(self, other_object: object) -> bool:
@@ -328,11 +688,17 @@ class DataTypeTree(ABC):
 
     @final
     def _rename(self, new_name: str, *, len_old_name: int) -> None:
-        """Rename the current node and all its subsequent children."""
-        if self.children:
-            for child in self:
-                child._rename(new_name=new_name, len_old_name=len_old_name)
-        if self.parent is not None:
-            self.name = new_name + self.name[len_old_name:]
-        else:
-            self.name = new_name
+        """Rename the current node and all its subsequent children.
+
+        Descendants whose name does not start with the old one are shared with any other node of the tree (see
+        `_build`), so they keep their name.
+        """
+        old_name = self.name[:len_old_name]
+        for node in self._iter_post_order(skip=lambda node: node is not self and not node.name.startswith(old_name)):
+            if node.parent is not None:
+                node.name = new_name + node.name[len_old_name:]
+            else:
+                node.name = new_name
+            if node is not self:
+                invalidate_cached_properties(node, "name")
+        self.invalidate("name")
@@ -245,6 +245,5 @@ def data_type_tree_factory(
     strategies: ParsingStrategies = ParsingStrategies(),  # noqa: B008
     parent: "Optional[DataTypeTree]" = None,
 ) -> DataTypeTree:
-    return DataTypeTree.get_subclass(data)(
-        data=data, name=name, imports=imports, depth=depth, strategies=strategies, parent=parent
-    )
+    subclass = DataTypeTree.select_subclass(data, strategies=strategies)
+    return subclass(data=data, name=name, imports=imports, depth=depth, strategies=strategies, parent=parent)
@@ -25,8 +25,10 @@ from lazy_type_hint.data_type_tree.generic_type.mapping_data_type_tree import Ma
 from lazy_type_hint.strategies import ParsingStrategies
 from lazy_type_hint.utils import (
     TAB,
-    cache_returned_value_per_instance,
+    Instrumentation,
+    cached_property,
     format_string_as_docstring,
+    invalidate_cached_properties,
     is_string_python_keyword_compatible,
 )
 
@@ -61,6 +63,16 @@ class KeyInfo:
 class DictMetadata:
     """Represents the metadata of a dictionary data type."""
 
+    __slots__ = (
+        "hidden_key_prefix",
+        "key_info",
+        "_data",
+        "_strategies",
+        "_initial_keys",
+        "_cached_is_functional_syntax",
+        "_cached_all_keys_are_parsable",
+    )
+
     hidden_key_prefix: str
     """Prefix prepended to a key to indicate this one should be hidden when building its type alias."""
     key_info: Dict[Hashable, KeyInfo]
@@ -114,10 +126,9 @@ class DictMetadata:
             return True
         return False
 
-    @property
-    @cache_returned_value_per_instance
+    @cached_property(depends_on=("_data", "_all_keys_are_parsable"))
     def is_functional_syntax(self) -> bool:
-        if self._all_keys_are_string(self._data) and self._all_keys_are_parsable():
+        if self._all_keys_are_string(self._data) and self._all_keys_are_parsable:
             return False
         return True
 
@@ -125,7 +136,7 @@ class DictMetadata:
     def _all_keys_are_string(dct: Mapping[Hashable, ValueT]) -> "TypeGuard[Mapping[str, ValueT]]":
         return all(isinstance(key, str) for key in dct)
 
-    @cache_returned_value_per_instance
+    @cached_property(depends_on=("_data",))
     def _all_keys_are_parsable(self) -> bool:
         if self._all_keys_are_string(self._data) and all(key not in keyword.kwlist for key in self._data):
             return all(is_string_python_keyword_compatible(key) for key in self._data)
@@ -136,6 +147,7 @@ class DictMetadata:
         for key, value in other._data.items():
             if key not in self._data:
                 self._data[key] = value
+        invalidate_cached_properties(self, "_data")
         self._update_key_info(other._initial_keys)
         return self._data
 
@@ -206,6 +218,8 @@ class DictMetadata:
 
 
 class DictDataTypeTree(MappingDataTypeTree):
+    __slots__ = ("dict_metadata",)
+
     wraps = (dict,)
     data: Dict[Hashable, object]
     dict_metadata: DictMetadata
@@ -227,6 +241,8 @@ class DictDataTypeTree(MappingDataTypeTree):
     def __pre_child_instantiation__(self) -> None:
         check_n_max = self.strategies.check_max_n_elements_within_container
         if self.strategies.dict_strategy != "TypedDict" and check_n_max:
+            if Instrumentation.active is not None and len(self.data) > check_n_max:
+                Instrumentation.active.record_skipped_elements(type(self).__name__, len(self.data) - check_n_max)
             self.data = dict(islice(self.data.items(), check_n_max))
         self.dict_metadata = DictMetadata(
             self.data, hidden_key_prefix=self.hidden_keys_prefix, strategies=self.strategies
@@ -346,6 +362,7 @@ class DictDataTypeTree(MappingDataTypeTree):
     def update_data_and_metadata(self, other: "DictDataTypeTree") -> None:
         """Given another child, this will update the current node with all the data and metadata."""
         self.data = dict(self.dict_metadata.update(other.dict_metadata))
+        self.invalidate("data")
 
     def _insert_class_docstring(self, lines: Sequence[str], *, key_used_as_doc: str) -> List[str]:
         string = self.data[key_used_as_doc]
@@ -365,9 +382,19 @@ class DictDataTypeTree(MappingDataTypeTree):
             return super()._get_hash()
         hashes: List[object] = []
         for name, child in self.children.items():
-            hashes.append(("typed_dict", name, child._get_hash()))
+            hashes.append(("typed_dict", name, hash(child)))
         return frozenset(hashes)
 
+    @override
+    def _get_fingerprint(self) -> Hashable:
+        return tuple((key, info.required) for key, info in self.dict_metadata.key_info.items())
+
+    @override
+    def _get_docstrings(self) -> Hashable:
+        key_docstrings = tuple((key, info.docstring) for key, info in self.dict_metadata.key_info.items())
+        class_docstring = self.data.get(self.strategies.key_used_as_doc) if self.strategies.key_used_as_doc else None
+        return (key_docstrings, class_docstring if isinstance(class_docstring, str) else None)
+
     @staticmethod
     def compare_multiple_typed_dicts_based_trees(*trees: "DictDataTypeTree") -> DictMetadataComparison:
         """
@@ -5,21 +5,24 @@ from typing import (
     List,
     Sequence,
     Tuple,
+    Union,
     final,
 )
 
 from typing_extensions import override
 
-from lazy_type_hint.data_type_tree.data_type_tree import ChildrenStructure, DataTypeTree
+from lazy_type_hint.data_type_tree.data_type_tree import ChildrenBuilder, ChildrenStructure, DataTypeTree
 
 
 class GenericDataTypeTree(DataTypeTree):
     """Tree that holds any kind of object that must contain other inner structures (children)."""
 
+    __slots__ = ()
+
     children: ChildrenStructure[DataTypeTree]
 
     @abstractmethod
-    def _instantiate_children(self, data: object) -> ChildrenStructure[DataTypeTree]:
+    def _instantiate_children(self, data: object) -> Union[ChildrenStructure[DataTypeTree], ChildrenBuilder]:
         ...
 
     def get_type_alias_children(self) -> str:
@@ -81,5 +84,5 @@ class GenericDataTypeTree(DataTypeTree):
     def _get_hash(self) -> Hashable:
         hashes: List[object] = []
         for child in self:
-            hashes.append(child._get_hash())
+            hashes.append(hash(child))
         return tuple(hashes)
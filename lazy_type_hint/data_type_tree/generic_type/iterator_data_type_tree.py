@@ -1,19 +1,36 @@
-from typing import Any, Iterator, Sequence, Tuple
+import itertools
+from typing import Any, Iterator, Tuple
 
 from typing_extensions import override
 
-from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.data_type_tree import ChildrenBuilder
 from lazy_type_hint.data_type_tree.generic_type.sequence_data_type_tree import (
     SequenceDataTypeTree,
 )
 
 
 class IteratorDataTypeTree(SequenceDataTypeTree):
+    """Tree that holds an iterator.
+
+    Only the first `check_max_n_elements_within_container` elements are consumed to build the type hints. These are
+    buffered and `data` is replaced by an iterator that yields them again before the remaining ones, so that no
+    element is lost and the memory used is bounded. If there is no such maximum, the whole iterator is buffered.
+    """
+
+    __slots__ = ("sample",)
+
     wraps = (Iterator,)
 
+    data: Iterator[Any]
+    """Iterator that yields all elements of the given one, including those consumed to build the type hints."""
+    sample: Tuple[Any, ...]
+    """Elements consumed from the given iterator to build the type hints."""
+
     @override
-    def _instantiate_children(self, data: Sequence[Any]) -> Tuple[DataTypeTree, ...]:  # type: ignore
-        return self.operations.instantiate_children(data, allow_repeated_children=False)
+    def _instantiate_children(self, data: Iterator[Any]) -> ChildrenBuilder:  # type: ignore
+        self.sample = tuple(itertools.islice(data, self.strategies.check_max_n_elements_within_container))
+        self.data = itertools.chain(self.sample, data)
+        return self.operations.instantiate_children(self.sample, allow_repeated_children=False)
 
     @override
     def _get_str_top_node(self) -> str:
@@ -1,18 +1,20 @@
-from typing import Any, Sequence, Tuple
+from typing import Any, Sequence
 
 from typing_extensions import override
 
-from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree, DataTypeTreeError
+from lazy_type_hint.data_type_tree.data_type_tree import ChildrenBuilder, DataTypeTreeError
 from lazy_type_hint.data_type_tree.generic_type.sequence_data_type_tree import (
     SequenceDataTypeTree,
 )
 
 
 class ListDataTypeTree(SequenceDataTypeTree):
+    __slots__ = ()
+
     wraps = (list,)
 
     @override
-    def _instantiate_children(self, data: Sequence[Any]) -> Tuple[DataTypeTree, ...]:  # type: ignore
+    def _instantiate_children(self, data: Sequence[Any]) -> ChildrenBuilder:  # type: ignore
         return self.operations.instantiate_children(data, allow_repeated_children=False)
 
     @override
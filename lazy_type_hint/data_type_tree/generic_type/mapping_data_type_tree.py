@@ -1,25 +1,27 @@
 import re
 from collections import defaultdict
-from typing import Dict, Final, Hashable, Iterator, List, Literal, Mapping, Set, Type
+from typing import Dict, Final, Generator, Hashable, Iterator, List, Literal, Mapping, Set, Type
 
 from typing_extensions import Self, override
 
-from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
-from lazy_type_hint.data_type_tree.factory import data_type_tree_factory
+from lazy_type_hint.data_type_tree.data_type_tree import ChildSpec, DataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.generic_data_type_tree import GenericDataTypeTree
 from lazy_type_hint.file_modifiers.yaml_file_modifier import YamlFileModifier
 
 
 class MappingDataTypeTree(GenericDataTypeTree):
+    __slots__ = ("_iterator",)
+
     children: Mapping[Hashable, DataTypeTree]
     hidden_keys_prefix: Final = YamlFileModifier.prefix
 
     # Iterable-protocol related
-    _keys: Iterator[Hashable]
     _iterator: Iterator[Hashable]
 
     @override
-    def _instantiate_children(self, data: Mapping[Hashable, object]) -> Mapping[Hashable, DataTypeTree]:  # type: ignore
+    def _instantiate_children(  # type: ignore
+        self, data: Mapping[Hashable, object]
+    ) -> Generator[ChildSpec, DataTypeTree, Mapping[Hashable, DataTypeTree]]:
         children: Dict[Hashable, DataTypeTree] = {}
         children_info: Dict[DataTypeTree, Set[Hashable]] = defaultdict(set)
 
@@ -27,14 +29,7 @@ class MappingDataTypeTree(GenericDataTypeTree):
             suffix = type(key).__name__ if not isinstance(key, str) else self._to_camel_case(key)
             if isinstance(key, str) and key.startswith(self.hidden_keys_prefix):
                 continue
-            child = data_type_tree_factory(
-                data=value,
-                name=f"{self.name}{suffix}",
-                imports=self.imports,
-                depth=self.depth + 1,
-                strategies=self.strategies,
-                parent=self,
-            )
+            child = yield ChildSpec(value, f"{self.name}{suffix}")
             children_info[child].add(key)
             children[key] = child
         self._assign_same_data_type_tree_to_keys_with_same_value_type(children, children_info=children_info)
@@ -126,7 +121,7 @@ class MappingDataTypeTree(GenericDataTypeTree):
     def _get_hash(self) -> Hashable:
         hashes: List[object] = []
         for name, child in self.children.items():
-            hashes.append(("mapping", hash(type(name)), child._get_hash()))
+            hashes.append(("mapping", hash(type(name)), hash(child)))
         return frozenset(hashes)
 
     @override
@@ -5,13 +5,18 @@ from typing import Any
 from typing_extensions import override
 
 from lazy_type_hint.data_type_tree.generic_type.mapping_data_type_tree import MappingDataTypeTree
+from lazy_type_hint.utils import Instrumentation
 
 
 class MappingProxyDataTypeTree(MappingDataTypeTree):
+    __slots__ = ()
+
     wraps = (MappingProxyType,)
     data: MappingProxyType[Any, Any]
 
     @override
     def __pre_child_instantiation__(self) -> None:
         if check_n_max := self.strategies.check_max_n_elements_within_container:
+            if Instrumentation.active is not None and len(self.data) > check_n_max:
+                Instrumentation.active.record_skipped_elements(type(self).__name__, len(self.data) - check_n_max)
             self.data = MappingProxyType(dict(islice(self.data.items(), check_n_max)))
@@ -0,0 +1,149 @@
+import dataclasses
+import inspect
+import keyword
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import ClassVar, Dict, FrozenSet, Generator, Hashable, List, Mapping, Optional, Tuple, Type
+
+from typing_extensions import override
+
+from lazy_type_hint.data_type_tree.data_type_tree import ChildSpec, DataTypeTree
+from lazy_type_hint.data_type_tree.generic_type.mapping_data_type_tree import MappingDataTypeTree
+from lazy_type_hint.data_type_tree.simple_data_type_tree.instance_data_type_tree import InstanceDataTypeTree
+from lazy_type_hint.utils import TAB, is_string_python_keyword_compatible
+
+
+@dataclass(frozen=True)
+class ClassLayout:
+    """Attributes that define the interface of the instances of a class."""
+
+    attributes: Tuple[str, ...]
+    """Attributes declared by the class itself (slots, dataclass or `NamedTuple` fields and properties)."""
+    has_dict: bool
+    """Whether further attributes are found within the `__dict__` of each instance."""
+    read_only: FrozenSet[str] = frozenset()
+    """Declared attributes that cannot be set (`NamedTuple` or frozen dataclass fields and properties without setter).
+    They are declared as properties, as Protocol variables are expected to be settable."""
+
+    def get_attributes(self, data: object) -> Dict[Hashable, object]:
+        """Get the public attributes of the given instance, with the declared ones first."""
+        attributes: Dict[Hashable, object] = {}
+        for name in self.attributes:
+            with suppress(Exception):  # Unset slots or properties that cannot be computed
+                attributes[name] = getattr(data, name)
+        if self.has_dict:
+            for name, value in vars(data).items():
+                if self.is_public(name) and name not in attributes:
+                    attributes[name] = value
+        return attributes
+
+    @staticmethod
+    def is_public(name: str) -> bool:
+        return not name.startswith("_") and is_string_python_keyword_compatible(name) and not keyword.iskeyword(name)
+
+
+class ObjectDataTypeTree(MappingDataTypeTree):
+    """Tree that represents an instance of a custom class by the public attributes it holds.
+
+    It is only used if `instance_strategy` is set to `Protocol`. Otherwise, instances are represented by the name of
+    their class.
+    """
+
+    __slots__ = ()
+
+    wraps = (object,)  # Custom classes, that cannot be registered beforehand
+
+    _layouts: ClassVar[Dict[Type[object], Optional[ClassLayout]]] = {}
+    """Layout of each class found. None if its instances cannot be introspected."""
+
+    @classmethod
+    def get_layout(cls, data: object) -> Optional[ClassLayout]:
+        """
+        Get the layout of the class of the given instance.
+
+        The class is only analyzed the first time one of its instances is found, so that any further instance costs a
+        single lookup.
+
+        Args:
+            data (object): Instance of any class.
+
+        Returns:
+            Optional[ClassLayout]: The layout, or None if its instances are not represented by their attributes.
+        """
+        type_ = type(data)
+        if type_ not in cls._layouts:
+            cls._layouts[type_] = cls._analyze_layout(data)
+        return cls._layouts[type_]
+
+    @staticmethod
+    def _analyze_layout(data: object) -> Optional[ClassLayout]:
+        type_ = type(data)
+        properties: Dict[str, property] = {}
+        for name in dir(type_):
+            attribute = inspect.getattr_static(type_, name)
+            if isinstance(attribute, property) and ClassLayout.is_public(name):
+                properties[name] = attribute
+        read_only = {name for name, attribute in properties.items() if attribute.fset is None}
+        if issubclass(type_, tuple) and hasattr(type_, "_fields"):  # NamedTuple
+            fields = tuple(name for name in type_._fields if ClassLayout.is_public(name))
+            properties = {name: attribute for name, attribute in properties.items() if name not in fields}
+            return ClassLayout(fields + tuple(properties), has_dict=False, read_only=frozenset(fields).union(read_only))
+        if type_.__module__ == "builtins" or DataTypeTree.get_subclass(data) is not InstanceDataTypeTree:
+            return None
+
+        attributes: List[str] = []
+        if dataclasses.is_dataclass(type_):
+            attributes.extend(field.name for field in dataclasses.fields(type_))
+            if type_.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+                read_only.update(attributes)
+        for base in reversed(type_.__mro__):
+            slots = base.__dict__.get("__slots__", ())
+            attributes.extend((slots,) if isinstance(slots, str) else slots)
+        attributes.extend(properties)
+        has_dict = hasattr(data, "__dict__")
+        if not attributes and not has_dict:
+            return None
+        public_attributes = (name for name in attributes if ClassLayout.is_public(name))
+        return ClassLayout(tuple(dict.fromkeys(public_attributes)), has_dict=has_dict, read_only=frozenset(read_only))
+
+    @override
+    def _instantiate_children(
+        self, data: object
+    ) -> Generator[ChildSpec, DataTypeTree, Mapping[Hashable, DataTypeTree]]:
+        layout = self.get_layout(data)
+        return super()._instantiate_children(layout.get_attributes(data) if layout is not None else {})
+
+    @override
+    @property
+    def permission_to_be_created_as_type_alias(self) -> bool:
+        return True
+
+    @override
+    def _get_str_top_node(self) -> str:
+        self.imports.add("Protocol")
+        read_only = self._get_read_only()
+        lines = [f"class {self.name}(Protocol):"]
+        for name, child in self.children.items():
+            if child.permission_to_be_created_as_type_alias:
+                type_hint = child.name
+            else:
+                type_hint = child.get_str_top_node_without_lvalue()
+            if name in read_only:
+                lines.append(f"{TAB}@property\n{TAB}def {name}(self) -> {type_hint}: ...")
+            else:
+                lines.append(f"{TAB}{name}: {type_hint}")
+        if len(lines) == 1:
+            lines.append(f"{TAB}...")
+        return "\n".join(lines)
+
+    @override
+    def _get_hash(self) -> Hashable:
+        hashes: List[object] = []
+        read_only = self._get_read_only()
+        for name, child in self.children.items():
+            hashes.append(("object", name, name in read_only, hash(child)))
+        return (self.holding_type.__qualname__, frozenset(hashes))
+
+    def _get_read_only(self) -> FrozenSet[str]:
+        layout = self._layouts.get(self.holding_type)
+        return layout.read_only if layout is not None else frozenset()
@@ -1,6 +1,7 @@
 from typing import (
     Dict,
     Final,
+    Generator,
     Hashable,
     List,
     Mapping,
@@ -14,10 +15,9 @@ from typing import (
 import pandas as pd
 from typing_extensions import override
 
-from lazy_type_hint.data_type_tree import data_type_tree_factory
-from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.data_type_tree import ChildSpec, DataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.mapping_data_type_tree import MappingDataTypeTree
-from lazy_type_hint.utils.utils import cache_returned_value_per_instance
+from lazy_type_hint.utils import cached_property
 
 LITERAL_OVERLOAD_TEMPLATE: Final = """    @overload  # type: ignore
     def __getitem__(self, key: Literal[{literal}]) -> {rtype}:
@@ -75,14 +75,15 @@ TEMPLATE_NO_PD: Final = """class {class_name}(pd.DataFrame):
 
 
 class PandasDataFrameDataTypeTree(MappingDataTypeTree):
+    __slots__ = ("_cached_permission_to_be_created_as_type_alias", "_cached_can_be_accessed_multilevel")
+
     wraps = (pd.DataFrame,)
     data: pd.DataFrame
     children: Mapping[str, DataTypeTree]  # type: ignore[assignment]
 
     @override
-    @property
-    @cache_returned_value_per_instance
-    def permission_to_be_created_as_type_alias(self) -> bool:
+    @cached_property(depends_on=("data", "is_recursive"))
+    def permission_to_be_created_as_type_alias(self) -> bool:  # type: ignore[override]
         """
         Set the permissions of this class to be created as a type alias.
 
@@ -100,8 +101,7 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
                 return True
         return super().permission_to_be_created_as_type_alias
 
-    @property
-    @cache_returned_value_per_instance
+    @cached_property(depends_on=("data",))
     def can_be_accessed_multilevel(self) -> bool:
         return self.all_columns_are(tuple)
 
@@ -126,20 +126,15 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
                 return False
         return True
 
-    def _create_child(self, column: Hashable) -> DataTypeTree:
+    def _get_child_spec(self, column: Hashable) -> ChildSpec:
         suffix = self._to_camel_case(str(column))
         suffix = suffix if suffix else "WSpace"
-        return data_type_tree_factory(  # type: ignore
-            data=self.data[column],
-            name=f"{self.name}{suffix}",
-            imports=self.imports,
-            depth=self.depth + 1,
-            strategies=self.strategies,
-            parent=self,
-        )
+        return ChildSpec(self.data[column], f"{self.name}{suffix}")
 
     @override
-    def _instantiate_children(self, data: pd.DataFrame) -> Mapping[Hashable, DataTypeTree]:
+    def _instantiate_children(
+        self, data: pd.DataFrame
+    ) -> Generator[ChildSpec, DataTypeTree, Mapping[Hashable, DataTypeTree]]:
         children: Dict[Hashable, DataTypeTree] = {}
         if not self.are_all_columns_literal_compatible:
             return {}
@@ -152,13 +147,13 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
         for column in data.columns:
             if not self.can_be_accessed_multilevel:  # Here all columns will  be Hashable
                 column = cast(Hashable, column)
-                children[column] = self._create_child(column)
+                children[column] = yield self._get_child_spec(column)
             else:  # Here all columns will be tuple
                 multi_column = cast(Tuple[Hashable, ...], column)
                 if multi_column[0] not in columns_processed:
                     if isinstance(multi_column[0], self.literal_compatible_types):
                         columns_processed.add(multi_column[0])
-                        children[column[0]] = self._create_child(column[0])
+                        children[column[0]] = yield self._get_child_spec(column[0])
         return children
 
     @override
@@ -167,6 +162,10 @@ class PandasDataFrameDataTypeTree(MappingDataTypeTree):
             return "pd.DataFrame"
         return str(self.data.columns)
 
+    @override
+    def _get_fingerprint(self) -> Hashable:
+        return self._get_hash()
+
     @override
     def _get_str_top_node(self) -> str:
         self.imports.add("pandas")
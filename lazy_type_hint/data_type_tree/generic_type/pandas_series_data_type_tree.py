@@ -1,26 +1,28 @@
-from typing import Any, Hashable, Sequence, Set, Tuple
+from typing import Any, Hashable, Sequence, Set
 
 import pandas as pd
 from typing_extensions import Self, override
 
-from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.data_type_tree import ChildrenBuilder, DataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.generic_data_type_tree import GenericDataTypeTree
 from lazy_type_hint.data_type_tree.generic_type.set_and_sequence_operations import SetAndSequenceOperations
 
 
 class PandasSeriesDataTypeTree(GenericDataTypeTree):
+    __slots__ = ("_iterator",)
+
     wraps = (pd.Series,)
     children: Sequence[DataTypeTree]
-    operations: SetAndSequenceOperations
 
     _iterator: int
 
-    @override
-    def __pre_child_instantiation__(self) -> None:
-        self.operations = SetAndSequenceOperations(self)
+    @property
+    def operations(self) -> SetAndSequenceOperations:
+        """Operations shared with the other set and sequence based trees. They are not stored to save memory."""
+        return SetAndSequenceOperations(self)
 
     @override
-    def _instantiate_children(self, data: Sequence[Any]) -> Tuple[DataTypeTree, ...]:  # type: ignore
+    def _instantiate_children(self, data: Sequence[Any]) -> ChildrenBuilder:  # type: ignore
         return self.operations.instantiate_children(data, allow_repeated_children=False)
 
     @override
@@ -32,7 +34,7 @@ class PandasSeriesDataTypeTree(GenericDataTypeTree):
     def _get_hash(self) -> Hashable:
         hashes: Set[object] = set()
         for child in self:
-            hashes.add(child._get_hash())
+            hashes.add(hash(child))
         return frozenset(hashes)
 
     @override
@@ -12,19 +12,20 @@ if TYPE_CHECKING:
 
 
 class SequenceDataTypeTree(GenericDataTypeTree):
-    operations: SetAndSequenceOperations
+    __slots__ = ("_iterator",)
 
     _iterator: int
 
-    @override
-    def __pre_child_instantiation__(self) -> None:
-        self.operations = SetAndSequenceOperations(self)
+    @property
+    def operations(self) -> SetAndSequenceOperations:
+        """Operations shared with the other set and sequence based trees. They are not stored to save memory."""
+        return SetAndSequenceOperations(self)
 
     @override
     def _get_hash(self) -> Hashable:
         hashes: List[object] = []
         for child in self:
-            hashes.append(child._get_hash())
+            hashes.append(hash(child))
         return frozenset(hashes)
 
     @override
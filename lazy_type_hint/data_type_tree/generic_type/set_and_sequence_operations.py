@@ -9,17 +9,22 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Generator,
     Iterable,
     List,
+    Optional,
     Sequence,
     Set,
+    Sized,
     Tuple,
     Union,
     cast,
 )
 
-from lazy_type_hint.data_type_tree.factory import data_type_tree_factory
+from lazy_type_hint.data_type_tree.data_type_tree import ChildSpec
 from lazy_type_hint.data_type_tree.generic_type.dict_data_type_tree import DictDataTypeTree
+from lazy_type_hint.data_type_tree.simple_data_type_tree.instance_data_type_tree import InstanceDataTypeTree
+from lazy_type_hint.utils import Instrumentation
 
 if TYPE_CHECKING:
     from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
@@ -32,10 +37,14 @@ if TYPE_CHECKING:
 class SetAndSequenceOperations:
     data_type_tree: "Union[SetDataTypeTree, SequenceDataTypeTree, PandasSeriesDataTypeTree]"
 
-    def instantiate_children(self, data: Sequence[Any], *, allow_repeated_children: bool) -> Tuple["DataTypeTree", ...]:
+    def instantiate_children(
+        self, data: Sequence[Any], *, allow_repeated_children: bool
+    ) -> Generator[ChildSpec, "DataTypeTree", Tuple["DataTypeTree", ...]]:
         """Instantiate the children for sets and sequences.
 
-        If `allow_repeated_children` is set to True, all children will be returned even if they are repeated.
+        If `allow_repeated_children` is set to True, all children will be returned even if they are repeated. Runs of
+        consecutive elements represented by the same instance-based tree (such as `int`) share a single child, so that
+        only the first element of each run is parsed.
         """
         if allow_repeated_children:
             children: Union[Set[DataTypeTree], List[DataTypeTree]] = []
@@ -44,10 +53,17 @@ class SetAndSequenceOperations:
         names_added: Dict[DataTypeTree, str] = {}  # Used to generate new and unique cnames in a quicker way.
 
         child: DataTypeTree
+        last_child: Optional[DataTypeTree] = None
         n_elements_to_check = self.data_type_tree.strategies.check_max_n_elements_within_container
         for idx, element in enumerate(data):
             if n_elements_to_check and idx >= n_elements_to_check:
+                if Instrumentation.active is not None and isinstance(data, Sized):
+                    Instrumentation.active.record_skipped_elements(type(self.data_type_tree).__name__, len(data) - idx)
                 break
+            if last_child is not None and self._continues_run(last_child, element):
+                if allow_repeated_children:
+                    cast("List[DataTypeTree]", children).append(last_child)
+                continue
             name = f"{self.data_type_tree.name}{type(element).__name__.capitalize()}"
             # Generate new name in case this one was already added
             if name in names_added.values():
@@ -57,14 +73,7 @@ class SetAndSequenceOperations:
                     modified_name = f"{name}{count}"
                     count += 1
                 name = modified_name
-            child = data_type_tree_factory(
-                data=element,
-                name=name,
-                imports=self.data_type_tree.imports,
-                depth=self.data_type_tree.depth + 1,
-                parent=self.data_type_tree,
-                strategies=self.data_type_tree.strategies,
-            )
+            child = yield ChildSpec(element, name)
             if allow_repeated_children:
                 # Tuple case
                 children = cast("List[DataTypeTree]", children)
@@ -72,6 +81,7 @@ class SetAndSequenceOperations:
                     child.rename(names_added[child])
                 children.append(child)
                 names_added[child] = child.name
+                last_child = child
             else:
                 # List and Set cases
                 children = cast("Set[DataTypeTree]", children)
@@ -80,6 +90,7 @@ class SetAndSequenceOperations:
                 if child not in children:
                     children.add(child)
                     names_added[child] = name
+                last_child = child
 
         return self._merge_similar_typed_dicts(
             children,
@@ -87,6 +98,16 @@ class SetAndSequenceOperations:
             allow_repeated_children=allow_repeated_children,
         )
 
+    @staticmethod
+    def _continues_run(last_child: "DataTypeTree", element: object) -> bool:
+        """Whether the element would be represented by the same instance-based tree as the last child."""
+        return type(last_child) is InstanceDataTypeTree and last_child.holding_type is type(element)
+
+    @staticmethod
+    def _record_merge(merged_trees: Sequence[DictDataTypeTree]) -> None:
+        if Instrumentation.active is not None and len(merged_trees) > 1:
+            Instrumentation.active.record_merge(DictDataTypeTree.__name__, len(merged_trees))
+
     def _update_existing_typed_dict_child_from_another_equal_child(
         self, children: "Iterable[DataTypeTree]", child: DictDataTypeTree
     ) -> None:
@@ -126,6 +147,7 @@ class SetAndSequenceOperations:
                 if isinstance(child, DictDataTypeTree) and child.dict_metadata.is_typed_dict:
                     dict_data_type_trees.append(child)
             merged_child = DictDataTypeTree.from_multiple_dict_data_type_trees(*dict_data_type_trees)
+            SetAndSequenceOperations._record_merge(dict_data_type_trees)
             for idx, child in enumerate(children):
                 if isinstance(child, DictDataTypeTree) and child.dict_metadata.is_typed_dict:
                     children[idx] = merged_child
@@ -138,5 +160,6 @@ class SetAndSequenceOperations:
                     dict_data_type_trees.append(child)
 
             merged_child = DictDataTypeTree.from_multiple_dict_data_type_trees(*dict_data_type_trees)
+            SetAndSequenceOperations._record_merge(dict_data_type_trees)
             children.add(merged_child) if isinstance(children, list) else children.add(merged_child)
             return tuple(children)
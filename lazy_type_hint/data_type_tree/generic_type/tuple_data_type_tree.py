@@ -2,16 +2,35 @@ from typing import Any, Hashable, List, Sequence, Tuple
 
 from typing_extensions import override
 
-from lazy_type_hint.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.data_type_tree import ChildrenBuilder
 from lazy_type_hint.data_type_tree.generic_type.sequence_data_type_tree import SequenceDataTypeTree
 
 
 class TupleDataTypeTree(SequenceDataTypeTree):
+    __slots__ = ("is_fixed_size",)
+
     wraps = (tuple,)
 
+    is_fixed_size: bool
+    """Whether the size of the tuple is type hinted.
+
+    If `max_fixed_tuple_size` is set, tuples longer than it whose elements share the same type are type hinted as
+    `Tuple[T, ...]` even with the `fixed` strategy, so that neither the tree nor the type hints grow with the size of
+    the tuple. The type of every element is compared, as it is cheap compared to building the children.
+    """
+
     @override
-    def _instantiate_children(self, data: Sequence[Any]) -> Tuple[DataTypeTree, ...]:  # type: ignore
-        if self.strategies.tuple_size_strategy == "fixed":
+    def __pre_child_instantiation__(self) -> None:
+        super().__pre_child_instantiation__()
+        data: Tuple[Any, ...] = self.data  # type: ignore
+        max_size = self.strategies.max_fixed_tuple_size
+        self.is_fixed_size = self.strategies.tuple_size_strategy == "fixed" and not (
+            max_size is not None and len(data) > max_size and len(set(map(type, data))) == 1
+        )
+
+    @override
+    def _instantiate_children(self, data: Sequence[Any]) -> ChildrenBuilder:  # type: ignore
+        if self.is_fixed_size:
             return self.operations.instantiate_children(data, allow_repeated_children=True)
         else:
             return self.operations.instantiate_children(data, allow_repeated_children=False)
@@ -23,7 +42,7 @@ class TupleDataTypeTree(SequenceDataTypeTree):
 
     @override
     def get_type_alias_children(self) -> str:
-        if self.strategies.tuple_size_strategy == "fixed":
+        if self.is_fixed_size:
             child_types = self._get_types(remove_repeated=False)
         else:
             child_types = self._get_types(remove_repeated=True)
@@ -35,7 +54,7 @@ class TupleDataTypeTree(SequenceDataTypeTree):
             self.imports.add("Any")
             return "Any, ..."
 
-        if self.strategies.tuple_size_strategy == "fixed":
+        if self.is_fixed_size:
             return f"{', '.join(child_types)}"
         else:
             names_set = set(child_types)
@@ -46,10 +65,16 @@ class TupleDataTypeTree(SequenceDataTypeTree):
 
     @override
     def _get_hash(self) -> Hashable:
-        if self.strategies.tuple_size_strategy == "any size":
+        if not self.is_fixed_size:
             return super()._get_hash()
         else:
             hashes: List[object] = []
             for child in self:
-                hashes.append(child._get_hash())
+                hashes.append(hash(child))
             return tuple(hashes)
+
+    @override
+    def _get_fingerprint(self) -> Hashable:
+        if not self.is_fixed_size:
+            return ()
+        return tuple(child.name for child in self)
@@ -1,4 +1,4 @@
-from contextlib import suppress
+from typing import TYPE_CHECKING
 
 from lazy_type_hint.data_type_tree.simple_data_type_tree.function_data_type_tree import (
     FunctionDataTypeTree as FunctionDataTypeTree,
@@ -6,18 +6,28 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.function_data_type_tree
 from lazy_type_hint.data_type_tree.simple_data_type_tree.instance_data_type_tree import (
     InstanceDataTypeTree as InstanceDataTypeTree,
 )
-
-with suppress(ImportError):
-    from lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree import (
-        NumpyDataTypeTree as NumpyDataTypeTree,
-    )
 from lazy_type_hint.data_type_tree.simple_data_type_tree.io_data_type_tree import IoDataTypeTree as IoDataTypeTree
 from lazy_type_hint.data_type_tree.simple_data_type_tree.module_data_type_tree import (
     ModuleTypeDataTypeTree as ModuleTypeDataTypeTree,
 )
+from lazy_type_hint.data_type_tree.simple_data_type_tree.reference_data_type_tree import (
+    ReferenceDataTypeTree as ReferenceDataTypeTree,
+)
 from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree import (
     SimpleDataTypeTree as SimpleDataTypeTree,
 )
 from lazy_type_hint.data_type_tree.simple_data_type_tree.type_data_type_tree import (
     TypeDataTypeTree as TypeDataTypeTree,
 )
+from lazy_type_hint.utils import register_lazy_subclasses
+
+if TYPE_CHECKING:
+    from lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree import (
+        NumpyDataTypeTree as NumpyDataTypeTree,
+    )
+
+__getattr__ = register_lazy_subclasses(
+    __name__,
+    "numpy",
+    {"NumpyDataTypeTree": "lazy_type_hint.data_type_tree.simple_data_type_tree.numpy_data_type_tree"},
+)
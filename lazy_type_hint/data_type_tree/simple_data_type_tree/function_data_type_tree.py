@@ -1,20 +1,62 @@
 import ast
+import dis
+import functools
 import inspect
 import textwrap
+from dataclasses import dataclass
 from inspect import Parameter
-from types import BuiltinFunctionType, FunctionType, MappingProxyType, MethodType
-from typing import Any, Callable, Hashable, Optional
+from types import BuiltinFunctionType, CodeType, FunctionType, MappingProxyType, MethodType
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Hashable, Optional
 
 from typing_extensions import override
 
 from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree import SimpleDataTypeTree
-from lazy_type_hint.utils import TAB
+from lazy_type_hint.utils import TAB, ImportManager, cached_property
+from lazy_type_hint.utils.import_manager import KEYWORDS_AVAILABLE
+
+
+@dataclass(frozen=True)
+class CallableInfo:
+    """Information extracted from a callable, shared among all nodes that hold the same one."""
+
+    signature: Optional[inspect.Signature]
+    """Signature of the callable. None if it cannot be inspected."""
+    has_return: Optional[bool]
+    """Whether the callable returns any value other than None. None if unknown."""
+
+    @functools.cached_property
+    def call_str(self) -> str:
+        """Declaration of `__call__` within a Protocol that represents the callable.
+
+        The return type is only `None` if the callable is known to return nothing else, so that those whose return
+        cannot be inspected (i.e. builtins) are declared as returning `Any`.
+        """
+        args = str(self.signature)
+        if "->" in args:
+            return f"def __call__{args}: ..."
+        return f"def __call__{args} -> {'None' if self.has_return is False else 'Any'}: ..."
+
+    @functools.cached_property
+    def call_imports(self) -> FrozenSet[KEYWORDS_AVAILABLE]:
+        """Symbols that must be imported to declare `__call__`."""
+        imports = ImportManager()
+        imports.import_all_unkown_symbols_from_signature(str(self.signature))
+        if self.has_return is not False and "->" not in str(self.signature):
+            imports.add("Any")
+        return frozenset(imports)
 
 
 class FunctionDataTypeTree(SimpleDataTypeTree):
+    __slots__ = ("_cached_callable_info",)
+
     wraps = (FunctionType, staticmethod, classmethod, BuiltinFunctionType, MethodType)
     data: Callable[[Any], Any]
 
+    _callable_info_cache: ClassVar[Dict[Hashable, CallableInfo]] = {}
+    """Information of each callable parsed, so that it is only extracted once among all nodes and trees."""
+    callable_info_cache_size: ClassVar[int] = 4096
+    """Maximum number of callables whose information is kept. The oldest ones are discarded first."""
+
     @property
     def is_lambda(self) -> bool:
         return bool(self.data.__name__ == "<lambda>")
@@ -26,13 +68,26 @@ class FunctionDataTypeTree(SimpleDataTypeTree):
             return True
         return True
 
-    @property
-    def can_be_inspected(self) -> bool:
+    @cached_property(depends_on=("data",))
+    def callable_info(self) -> CallableInfo:
+        """Information extracted from the callable. It is shared among all nodes that hold the same callable."""
+        key = self._get_callable_key(self.data)
+        if key is not None and key in self._callable_info_cache:
+            return self._callable_info_cache[key]
         try:
-            inspect.signature(self.data)
-            return True
+            signature: Optional[inspect.Signature] = inspect.signature(self.data)
         except ValueError:
-            return False
+            signature = None
+        info = CallableInfo(signature, self._has_return())
+        if key is not None:
+            if len(self._callable_info_cache) >= self.callable_info_cache_size:
+                del self._callable_info_cache[next(iter(self._callable_info_cache))]
+            self._callable_info_cache[key] = info
+        return info
+
+    @property
+    def can_be_inspected(self) -> bool:
+        return self.callable_info.signature is not None
 
     def _get_str_top_node(self) -> str:
         if not self.can_be_inspected:
@@ -43,20 +98,14 @@ class FunctionDataTypeTree(SimpleDataTypeTree):
         return self._get_protocol_str()
 
     def _get_protocol_str(self) -> str:
-        args = str(inspect.signature(self.data))
         self.imports.add("Protocol")
-        self.imports.import_all_unkown_symbols_from_signature(args)
-
-        if "->" not in args:
-            if not self._has_return():
-                return f"""class {self.name}(Protocol):\n{TAB}def __call__{args} -> None: ..."""
-            self.imports.add("Any")
-            return f"""class {self.name}(Protocol):\n{TAB}def __call__{args} -> Any: ..."""
-        return f"""class {self.name}(Protocol):\n{TAB}def __call__{args}: ..."""
+        for symbol in self.callable_info.call_imports:
+            self.imports.add(symbol)
+        return f"class {self.name}(Protocol):\n{TAB}{self.callable_info.call_str}"
 
     def get_func_params(self) -> MappingProxyType[str, Parameter]:
-        signature = inspect.signature(self.data)
-        return signature.parameters
+        assert self.callable_info.signature is not None
+        return self.callable_info.signature.parameters
 
     def _get_lambda_str(self) -> str:
         self.imports.add("Callable").add("Any").add("TypeAlias")
@@ -72,13 +121,83 @@ class FunctionDataTypeTree(SimpleDataTypeTree):
             return str(f"Callable[[{', '.join(['Any']*len(self.get_func_params().values()))}], Any]")
         else:
             if self.can_be_inspected:
-                return str(inspect.signature(self.data))
+                return str(self.callable_info.signature)
             return "Callable"
 
+    @override
+    def _get_fingerprint(self) -> Hashable:
+        hash_ = self._get_hash()
+        if self.is_lambda or not self.can_be_inspected or "->" in str(hash_):
+            return hash_
+        return (hash_, self.callable_info.has_return)
+
     def _has_return(self) -> Optional[bool]:
-        code = textwrap.dedent(inspect.getsource(self.data))
+        """Whether the callable returns any value other than None. None if it cannot be known.
+
+        The bytecode is inspected whenever available, so that source files are not read.
+        """
+        code = self._get_code(self._unwrap(self.data))
+        if code is not None:
+            return self._code_has_return(code)
         try:
-            tree = ast.parse(code)
+            source = textwrap.dedent(inspect.getsource(self.data))
+            tree = ast.parse(source)
         except:  # noqa: E722
             return None
         return any(isinstance(node, ast.Return) for node in ast.walk(tree))
+
+    @staticmethod
+    def _code_has_return(code: CodeType) -> bool:
+        """Whether any return statement found in the bytecode might return a value other than None."""
+        previous: Optional[dis.Instruction] = None
+        for instruction in dis.get_instructions(code):
+            if instruction.opname == "RETURN_CONST" and instruction.argval is not None:
+                return True
+            if instruction.opname == "RETURN_VALUE":
+                returns_none = previous is not None and previous.opname == "LOAD_CONST" and previous.argval is None
+                if instruction.is_jump_target or not returns_none:
+                    return True
+            previous = instruction
+        return False
+
+    @staticmethod
+    def _get_code(func: object) -> Optional[CodeType]:
+        code = getattr(getattr(func, "__func__", func), "__code__", None)
+        return code if isinstance(code, CodeType) else None
+
+    @staticmethod
+    def _unwrap(func: object) -> object:
+        """Function wrapped by the given one (e.g. through `functools.wraps`) that `inspect.signature` describes."""
+        func = getattr(func, "__func__", func)
+        try:
+            return inspect.unwrap(func, stop=lambda wrapper: hasattr(wrapper, "__signature__"))  # type: ignore
+        except ValueError:  # Chain of wrappers with a cycle
+            return func
+
+    @classmethod
+    def _get_callable_key(cls, func: object) -> Optional[Hashable]:
+        """Key that identifies the information of a callable. None if it cannot be identified.
+
+        Functions are identified by their code and everything else the signature depends on, so that the same
+        function defined multiple times (e.g. within a loop) shares the same key. Wrappers are identified by the
+        function they wrap, while callables with an explicit `__signature__` are never identified.
+        """
+        inner = cls._unwrap(func)
+        if hasattr(inner, "__signature__"):
+            return None
+        code = cls._get_code(inner)
+        if code is None:
+            key: Hashable = (type(func), func)
+        else:
+            key = (
+                type(func),
+                code,
+                getattr(inner, "__defaults__", None),
+                tuple(sorted((getattr(inner, "__kwdefaults__", None) or {}).items())),
+                tuple((getattr(inner, "__annotations__", None) or {}).items()),
+            )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
@@ -6,8 +6,11 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree i
 
 
 class InstanceDataTypeTree(SimpleDataTypeTree):
+    __slots__ = ()
+
     # Change it by `NoneType` once I drop support with Python 3.8
     wraps = (bool, int, float, range, slice, str, type(None))  # + Custom classes
+    shared_among_siblings = True
 
     @override
     def _get_str_top_node(self) -> str:
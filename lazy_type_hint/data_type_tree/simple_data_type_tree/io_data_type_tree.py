@@ -6,6 +6,8 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree i
 
 
 class IoDataTypeTree(SimpleDataTypeTree):
+    __slots__ = ()
+
     wraps = (io.IOBase,)
 
     @override
@@ -6,6 +6,8 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree i
 
 
 class ModuleTypeDataTypeTree(SimpleDataTypeTree):
+    __slots__ = ()
+
     wraps = (ModuleType,)
 
     @override
@@ -1,3 +1,5 @@
+from typing import Hashable
+
 import numpy as np
 from numpy.typing import NDArray
 from typing_extensions import override
@@ -6,6 +8,8 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree i
 
 
 class NumpyDataTypeTree(SimpleDataTypeTree):
+    __slots__ = ()
+
     wraps = (np.ndarray,)
     data: NDArray[np.generic]
 
@@ -13,3 +17,7 @@ class NumpyDataTypeTree(SimpleDataTypeTree):
     def _get_str_top_node(self) -> str:
         self.imports.add("NDArray").add("numpy").add("TypeAlias")
         return f'{self.name}: TypeAlias = "NDArray[np.{self.data.dtype}]"'
+
+    @override
+    def _get_fingerprint(self) -> Hashable:
+        return str(self.data.dtype)
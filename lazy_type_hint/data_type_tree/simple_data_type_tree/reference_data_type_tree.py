@@ -0,0 +1,48 @@
+from typing import Hashable
+
+from typing_extensions import override
+
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree import SimpleDataTypeTree
+
+
+class ReferenceDataTypeTree(SimpleDataTypeTree):
+    """Tree that represents data already being parsed by one of its ancestors (a cycle within the data).
+
+    It is never selected by the type of the data. Instead, it is created while building the tree whenever a cycle is
+    found, so that the ancestor is defined as a recursive type alias and referenced from here by its name.
+    """
+
+    __slots__ = ("target", "distance")
+
+    wraps = ()
+
+    target: DataTypeTree
+    """Ancestor that parses the same data."""
+    distance: int
+    """Number of levels between the current node and `target`."""
+
+    @override
+    def __pre_child_instantiation__(self) -> None:
+        self.target.is_recursive = True
+        self.distance = 1
+        ancestor = self.parent
+        while ancestor is not None and ancestor is not self.target:
+            ancestor = ancestor.parent
+            self.distance += 1
+
+    @override
+    def _check_tree_is_correct_one(self, data: object) -> None:
+        return
+
+    @override
+    def _get_str_top_node(self) -> str:
+        return f'{self.name} = "{self.target.name}"'
+
+    @override
+    def _get_hash(self) -> Hashable:
+        return ("recursive", self.distance)
+
+    @override
+    def _get_fingerprint(self) -> Hashable:
+        return self.distance
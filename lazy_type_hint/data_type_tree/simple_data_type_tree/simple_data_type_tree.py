@@ -8,6 +8,8 @@ from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 class SimpleDataTypeTree(DataTypeTree):
     """Tree that holds any kind of object that cannot contain inner structures (children)."""
 
+    __slots__ = ()
+
     children: None
 
     @final
@@ -1,5 +1,5 @@
 import builtins
-from typing import Type
+from typing import Hashable, Type
 
 from typing_extensions import override
 
@@ -7,6 +7,8 @@ from lazy_type_hint.data_type_tree.simple_data_type_tree.simple_data_type_tree i
 
 
 class TypeDataTypeTree(SimpleDataTypeTree):
+    __slots__ = ()
+
     wraps = (type,)
     data: Type[object]
 
@@ -23,3 +25,7 @@ class TypeDataTypeTree(SimpleDataTypeTree):
             return isinstance(cls, type)
         except AttributeError:
             return False
+
+    @override
+    def _get_fingerprint(self) -> Hashable:
+        return (self.data.__module__, self.data.__qualname__)
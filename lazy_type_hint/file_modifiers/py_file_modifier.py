@@ -1,21 +1,58 @@
 import ast
+import re
+from bisect import bisect_left, insort
 from collections.abc import Sequence
-from typing import Any, List, Literal, Tuple, Union, overload
+from typing import Any, Dict, Final, List, Literal, Optional, Tuple, Union, overload
 
 from lazy_type_hint.utils import TAB
 
 
 class PyFileModifier:
-    lines: List[str]
+    """Modify the source code of a Python file line by line.
+
+    Methods and assignments are indexed, so that looking them up does not require scanning the whole file. Each line
+    is identified by a key that does not change when other lines are added or removed, so that the index is updated
+    incrementally and the position of any line is found by bisecting the keys.
+    """
+
+    _lines: List[str]
+    _keys: List[int]
+    """Key of each line, sorted in the same order as the lines."""
+    _methods: Dict[str, List[int]]
+    """Keys of the lines that define a method, by the content of the line after `def `."""
+    _method_signatures: List[str]
+    """Sorted content of the lines that define a method after `def `, so that they can be searched by prefix."""
+    _assignments: Dict[str, List[int]]
+    """Keys of the lines that assign a value to a variable, by the name of the variable."""
+
+    _gap: Final = 1 << 128
+    """Initial distance between the keys of two consecutive lines."""
+    _assignment_pattern: Final = re.compile(r"\s*([\w.]+)\s*(?::[^=]*)?=(?!=)")
+    """Pattern that matches the lines that assign a value to a variable."""
 
     def __init__(self, representation: str) -> None:
         self.lines = representation.splitlines()
 
+    @property
+    def lines(self) -> Sequence[str]:
+        """Lines of the file. Use the methods of this class to modify them."""
+        return tuple(self._lines)
+
+    @lines.setter
+    def lines(self, lines: Sequence[str]) -> None:
+        self._lines = list(lines)
+        self._keys = [idx * self._gap for idx in range(len(self._lines))]
+        self._methods = {}
+        self._method_signatures = []
+        self._assignments = {}
+        for key, line in zip(self._keys, self._lines):
+            self._index_line(key, line)
+
     def __str__(self) -> str:
-        return "\n".join(self.lines)
+        return "\n".join(self._lines)
 
     def __repr__(self) -> str:
-        return "\n".join(self.lines)
+        return "\n".join(self._lines)
 
     @overload
     def search_assignment(self, variable: str, only_values: Literal[False] = False) -> List[Tuple[int, str]]:
@@ -38,15 +75,14 @@ class PyFileModifier:
                 assigned value.
         """
         lst: List[Any] = []
-        for idx, line in enumerate(self.lines):
-            if variable in line and "=" in line and not self.it_is_string(line, variable):
-                value = line.split("=")[-1].strip()
-                if isinstance(value, str) and value[0] in ("'", '"'):
-                    value = value[1:-1]
-                if only_values:
-                    lst.append(value)
-                else:
-                    lst.append((idx, value))
+        for idx in self._get_indices(self._assignments.get(variable, [])):
+            value = self._lines[idx].split("=")[-1].strip()
+            if isinstance(value, str) and value[0] in ("'", '"'):
+                value = value[1:-1]
+            if only_values:
+                lst.append(value)
+            else:
+                lst.append((idx, value))
         return lst
 
     def search_decorator(self, *, decorator_name: str, method_name: str) -> List[int]:
@@ -63,8 +99,8 @@ class PyFileModifier:
         lst = self.search_method(method_name=method_name, return_index_above_decorator=False)
         output: List[int] = []
         for idx in lst:
-            while "@" in self.lines[idx - 1]:
-                if f"@{decorator_name}" in self.lines[idx - 1]:
+            while "@" in self._lines[idx - 1]:
+                if f"@{decorator_name}" in self._lines[idx - 1]:
                     output.append(idx - 1)
                     break
                 break
@@ -82,13 +118,17 @@ class PyFileModifier:
         Returns:
             List[int]: A list of indices where the method is found.
         """
+        keys: List[int] = []
+        for signature in self._method_signatures[bisect_left(self._method_signatures, method_name) :]:
+            if not signature.startswith(method_name):
+                break
+            keys.extend(self._methods[signature])
         lst: List[int] = []
-        for idx, line in enumerate(self.lines):
-            if line.strip().startswith(f"def {method_name}") and not self.it_is_string(line, method_name):
-                if return_index_above_decorator:
-                    while "@" in self.lines[idx - 1]:
-                        idx = idx - 1
-                lst.append(idx)
+        for idx in sorted(self._get_indices(keys)):
+            if return_index_above_decorator:
+                while "@" in self._lines[idx - 1]:
+                    idx = idx - 1
+            lst.append(idx)
         return lst
 
     def it_is_string(self, line: str, keyword_of_interest: str) -> bool:
@@ -108,7 +148,7 @@ class PyFileModifier:
         """
         if not isinstance(line, str):
             line = "\n".join(line)
-        self.lines.insert(idx, line)
+        self._insert(idx, line)
 
     def search_line(self, keyword: str) -> int:
         """
@@ -120,7 +160,7 @@ class PyFileModifier:
         Returns:
             int: The index of the line containing the keyword.
         """
-        for idx, line in enumerate(self.lines):
+        for idx, line in enumerate(self._lines):
             if keyword in line:
                 return idx
         raise ValueError(f"Line with `{keyword}` could not be found within the file.")
@@ -133,7 +173,10 @@ class PyFileModifier:
             idx (int): The index of the line to be replaced.
             line (str): The new line to replace the existing line.
         """
-        self.lines[idx] = line
+        key = self._keys[idx]
+        self._unindex_line(key, self._lines[idx])
+        self._lines[idx] = line
+        self._index_line(key, line)
 
     def replace_assignement(self, label: Union[int, str], value: str) -> None:
         """
@@ -156,12 +199,12 @@ class PyFileModifier:
         else:
             idx = label
 
-        line = self.lines[idx]
+        line = self._lines[idx]
         if "=" not in line:
             raise ValueError(f"The given line ({idx}) is not an assignment one.")
         symbols = line.split("=")
         symbols[-1] = value
-        self.lines[idx] = "=".join(symbols)
+        self.replace_line(idx, "=".join(symbols))
 
     def remove_all_method_bodies(self) -> None:
         """
@@ -181,7 +224,7 @@ class PyFileModifier:
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef):
                 node.body = [ast.Ellipsis()]  # type: ignore
-        self.lines = ast.unparse(tree).strip().splitlines()  # type: ignore
+        self.lines = ast.unparse(tree).strip().splitlines()  # type: ignore[attr-defined, unused-ignore]
 
     def remove_all_private_methods(self) -> None:
         """
@@ -193,14 +236,15 @@ class PyFileModifier:
 
         Note: This method modifies the object in-place.
         """
+        lines = self._lines
         lines_to_remove: List[int] = []
-        for idx, line in enumerate(self.lines):
+        for idx, line in enumerate(lines):
             line_ = line.strip()
             if line_.startswith("def _") and not line_.startswith("def __"):
                 idx_ = idx - 1
                 # Remove all decorators
-                if "@" in self.lines[idx_]:
-                    while "@" in self.lines[idx_]:
+                if "@" in lines[idx_]:
+                    while "@" in lines[idx_]:
                         lines_to_remove.append(idx_)
                         idx_ -= 1
 
@@ -209,7 +253,7 @@ class PyFileModifier:
 
                 idx_ = idx
                 # Remove all arguments if they are in multiple lines
-                while "):" not in self.lines[idx_] and "->" not in self.lines[idx_]:
+                while "):" not in lines[idx_] and "->" not in lines[idx_]:
                     idx_ += 1
                     lines_to_remove.append(idx_)
 
@@ -223,14 +267,14 @@ class PyFileModifier:
                         break
 
                 idx_ += 1
-                while len(self.lines) > idx_ and len(self.lines[idx_]) > spaces and self.lines[idx_][spaces].isspace():
+                while len(lines) > idx_ and len(lines[idx_]) > spaces and lines[idx_][spaces].isspace():
                     lines_to_remove.append(idx_)
                     idx_ += 1
-                if len(self.lines) > idx_:
+                if len(lines) > idx_:
                     lines_to_remove.append(idx_)
 
-        for idx in sorted(lines_to_remove)[::-1]:
-            self.lines.pop(idx)
+        removed = set(lines_to_remove)
+        self.lines = [line for idx, line in enumerate(lines) if idx not in removed]
 
     def remove_all_instance_variables(self, class_name: str) -> None:
         """
@@ -242,10 +286,29 @@ class PyFileModifier:
         upper_idx = self.search_line(f"class {class_name}(") + 1
 
         lower_idx = self.search_method("__init__", return_index_above_decorator=True)[-1]
-        for idx in list(range(upper_idx, lower_idx))[::-1]:
-            if "classes_created" in self.lines[idx] or "classes_created" in self.lines[idx - 1]:
-                continue
-            self.lines.pop(idx)
+        lines = self._lines
+        kept_lines = [
+            line
+            for idx, line in enumerate(lines[upper_idx:lower_idx], upper_idx)
+            if "classes_created" in line or "classes_created" in lines[idx - 1]
+        ]
+        self.lines = lines[:upper_idx] + kept_lines + lines[lower_idx:]
+
+    def keep_only_interface(self, class_name: str) -> None:
+        """
+        Keep only the public interface of the file, as expected within a .pyi file.
+
+        It is equivalent to calling `remove_all_method_bodies`, `remove_all_private_methods` and
+        `remove_all_instance_variables`, but the file is parsed only once and each statement is visited only once.
+
+        Args:
+            class_name (str): The name of the class whose instance variables are removed.
+
+        Note: This method modifies the object in-place.
+        """
+        tree = ast.parse(str(self))
+        tree.body = self._get_interface(tree.body, class_name=class_name)
+        self.lines = ast.unparse(tree).strip().splitlines()  # type: ignore[attr-defined, unused-ignore]
 
     def add_imports(self, lines: Union[str, Sequence[str]], *, in_type_checking_block: bool = False) -> None:
         """
@@ -266,7 +329,7 @@ class PyFileModifier:
             idx = self.search_line("if TYPE_CHECKING:") + 1
             lines = [f"{TAB}{line}" for line in lines]
         for line in lines[::-1]:
-            self.lines.insert(idx, line)
+            self._insert(idx, line)
 
     def get_signature(self, method_name: str) -> Tuple[str, slice]:
         """
@@ -283,7 +346,88 @@ class PyFileModifier:
         upper_idx = self.search_method(method_name, return_index_above_decorator=True)[-1]
         bottom_idx = upper_idx
 
-        while ")" not in self.lines[bottom_idx] and ":" not in self.lines[bottom_idx]:
+        while ")" not in self._lines[bottom_idx] and ":" not in self._lines[bottom_idx]:
             bottom_idx += 1
 
-        return "\n".join(self.lines[upper_idx : bottom_idx + 1]), slice(upper_idx, bottom_idx + 1)
+        return "\n".join(self._lines[upper_idx : bottom_idx + 1]), slice(upper_idx, bottom_idx + 1)
+
+    def _get_interface(self, statements: List[ast.stmt], *, class_name: str) -> List[ast.stmt]:
+        interface: List[ast.stmt] = []
+        for statement in statements:
+            if isinstance(statement, ast.FunctionDef):
+                if statement.name.startswith("_") and not statement.name.startswith("__"):
+                    continue
+                statement.body = [ast.Ellipsis()]  # type: ignore
+            elif isinstance(statement, ast.ClassDef) and statement.name == class_name:
+                statement.body = self._get_interface(self._remove_instance_variables(statement.body), class_name="")
+            else:
+                for field in ("body", "orelse", "finalbody"):
+                    if getattr(statement, field, None):
+                        setattr(statement, field, self._get_interface(getattr(statement, field), class_name=class_name))
+            interface.append(statement)
+        if statements and not interface:  # Bodies cannot be empty
+            interface.append(ast.Expr(ast.Constant(Ellipsis)))
+        return interface
+
+    @staticmethod
+    def _remove_instance_variables(statements: List[ast.stmt]) -> List[ast.stmt]:
+        """Remove the statements found before `__init__`, except the ones that define `classes_created`."""
+        kept: List[ast.stmt] = []
+        for idx, statement in enumerate(statements):
+            if isinstance(statement, ast.FunctionDef) and statement.name == "__init__":
+                return kept + statements[idx:]
+            target = statement.target if isinstance(statement, ast.AnnAssign) else None
+            is_classes_created = isinstance(target, ast.Name) and target.id == "classes_created"
+            is_its_docstring = isinstance(statement, ast.Expr) and bool(kept) and kept[-1] is statements[idx - 1]
+            if is_classes_created or is_its_docstring:
+                kept.append(statement)
+        return statements
+
+    def _insert(self, idx: int, line: str) -> None:
+        """Insert the line at the given index with a key placed between the keys of its neighbours."""
+        idx = min(idx, len(self._lines)) if idx >= 0 else max(len(self._lines) + idx, 0)  # Same as `list.insert`
+        lower = self._keys[idx - 1] if idx else -self._gap
+        upper = self._keys[idx] if idx < len(self._keys) else lower + 2 * self._gap
+        if upper - lower < 2:  # No room left between both keys: spread all keys again
+            self.lines = self._lines[:idx] + [line] + self._lines[idx:]
+            return
+        key = (lower + upper) // 2
+        self._lines.insert(idx, line)
+        self._keys.insert(idx, key)
+        self._index_line(key, line)
+
+    def _get_indices(self, keys: Sequence[int]) -> List[int]:
+        return [bisect_left(self._keys, key) for key in keys]
+
+    def _index_line(self, key: int, line: str) -> None:
+        signature = self._get_method_signature(line)
+        if signature is not None:
+            if signature not in self._methods:
+                self._methods[signature] = []
+                insort(self._method_signatures, signature)
+            insort(self._methods[signature], key)
+        variable = self._get_assigned_variable(line)
+        if variable is not None:
+            insort(self._assignments.setdefault(variable, []), key)
+
+    def _unindex_line(self, key: int, line: str) -> None:
+        signature = self._get_method_signature(line)
+        if signature is not None:
+            keys = self._methods[signature]
+            keys.pop(bisect_left(keys, key))
+            if not keys:
+                del self._methods[signature]
+                self._method_signatures.pop(bisect_left(self._method_signatures, signature))
+        variable = self._get_assigned_variable(line)
+        if variable is not None:
+            keys = self._assignments[variable]
+            keys.pop(bisect_left(keys, key))
+
+    @staticmethod
+    def _get_method_signature(line: str) -> Optional[str]:
+        line = line.strip()
+        return line[len("def ") :] if line.startswith("def ") else None
+
+    def _get_assigned_variable(self, line: str) -> Optional[str]:
+        match = self._assignment_pattern.match(line)
+        return match.group(1) if match else None
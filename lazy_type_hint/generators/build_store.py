@@ -0,0 +1,149 @@
+"""Content-addressed store of the statements of the classes that `LazyTypeHintLive` builds within shared modules."""
+
+import ast
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Sequence, Tuple
+
+from lazy_type_hint.generators.class_registry import hash_content
+
+
+class BuildStoreError(Exception):
+    """Raised by `BuildStore` class."""
+
+
+def split_module(content: str) -> List[str]:
+    """
+    Split the source code of a module into its top-level statements.
+
+    Docstrings placed right below an assignment are kept together with it, and so are the decorators of a class.
+
+    Args:
+        content (str): Source code of the module.
+
+    Returns:
+        List[str]: The source code of each statement, in the same order as they are found within the module.
+    """
+    try:
+        nodes = ast.parse(content).body
+    except SyntaxError as error:
+        raise BuildStoreError(f"The given module could not be parsed: {error}") from error
+
+    starts: List[int] = []
+    for idx, node in enumerate(nodes):
+        is_docstring = isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+        if is_docstring and idx and not isinstance(nodes[idx - 1], (ast.Import, ast.ImportFrom)):
+            continue
+        decorators = getattr(node, "decorator_list", [])
+        starts.append(min([node.lineno] + [decorator.lineno for decorator in decorators]) - 1)
+
+    lines = content.splitlines()
+    return ["\n".join(lines[start:end]).rstrip() for start, end in zip(starts, starts[1:] + [len(lines)])]
+
+
+class BuildStore:
+    """Statements of the classes built within shared modules, identified by the hash of their source code.
+
+    Each class is represented by the hashes of its statements, so that statements shared by multiple classes (such
+    as imports or identical aliases) are only written once within the module they share.
+    """
+
+    _statements: Dict[str, str]
+    """Source code of each statement."""
+    _imports: Dict[str, Tuple[str, Tuple[str, ...]]]
+    """Module and names imported by each import statement. `import x` statements are kept as they are, without names."""
+    _names: Dict[str, FrozenSet[str]]
+    """Names defined by each statement."""
+
+    def __init__(self) -> None:
+        self._statements = {}
+        self._imports = {}
+        self._names = {}
+
+    def __contains__(self, statement_hash: object) -> bool:
+        return statement_hash in self._statements
+
+    def add(self, content: str) -> Tuple[str, ...]:
+        """
+        Store the statements of the source code of a class.
+
+        Args:
+            content (str): Source code of the module that defines the class.
+
+        Returns:
+            Tuple[str, ...]: Hashes that identify each of the statements.
+        """
+        statement_hashes: List[str] = []
+        for statement in split_module(content):
+            statement_hash = hash_content(statement)[:16]
+            if statement_hash not in self._statements:
+                node = ast.parse(statement).body[0]
+                self._statements[statement_hash] = statement
+                self._names[statement_hash] = self._get_names(node)
+                if isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                    self._imports[statement_hash] = (node.module, tuple(self._get_import_names(node)))
+                elif isinstance(node, ast.Import):
+                    self._imports[statement_hash] = (statement, ())
+            statement_hashes.append(statement_hash)
+        return tuple(statement_hashes)
+
+    def find_conflicts(self, statement_hashes: Sequence[str], others: Iterable[Sequence[str]]) -> FrozenSet[str]:
+        """
+        Find the names that would be defined differently if the given classes were built within the same module.
+
+        Args:
+            statement_hashes (Sequence[str]): Hashes of the statements of the class to be built.
+            others (Iterable[Sequence[str]]): Hashes of the statements of each class already built within the module.
+
+        Returns:
+            FrozenSet[str]: Names defined by different statements.
+        """
+        statement_by_name = {
+            name: statement_hash for statement_hash in statement_hashes for name in self._names[statement_hash]
+        }
+        return frozenset(
+            name
+            for other in others
+            for statement_hash in other
+            for name in self._names[statement_hash]
+            if statement_by_name.get(name, statement_hash) != statement_hash
+        )
+
+    def render(self, classes: Iterable[Sequence[str]]) -> str:
+        """
+        Build the source code of a module that defines all given classes.
+
+        Args:
+            classes (Iterable[Sequence[str]]): Hashes of the statements of each class.
+
+        Returns:
+            str: Source code of the module, where each statement is only written once and the names imported from
+                the same module are gathered within a single import.
+        """
+        statement_hashes = list(dict.fromkeys(statement_hash for hashes in classes for statement_hash in hashes))
+        names_by_module: Dict[str, Dict[str, None]] = {}
+        for statement_hash in statement_hashes:
+            if statement_hash in self._imports:
+                module, names = self._imports[statement_hash]
+                names_by_module.setdefault(module, {}).update(dict.fromkeys(names))
+        imports = [
+            f"from {module} import {', '.join(names)}" if names else module
+            for module, names in sorted(names_by_module.items(), key=lambda item: item[0] != "__future__")
+        ]
+        statements = [self._statements[hash_] for hash_ in statement_hashes if hash_ not in self._imports]
+        if not statements:
+            return "\n".join(imports) + "\n" if imports else ""
+        return "\n\n\n".join(["\n".join(imports), *statements] if imports else statements) + "\n"
+
+    @staticmethod
+    def _get_import_names(node: ast.ImportFrom) -> Iterator[str]:
+        for alias in node.names:
+            yield alias.name if alias.asname is None else f"{alias.name} as {alias.asname}"
+
+    @staticmethod
+    def _get_names(node: ast.stmt) -> FrozenSet[str]:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            return frozenset([node.name])
+        if isinstance(node, ast.Assign):
+            return frozenset(target.id for target in node.targets if isinstance(target, ast.Name))
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            return frozenset([node.target.id])
+        return frozenset()
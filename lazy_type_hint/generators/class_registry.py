@@ -0,0 +1,223 @@
+"""In-memory registry of the classes created by `LazyTypeHintLive`."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Final, Iterable, Iterator, Mapping, Optional, Set, Tuple
+
+from lazy_type_hint.utils.utils import FileStat
+
+
+class ClassRegistryError(Exception):
+    """Raised by `ClassRegistry` class."""
+
+
+def hash_content(content: str) -> str:
+    """Hash that identifies the content of a generated file."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ClassRecord:
+    """Information kept for each class created."""
+
+    path: Path
+    """Path to the module where the class was built."""
+    _content_hash: Optional[str] = None
+    """Hash of the content of the module at `path`. It is computed whenever the class is registered, restored from
+    the manifest otherwise and, if the manifest does not have it, read from disk once through `content_hash`."""
+    fingerprint: Optional[str] = None
+    """Fingerprint of the tree the class was built from. None if unknown."""
+    structure_fingerprint: Optional[str] = None
+    """Fingerprint of the tree the class was built from, ignoring its docstrings. None if unknown."""
+    strategies: Optional[str] = None
+    """Representation of the strategies used to build the class. None if unknown."""
+    statements: Optional[Tuple[str, ...]] = None
+    """Hashes of the statements that define the class within a shared module. None if it has its own module."""
+    module_stat: Optional[FileStat] = None
+    """Status of the module when it was last written or found to hold the class. None if unknown."""
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of the content of the built module. Only read from disk the first time it is requested."""
+        if self._content_hash is None:
+            self._content_hash = hash_content(self.path.read_text(encoding="utf-8"))
+        return self._content_hash
+
+
+class ClassRegistry(Mapping[str, ClassRecord]):
+    """Map each class created with the module where it was built.
+
+    It is meant to be loaded once and then kept in sync every time a class is built, so that no file has to be
+    scanned or checked when querying the classes created. The information of each class is persisted in a manifest
+    within the build directory.
+    """
+
+    build_dir: Path
+    """Directory where the classes are built."""
+    manifest_path: Path
+    """Path to the manifest that persists the information of each class."""
+
+    manifest_name: Final = "manifest.json"
+    """Name of the manifest file created within the build directory."""
+    _manifest_version: Final = 1
+    """Version of the manifest format. Manifests with a different version are ignored."""
+
+    _records: Dict[str, ClassRecord]
+    """Information of each class created."""
+    _classes_by_path: Dict[Path, Set[str]]
+    """Classes built within each module."""
+
+    def __init__(self, build_dir: Path, class_names: Iterable[str] = ()) -> None:
+        """
+        Initialize the registry with the classes that were already created.
+
+        Args:
+            build_dir (Path): Directory where the classes are built.
+            class_names (Iterable[str], optional): Names of the classes already created. Their source code is
+                expected to be found within `build_dir`. Defaults to ().
+        """
+        self.build_dir = build_dir
+        self.manifest_path = build_dir / self.manifest_name
+        self._records = {}
+        manifest = self._read_manifest()
+        for class_name in class_names:
+            entry = manifest.get(class_name, {})
+            module = entry.get("module")
+            path = build_dir / f"{module}.py" if module else self.get_path(class_name)
+            if not path.exists():
+                raise ClassRegistryError(
+                    f"A class `{class_name}` was apparently created but cannot find its "
+                    f"corresponding source code within {build_dir}"
+                )
+            statements = entry.get("statements")
+            module_stat = entry.get("module_stat")
+            self._records[class_name] = ClassRecord(
+                path,
+                _content_hash=entry.get("content_hash"),
+                fingerprint=entry.get("fingerprint"),
+                structure_fingerprint=entry.get("structure_fingerprint"),
+                strategies=entry.get("strategies"),
+                statements=tuple(statements) if statements is not None else None,
+                module_stat=tuple(module_stat) if module_stat is not None else None,
+            )
+        self._index()
+
+    def refresh(self, class_names: Iterable[str], *, keep: Iterable[str] = ()) -> None:
+        """
+        Load again the classes created, as they might have been modified by another process.
+
+        Args:
+            class_names (Iterable[str]): Names of the classes created.
+            keep (Iterable[str], optional): Names of the classes whose current records take precedence over the
+                ones found in the manifest. Defaults to ().
+        """
+        records = ClassRegistry(self.build_dir, class_names)._records
+        for class_name in keep:
+            records[class_name] = self._records[class_name]
+        self._records = records
+        self._index()
+
+    def get_path(self, class_name: str) -> Path:
+        """Path to the module where the given class is (or would be) built."""
+        return self.build_dir / f"{class_name}.py"
+
+    def get_shared_path(self, class_name: str, n_modules: int) -> Path:
+        """
+        Path to the shared module where the given class is built if classes are spread among `n_modules` modules.
+
+        The module only depends on the name of the class, so that it is the same across interpreters.
+        """
+        return self.build_dir / f"_shard_{int(hash_content(class_name)[:8], 16) % n_modules}.py"
+
+    def get_classes_in(self, path: Path) -> Set[str]:
+        """Names of the classes built within the given module."""
+        return set(self._classes_by_path.get(path, ()))
+
+    def add(
+        self,
+        class_name: str,
+        *,
+        content: str,
+        fingerprint: Optional[str] = None,
+        structure_fingerprint: Optional[str] = None,
+        strategies: Optional[str] = None,
+        path: Optional[Path] = None,
+        statements: Optional[Tuple[str, ...]] = None,
+    ) -> ClassRecord:
+        """Register a class, or update it if it already exists, given the content it was built from.
+
+        Classes are built within their own module unless `path` and `statements` are given.
+        """
+        record = ClassRecord(
+            path if path is not None else self.get_path(class_name),
+            _content_hash=hash_content(content),
+            fingerprint=fingerprint,
+            structure_fingerprint=structure_fingerprint,
+            strategies=strategies,
+            statements=statements,
+        )
+        if class_name in self._records:
+            self._classes_by_path[self._records[class_name].path].discard(class_name)
+        self._records[class_name] = record
+        self._classes_by_path.setdefault(record.path, set()).add(class_name)
+        return record
+
+    def to_manifest(self) -> str:
+        """Content of the manifest that persists the information of all classes."""
+        classes = {
+            class_name: {
+                "content_hash": record.content_hash,
+                "fingerprint": record.fingerprint,
+                "structure_fingerprint": record.structure_fingerprint,
+                "strategies": record.strategies,
+                "module": record.path.stem,
+                "statements": list(record.statements) if record.statements is not None else None,
+                "module_stat": list(record.module_stat) if record.module_stat is not None else None,
+            }
+            for class_name, record in self._records.items()
+        }
+        return json.dumps({"version": self._manifest_version, "classes": classes}, indent=4, sort_keys=True)
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._classes_by_path.clear()
+
+    def snapshot(self) -> Mapping[str, ClassRecord]:
+        """Copy of the current records that can be given to `restore` to undo any later modification."""
+        return dict(self._records)
+
+    def restore(self, snapshot: Mapping[str, ClassRecord]) -> None:
+        self._records = dict(snapshot)
+        self._index()
+
+    def __getitem__(self, class_name: str) -> ClassRecord:
+        return self._records[class_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, class_name: object) -> bool:
+        return class_name in self._records
+
+    def _index(self) -> None:
+        self._classes_by_path = {}
+        for class_name, record in self._records.items():
+            self._classes_by_path.setdefault(record.path, set()).add(class_name)
+
+    def _read_manifest(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read the information of each class from the manifest. Missing or invalid manifests are ignored."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != self._manifest_version:
+            return {}
+        classes = manifest.get("classes")
+        return classes if isinstance(classes, dict) else {}
@@ -1,9 +1,13 @@
+import hashlib
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType, SimpleNamespace
 from typing import (
     Any,
     Callable,
+    Iterator,
+    Mapping,
     Optional,
     Sequence,
     TypeVar,
@@ -14,6 +18,7 @@ from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.file_modifiers.yaml_file_modifier import YAML_COMMENTS_POSITION
 from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintABC
 from lazy_type_hint.strategies import ParsingStrategies
+from lazy_type_hint.utils import InferenceCache, Instrumentation, atomic_write
 
 
 class LazyTypeHintError(Exception):
@@ -25,12 +30,59 @@ PathT = TypeVar("PathT", str, Path)
 
 @dataclass(frozen=True)
 class Tree:
-    _tree: DataTypeTree
+    _tree: Optional[DataTypeTree]
+    """Tree the type hints were built from. None if they were restored from the inference cache."""
+    _strings: Optional[Mapping[str, str]] = None
+    """String representations restored from the inference cache, by whether they include imports or not."""
+    instrumentation: Optional[Instrumentation] = None
+    """Statistics gathered while building and rendering the tree. None unless requested."""
+
+    @property
+    def data(self) -> object:
+        """
+        Data the type hints were built from.
+
+        Iterators are partially consumed to build their type hints. For these, an iterator that yields the consumed
+        elements followed by the remaining ones is returned instead, so that no element is lost.
+
+        Raises:
+            LazyTypeHintError: If the type hints were restored from the inference cache, as no data was parsed.
+        """
+        if self._tree is None:
+            raise LazyTypeHintError("The data is not kept by type hints restored from the inference cache")
+        return self._tree.data
 
     def to_string(self, *, include_imports: bool = True) -> str:
-        return self._tree.get_str_all_nodes(include_imports=include_imports)
+        if self._strings is not None:
+            return self._strings["with_imports" if include_imports else "without_imports"]
+        assert self._tree is not None
+        if self.instrumentation is None:
+            return self._tree.get_str_all_nodes(include_imports=include_imports)
+        with self.instrumentation.activate():
+            return self._tree.get_str_all_nodes(include_imports=include_imports)
+
+    def iter_string(self, *, include_imports: bool = True) -> Iterator[str]:
+        """Iterate over the pieces of `to_string`, in order, so that it can be written without building it whole."""
+        if self._strings is not None:
+            return iter((self._strings["with_imports" if include_imports else "without_imports"],))
+        assert self._tree is not None
+        if self.instrumentation is None:
+            return self._tree.iter_str_all_nodes(include_imports=include_imports)
+        with self.instrumentation.activate():  # All nodes are rendered before returning
+            return self._tree.iter_str_all_nodes(include_imports=include_imports)
 
     def to_file(self, path_to_py: Union[Path, str], *, create_non_existing_dir: bool = False) -> None:
+        """
+        Write the type hints to the given file.
+
+        They are streamed to a temporary file that atomically replaces the given one once fully written, so that no
+        partially written file is ever left behind.
+
+        Args:
+            path_to_py (Union[Path, str]): Path of the file.
+            create_non_existing_dir (bool, optional): Whether its directory is created if it does not exist. Defaults
+                to False.
+        """
         path_to_py = Path(path_to_py)
         if not path_to_py.parent.exists():
             if not create_non_existing_dir:
@@ -39,19 +91,33 @@ class Tree:
                     "(create_non_existing_dir input argument) were not set"
                 )
             os.makedirs(path_to_py.parent)
-        path_to_py.write_text(self.to_string(include_imports=True))
+        with atomic_write(path_to_py) as file:
+            file.writelines(self.iter_string(include_imports=True))
 
 
 class LazyTypeHint(LazyTypeHintABC):
     strategies: ParsingStrategies
     """Strategies to follow when parsing the objects."""
+    cache: Optional[InferenceCache]
+    """Persistent cache of the type hints inferred. If None, they are always inferred."""
+    instrumentation: bool
+    """Whether each `Tree` returned carries the statistics gathered while building and rendering it."""
+
+    _skip_cache: bool
+    """Whether the data must not be looked up in the cache, as it is being parsed for an entry already looked up."""
 
     def __init__(
         self,
         strategies: ParsingStrategies = ParsingStrategies(),  # noqa: B008
+        *,
+        cache: Optional[InferenceCache] = None,
+        instrumentation: bool = False,
         **kwargs: Any,
     ) -> None:
         self.strategies = strategies
+        self.cache = cache
+        self.instrumentation = instrumentation
+        self._skip_cache = False
 
     def from_yaml_file(
         self,
@@ -62,7 +128,37 @@ class LazyTypeHint(LazyTypeHintABC):
         comments_are: Optional[Union[YAML_COMMENTS_POSITION, Sequence[YAML_COMMENTS_POSITION]]] = "side",
         **kwargs: Any,
     ) -> Tree:
-        return super().from_yaml_file(loader=loader, path=path, class_name=class_name, comments_are=comments_are)  # type: ignore
+        key = self._get_file_cache_key(
+            path,
+            f"{getattr(loader, '__module__', '')}.{getattr(loader, '__qualname__', repr(loader))}",
+            comments_are if isinstance(comments_are, (str, type(None))) else tuple(comments_are),
+            class_name,
+        )
+        return self._from_cache(
+            key,
+            lambda: super(LazyTypeHint, self).from_yaml_file(
+                loader=loader, path=path, class_name=class_name, comments_are=comments_are
+            ),
+        )
+
+    def from_jsonl_file(
+        self,
+        path: Union[str, Path],
+        *,
+        class_name: str,
+        sample_size: Optional[int] = 1000,
+        seed: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Tree:
+        key = None
+        if seed is not None or sample_size is None:  # Otherwise, a different sample is expected every time
+            key = self._get_file_cache_key(path, sample_size, seed, class_name)
+        return self._from_cache(
+            key,
+            lambda: super(LazyTypeHint, self).from_jsonl_file(
+                path, class_name=class_name, sample_size=sample_size, seed=seed, **kwargs
+            ),
+        )
 
     def from_data(
         self,
@@ -71,4 +167,99 @@ class LazyTypeHint(LazyTypeHintABC):
         class_name: str,
         **kwargs: Any,
     ) -> Tree:
-        return Tree(super().from_data(data=data, class_name=class_name))
+        key = None
+        if self.cache is not None and not self._skip_cache:
+            data_hash = self._hash_data(data)
+            if data_hash is not None:
+                key = self.cache.get_key(repr(self.strategies), data_hash, class_name)
+        return self._from_cache(key, lambda: self._build_tree(data, class_name=class_name))
+
+    @staticmethod
+    def _hash_data(data: object) -> Optional[str]:
+        """
+        Hash of the content of the given data, or None if it cannot be identified by its content.
+
+        The data is hashed while being pickled, so that no serialized copy of it is built. Classes and functions are
+        pickled by reference, so the type hints inferred from them could change while the hash does not. Because of
+        this, data that contains any of them (other than builtins) is not identified, and neither is the data that
+        cannot be pickled. Iterators are not identified either, as `Tree.data` must hand back their consumed elements.
+        As the order of the items of a set changes with the hash seed of each run, they are sorted by their pickled
+        bytes.
+        """
+        import io
+        import pickle  # Only needed when the cache is used
+
+        class HashingPickler(pickle.Pickler):
+            def persistent_id(self, obj: object) -> Any:
+                # Sets are pickled natively by the C pickler, so this is the only hook that gets them
+                if type(obj) in (set, frozenset):
+                    return type(obj).__name__, sorted(map(self._dumps, obj))  # type: ignore[call-overload]
+                return None
+
+            def reducer_override(self, obj: object) -> Any:
+                if isinstance(obj, Iterator):
+                    raise pickle.PicklingError(f"{obj!r} must be parsed to be replayed")
+                if (
+                    isinstance(obj, (type, FunctionType, BuiltinFunctionType, MethodType, ModuleType))
+                    and getattr(obj, "__module__", None) != "builtins"
+                ):
+                    raise pickle.PicklingError(f"{obj!r} would be pickled by reference")
+                return NotImplemented
+
+            @staticmethod
+            def _dumps(obj: object) -> bytes:
+                buffer = io.BytesIO()
+                HashingPickler(buffer, protocol=4).dump(obj)
+                return buffer.getvalue()
+
+        hasher = hashlib.sha256()
+        try:
+            HashingPickler(SimpleNamespace(write=hasher.update), protocol=4).dump(data)
+        except Exception:  # noqa: BLE001
+            return None
+        return hasher.hexdigest()
+
+    def _build_tree(self, data: object, *, class_name: str) -> Tree:
+        if not self.instrumentation:
+            return Tree(super().from_data(data=data, class_name=class_name))
+        instrumentation = Instrumentation()
+        with instrumentation.activate():
+            return Tree(super().from_data(data=data, class_name=class_name), instrumentation=instrumentation)
+
+    def _get_file_cache_key(self, path: Union[str, Path], *parts: object) -> Optional[str]:
+        """Key of the entry for the data read from the given file. The file is identified by its path and status."""
+        if self.cache is None:
+            return None
+        stat = os.stat(path)
+        return self.cache.get_key(
+            repr(self.strategies), str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size, *parts
+        )
+
+    def _from_cache(self, key: Optional[str], infer: Callable[[], Any]) -> Tree:
+        """
+        Get the type hints stored in the cache for the given key or, if not found, infer them and store them.
+
+        Args:
+            key (Optional[str]): Key of the entry. If None, the cache is not used.
+            infer (Callable[[], Any]): Function that infers the type hints.
+
+        Returns:
+            Tree: The type hints.
+        """
+        if self.cache is None or key is None:
+            return infer()  # type: ignore[no-any-return]
+        strings = self.cache.get(key)
+        if strings is not None:
+            return Tree(None, strings)  # The data is not parsed, so there is no tree
+
+        self._skip_cache = True
+        try:
+            tree: Tree = infer()
+        finally:
+            self._skip_cache = False
+        strings = {
+            "with_imports": tree.to_string(include_imports=True),
+            "without_imports": tree.to_string(include_imports=False),
+        }
+        self.cache.put(key, strings)
+        return Tree(tree._tree, strings, instrumentation=tree.instrumentation)
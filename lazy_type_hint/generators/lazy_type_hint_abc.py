@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
+    Iterator,
     Optional,
     Sequence,
     TypeVar,
@@ -15,7 +16,7 @@ from lazy_type_hint.data_type_tree import data_type_tree_factory
 from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.file_modifiers.yaml_file_modifier import YAML_COMMENTS_POSITION, YamlFileModifier
 from lazy_type_hint.strategies import ParsingStrategies
-from lazy_type_hint.utils import is_string_python_keyword_compatible
+from lazy_type_hint.utils import JsonlLineIndex, atomic_write, is_string_python_keyword_compatible
 
 
 class LazyTypeHintError(Exception):
@@ -32,6 +33,9 @@ class Tree:
     def to_string(self, *, include_imports: bool = True) -> str:
         return self._tree.get_str_all_nodes(include_imports=include_imports)
 
+    def iter_string(self, *, include_imports: bool = True) -> Iterator[str]:
+        return self._tree.iter_str_all_nodes(include_imports=include_imports)
+
     def to_file(self, path_to_py: Union[Path, str], *, create_non_existing_dir: bool = False) -> None:
         path_to_py = Path(path_to_py)
         if not path_to_py.exists():
@@ -41,7 +45,8 @@ class Tree:
                     "(create_non_existing_dir input argument) were not set"
                 )
             os.makedirs(path_to_py.parent)
-        path_to_py.write_text(self.to_string(include_imports=True))
+        with atomic_write(path_to_py) as file:
+            file.writelines(self.iter_string(include_imports=True))
 
 
 class LazyTypeHintABC(ABC):
@@ -75,6 +80,27 @@ class LazyTypeHintABC(ABC):
         except Exception:  # noqa: BLE001
             return self.from_data(original_data, class_name=class_name)
 
+    def from_jsonl_file(
+        self,
+        path: Union[str, Path],
+        *,
+        class_name: str,
+        sample_size: Optional[int] = 1000,
+        seed: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Type hint the records of a JSONL file by parsing only a uniform random sample of them.
+
+        A line-offset index is built the first time and persisted alongside the file, so that later calls only read
+        the sampled records. If `sample_size` is None, all records are parsed.
+        """
+        with JsonlLineIndex(path) as index:
+            if sample_size is None:
+                records = [index.read_record(idx) for idx in range(len(index))]
+            else:
+                records = index.sample(sample_size, seed=seed)
+        return self.from_data(records, class_name=class_name, **kwargs)
+
     def from_data(
         self,
         data: object,
@@ -1,16 +1,26 @@
+import contextlib
 import os
 import re
 import shutil
+import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import (
     Any,
     Callable,
+    Collection,
+    ClassVar,
     Dict,
     Final,
+    Iterator,
+    List,
     Literal,
     Mapping,
     Optional,
     Sequence,
+    Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -21,14 +31,21 @@ from typing import (
 from typing_extensions import TypeAlias, override
 
 from lazy_type_hint.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.generic_type import IteratorDataTypeTree
 from lazy_type_hint.file_modifiers.py_file_modifier import PyFileModifier
 from lazy_type_hint.file_modifiers.yaml_file_modifier import YAML_COMMENTS_POSITION
+from lazy_type_hint.generators.build_store import BuildStore, BuildStoreError
+from lazy_type_hint.generators.class_registry import ClassRecord, ClassRegistry, ClassRegistryError, hash_content
 from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintABC
 from lazy_type_hint.strategies import ParsingStrategies
 from lazy_type_hint.utils import (
     TAB,
+    FileLock,
+    WriteBehindQueue,
+    atomic_write,
     is_string_python_keyword_compatible,
 )
+from lazy_type_hint.utils.utils import FileStat, get_file_stat
 
 THIS_DIR = Path(__file__).parent
 
@@ -55,12 +72,48 @@ class LazyTypeHintLive(LazyTypeHintABC):
     # Constants that should not be modified
     classes_created: "TypeAlias" = Any
     """Classes created by the class. Do not modify."""
-    _methods_to_be_overloaded: Final = ("from_data", "from_yaml_file")
+    _methods_to_be_overloaded: Final = ("from_data", "from_yaml_file", "from_jsonl_file")
     """Methods that will be modified in the PYI interface when new classes are added."""
     _this_file_pyi_path: Final = Path(__file__).with_suffix(".pyi")
     """Path to the .pyi file associated to this same module."""
     _custom_class_dir_path: Final = _this_file_pyi_path.parent / "build"
     """Path where the new classes will be generated.c"""
+    _registry: ClassVar[Optional[ClassRegistry]] = None
+    """Classes created so far. Loaded only once and shared among all instances."""
+    _shared_this_file_pyi: ClassVar[Optional[PyFileModifier]] = None
+    """.pyi representation of this same module shared among all instances."""
+    _in_transaction: ClassVar[bool] = False
+    """Whether the .pyi file must not be written until the ongoing transaction finishes."""
+    _this_file_pyi_is_outdated: ClassVar[bool] = False
+    """Whether the .pyi file must be written once the ongoing transaction finishes."""
+    _manifest_is_outdated: ClassVar[bool] = False
+    """Whether the manifest of the classes created must be written once the ongoing transaction finishes."""
+    _write_behind_queue: ClassVar[Optional[WriteBehindQueue]] = None
+    """Queue where the files are sent instead of being written, only if write-behind mode is enabled."""
+    _lock: Final = FileLock(_custom_class_dir_path / ".lock")
+    """Lock that prevents multiple processes from writing the .pyi file and the manifest at the same time.
+
+    It is kept within the build directory, which has to be writable anyway.
+    """
+    _thread_lock: Final = threading.RLock()
+    """Lock that prevents multiple threads from running transactions, or flushing the queued files, at the same time.
+
+    All the state shared among instances (e.g. the transaction in progress) is only modified while holding it.
+    """
+    _records_flushed: ClassVar[Mapping[str, ClassRecord]] = {}
+    """Records of the classes when the queued files were last flushed, only if write-behind mode is enabled."""
+    _this_file_pyi_stat: ClassVar[Optional[FileStat]] = None
+    """Status of the .pyi file when it was last read or written by this process."""
+    _manifest_stat: ClassVar[Optional[FileStat]] = None
+    """Status of the manifest when it was last read or written by this process."""
+    _n_shared_modules: ClassVar[Optional[int]] = None
+    """Number of modules the classes are spread among, only if sharding is enabled."""
+    _build_store: ClassVar[BuildStore] = BuildStore()
+    """Statements of the classes built within shared modules."""
+    _outdated_shared_modules: ClassVar[Set[Path]] = set()
+    """Shared modules that must be written once the ongoing transaction finishes."""
+    _pending_class_modules: ClassVar[Dict[Path, str]] = {}
+    """Content of the modules of the classes built within the ongoing transaction, written only if it succeeds."""
 
     @final
     def __init__(
@@ -70,32 +123,81 @@ class LazyTypeHintLive(LazyTypeHintABC):
     ) -> None:
         self.strategies = strategies
         self.if_type_hint_exists = if_type_hint_exists
+        self.this_file_pyi = self._load_this_file_pyi()
 
-        if not self._this_file_pyi_path.exists():
-            self.this_file_pyi = self._generate_this_file_pyi()
+    @classmethod
+    def _load_this_file_pyi(cls) -> PyFileModifier:
+        """Load the .pyi representation of this module only once, so that all instances keep it in sync."""
+        with cls._thread_lock:
+            if cls._shared_this_file_pyi is None:
+                cls._this_file_pyi_stat = get_file_stat(cls._this_file_pyi_path)
+                if cls._this_file_pyi_stat is None:
+                    cls._shared_this_file_pyi = cls._generate_this_file_pyi()
+                else:
+                    cls._shared_this_file_pyi = PyFileModifier(cls._this_file_pyi_path.read_text(encoding="utf-8"))
+            return cls._shared_this_file_pyi
+
+    @classmethod
+    def _get_registry(cls) -> ClassRegistry:
+        """Get the registry of classes created. It is only loaded from the .pyi file the first time."""
+        with cls._thread_lock:
+            if cls._registry is None:
+                class_names = cls._read_classes_created()
+                cls._manifest_stat = get_file_stat(cls._custom_class_dir_path / ClassRegistry.manifest_name)
+                try:
+                    cls._registry = ClassRegistry(cls._custom_class_dir_path, class_names=class_names)
+                except ClassRegistryError as error:
+                    raise LazyTypeHintLiveError(str(error)) from error
+            return cls._registry
+
+    @classmethod
+    def _is_modified_by_other_process(cls) -> bool:
+        """Whether the .pyi file or the manifest changed since they were last read or written by this process."""
+        registry = cls._get_registry()
+        return (
+            get_file_stat(cls._this_file_pyi_path) != cls._this_file_pyi_stat
+            or get_file_stat(registry.manifest_path) != cls._manifest_stat
+        )
+
+    @classmethod
+    def _reload(cls, *, keep: Collection[str] = ()) -> None:
+        """
+        Read again the .pyi file and the manifest, as they were modified by another process.
+
+        Args:
+            keep (Collection[str], optional): Classes registered by this process that must be kept. Those not found
+                in the .pyi file are added again. Defaults to ().
+        """
+        this_file_pyi = cls._load_this_file_pyi()
+        registry = cls._get_registry()
+        cls._this_file_pyi_stat = get_file_stat(cls._this_file_pyi_path)
+        cls._manifest_stat = get_file_stat(registry.manifest_path)
+        if cls._this_file_pyi_stat is None:
+            this_file_pyi.lines = cls._generate_this_file_pyi().lines
         else:
-            self.this_file_pyi = PyFileModifier(self._this_file_pyi_path.read_text(encoding="utf-8"))
+            this_file_pyi.lines = PyFileModifier(cls._this_file_pyi_path.read_text(encoding="utf-8")).lines
+        class_names = cls._read_classes_created()
+        try:
+            registry.refresh(class_names, keep=keep)
+        except ClassRegistryError as error:
+            raise LazyTypeHintLiveError(str(error)) from error
+        for class_name in keep:
+            if class_name not in class_names:
+                cls._add_new_class_to_loader_pyi(new_class=class_name, module=registry[class_name].path.stem)
 
-    def _get_classes_added(self) -> Mapping[str, Path]:
+    @classmethod
+    def _read_classes_created(cls) -> List[str]:
         to_find = "classes_created"
-        values = self.this_file_pyi.search_assignment("classes_created", only_values=True)
+        values = cls._load_this_file_pyi().search_assignment("classes_created", only_values=True)
         if not values:
             raise LazyTypeHintLiveError(f"No `{to_find}` was found in this file.")
 
         if values[0] == "Any":
-            return {}
-        matches = re.findall(r'"(.*?)"', values[0])
+            return []
+        return re.findall(r'"(.*?)"', values[0])
 
-        dct: Dict[str, Path] = {}
-        for match in matches:
-            path = Path(self._custom_class_dir_path / f"{match}.py")
-            if not path.exists():
-                raise LazyTypeHintLiveError(
-                    f"A class `{match}` was apparently created but cannot find its "
-                    f"corresponding source code within {self._custom_class_dir_path}"
-                )
-            dct[match] = path
-        return dct
+    def _get_classes_added(self) -> Mapping[str, Path]:
+        return {class_name: record.path for class_name, record in self._get_registry().items()}
 
     @override
     def from_yaml_file(
@@ -109,6 +211,18 @@ class LazyTypeHintLive(LazyTypeHintABC):
     ) -> ObjectT:
         return super().from_yaml_file(loader=loader, path=path, class_name=class_name, comments_are=comments_are)  # type: ignore
 
+    @override
+    def from_jsonl_file(
+        self,
+        path: Union[str, Path],
+        *,
+        class_name: str,
+        sample_size: Optional[int] = 1000,
+        seed: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        return super().from_jsonl_file(path, class_name=class_name, sample_size=sample_size, seed=seed, **kwargs)  # type: ignore
+
     @override
     def from_data(
         self,
@@ -120,30 +234,231 @@ class LazyTypeHintLive(LazyTypeHintABC):
             raise LazyTypeHintLiveError(
                 f"Given class_name is not compatible with Python class naming conventions: {class_name}"
             )
-        custom_class_file_path = self._custom_class_dir_path / f"{class_name}.py"
-
-        if class_name in self._get_classes_added() and self.if_type_hint_exists == "validate":
-            string_representation = cast(
-                DataTypeTree, super().from_data(data=data, class_name=class_name)
-            ).get_str_all_nodes(make_parent_class_inherit_from_original_type=False)
-            if self._remove_docstrings(string_representation) != self._remove_docstrings(
-                custom_class_file_path.read_text(encoding="utf-8")
-            ):
+        with self.transaction():
+            return self._register(data, class_name=class_name)
+
+    def register_many(self, data_by_class_name: Mapping[str, object]) -> None:
+        """Generate the type hints of multiple data structures, writing the .pyi file only once.
+
+        Either all of them are registered or, if any fails, none of them.
+        """
+        for class_name in data_by_class_name:
+            if not is_string_python_keyword_compatible(class_name):
+                raise LazyTypeHintLiveError(
+                    f"Given class_name is not compatible with Python class naming conventions: {class_name}"
+                )
+        with self.transaction():
+            for class_name, data in data_by_class_name.items():
+                self._register(data, class_name=class_name)
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[None]:
+        """Apply all modifications made within the context to the .pyi file in memory and write it only once.
+
+        The file is atomically replaced at the end of the context, and so are the modules of the classes built within
+        it, which are not written before. If an exception is raised, the .pyi file and the classes created are left as
+        they were before entering the context. Transactions run by different threads are serialized.
+        """
+        with cls._thread_lock:
+            if cls._in_transaction:  # Nested transactions are merged into the outermost one
+                yield
+            else:
+                with cls._outermost_transaction():
+                    yield
+
+    @classmethod
+    @contextmanager
+    def _outermost_transaction(cls) -> Iterator[None]:
+        this_file_pyi = cls._load_this_file_pyi()
+        registry = cls._get_registry()
+        if cls._write_behind_queue is None and cls._is_modified_by_other_process():
+            cls._reload()
+        lines_before = list(this_file_pyi.lines)
+        records_before = registry.snapshot()
+        cls._in_transaction = True
+        try:
+            yield
+            if cls._this_file_pyi_is_outdated or cls._manifest_is_outdated or cls._pending_class_modules:
+                cls._commit(records_before)
+        except BaseException:
+            this_file_pyi.lines = lines_before
+            registry.restore(records_before)
+            raise
+        finally:
+            cls._outdated_shared_modules.clear()
+            cls._pending_class_modules.clear()
+            cls._in_transaction = False
+            cls._this_file_pyi_is_outdated = False
+            cls._manifest_is_outdated = False
+
+    @classmethod
+    def _commit(cls, records_before: Mapping[str, ClassRecord]) -> None:
+        """Write the .pyi file and the manifest, merging first the changes made meanwhile by other processes.
+
+        Only the merge and the writes are done while holding the lock, so that processes can build their classes
+        concurrently.
+        """
+        if cls._write_behind_queue is not None:  # Changes are merged once flushed, within `_prepare_flush`
+            cls._write_class_modules()
+            cls._write_shared_modules()
+            cls._write_this_file_pyi()
+            cls._write_manifest()
+            return
+
+        registry = cls._get_registry()
+        os.makedirs(cls._custom_class_dir_path, exist_ok=True)
+        with cls._lock:
+            if cls._is_modified_by_other_process():
+                cls._reload(keep=[name for name, record in registry.items() if records_before.get(name) is not record])
+            cls._write_class_modules()
+            cls._write_shared_modules()
+            cls._write_this_file_pyi()
+            cls._write_manifest()
+            cls._this_file_pyi_stat = get_file_stat(cls._this_file_pyi_path)
+            cls._manifest_stat = get_file_stat(registry.manifest_path)
+
+    def _register(self, data: ObjectT, *, class_name: str) -> ObjectT:
+        registry = self._get_registry()
+        tree = cast(DataTypeTree, super().from_data(data=data, class_name=class_name))
+        if isinstance(tree, IteratorDataTypeTree):  # Some elements were consumed, so hand back an iterator over all
+            data = cast(ObjectT, tree.data)
+        strategies = repr(self.strategies)
+        record = registry.get(class_name)
+        if record is not None and record.strategies == strategies:
+            if self.if_type_hint_exists == "validate":
+                # Same structure as the existing type hints: valid without rendering them
+                is_unchanged = record.structure_fingerprint == tree.get_fingerprint(include_docstrings=False)
+            else:
+                # Same type hints as the existing ones: nothing to render or write
+                is_unchanged = record.fingerprint == tree.get_fingerprint()
+            if is_unchanged and self._is_module_up_to_date(record):
+                return data
+
+        string_representation = tree.get_str_all_nodes(make_parent_class_inherit_from_original_type=False)
+        if record is not None and self.if_type_hint_exists == "validate":
+            # Fingerprints might be missing or differ without the type hints being different (i.e. sets ordered
+            # differently across interpreters), so the rendered type hints have the final say.
+            if not self._is_same_class(string_representation, record):
                 raise LazyTypeHintLiveError(
                     f"Error in validation: Existing type hints were found for `{class_name}` and this one does not "
                     "match the inner structure of the input data given."
                 )
-        else:
-            string_representation = cast(
-                DataTypeTree, super().from_data(data=data, class_name=class_name)
-            ).get_str_all_nodes(make_parent_class_inherit_from_original_type=False)
-
-        self._create_custom_class_py(string_representation, class_name)
-        if class_name in self._get_classes_added():
-            return data
-        self._add_new_class_to_loader_pyi(new_class=class_name)
+
+        path, statements = self._build_custom_class(string_representation, class_name, record)
+        if record is None:
+            self._add_new_class_to_loader_pyi(new_class=class_name, module=path.stem)
+        elif record.path != path:
+            self._move_class_in_this_file_pyi(class_name, old_module=record.path.stem, new_module=path.stem)
+        registry.add(
+            class_name,
+            content=string_representation,
+            fingerprint=tree.get_fingerprint(),
+            structure_fingerprint=tree.get_fingerprint(include_docstrings=False),
+            strategies=strategies,
+            path=path,
+            statements=statements,
+        )
+        self._update_manifest()
         return data
 
+    def _is_module_up_to_date(self, record: ClassRecord) -> bool:
+        """
+        Whether the module of the class still holds what it was built with, i.e. it was not edited or replaced.
+
+        The content of the module is only read if its status differs from the one stored in the manifest, i.e. it
+        changed since it was last checked or written by any process.
+        """
+        stat = get_file_stat(record.path)
+        if stat is not None and record.module_stat == stat:
+            return True
+        try:
+            content = self._read(record.path)
+        except OSError:
+            return False
+        if record.statements is None:
+            is_up_to_date = hash_content(content) == record.content_hash
+        else:
+            try:
+                is_up_to_date = set(record.statements) <= set(self._build_store.add(content))
+            except BuildStoreError:
+                is_up_to_date = False
+        if is_up_to_date and record.module_stat != stat:
+            record.module_stat = stat
+            if self._write_behind_queue is None:  # Otherwise, it is stored whenever the manifest is written
+                self._update_manifest()  # So that no other process has to read it again
+        return is_up_to_date
+
+    def _build_custom_class(
+        self, string: str, class_name: str, record: Optional[ClassRecord]
+    ) -> Tuple[Path, Optional[Tuple[str, ...]]]:
+        """
+        Build the class within a shared module if sharding is enabled, or within its own module otherwise.
+
+        Classes that would define any name differently than the classes already found within their shared module
+        are built within their own module instead.
+
+        Returns:
+            Tuple[Path, Optional[Tuple[str, ...]]]: Path to the module and hashes of the statements of the class within
+                it, only if it is a shared module.
+        """
+        registry = self._get_registry()
+        if record is not None and record.statements is not None:
+            self._outdated_shared_modules.add(record.path)  # Its previous statements must be removed
+        if self._n_shared_modules is not None:
+            if record is not None and record.statements is not None:
+                path = record.path
+            else:
+                path = registry.get_shared_path(class_name, self._n_shared_modules)
+            try:
+                statements = self._build_store.add(string)
+            except BuildStoreError as error:
+                raise LazyTypeHintLiveError(str(error)) from error
+            others = [registry[other].statements for other in registry.get_classes_in(path) if other != class_name]
+            if not self._build_store.find_conflicts(statements, self._load_shared_module(path, others)):
+                self._outdated_shared_modules.add(path)
+                return path, statements
+
+        self._create_custom_class_py(string, class_name)
+        return registry.get_path(class_name), None
+
+    @classmethod
+    def _load_shared_module(cls, path: Path, classes: Sequence[Optional[Tuple[str, ...]]]) -> Sequence[Tuple[str, ...]]:
+        """Make sure the statements of the given classes, built within the given shared module, are available."""
+        statement_hashes = [statements or () for statements in classes]
+        if any(hash_ not in cls._build_store for hashes in statement_hashes for hash_ in hashes) and path.exists():
+            try:
+                cls._build_store.add(cls._read(path))
+            except BuildStoreError as error:
+                raise LazyTypeHintLiveError(str(error)) from error
+        if any(hash_ not in cls._build_store for hashes in statement_hashes for hash_ in hashes):
+            raise LazyTypeHintLiveError(f"Some of the classes built within {path} cannot be found in it.")
+        return statement_hashes
+
+    @classmethod
+    def _write_shared_modules(cls) -> None:
+        registry = cls._get_registry()
+        for path in sorted(cls._outdated_shared_modules):
+            classes = [registry[class_name].statements for class_name in sorted(registry.get_classes_in(path))]
+            content = cls._build_store.render(cls._load_shared_module(path, classes))
+            if not cls._custom_class_dir_path.exists():
+                os.makedirs(cls._custom_class_dir_path)
+            cls._write_module(path, content)
+        cls._outdated_shared_modules.clear()
+
+    def _is_same_class(self, string: str, record: ClassRecord) -> bool:
+        """Whether the given source code and the one the class was built from only differ in their docstrings."""
+        if record.statements is None:
+            return self._remove_docstrings(string) == self._remove_docstrings(self._read(record.path))
+        statement_hashes = self._load_shared_module(record.path, [record.statements])[0]
+        try:
+            new_statement_hashes = self._build_store.add(string)
+        except BuildStoreError as error:
+            raise LazyTypeHintLiveError(str(error)) from error
+        return self._remove_docstrings(self._build_store.render([new_statement_hashes])) == self._remove_docstrings(
+            self._build_store.render([statement_hashes])
+        )
+
     @staticmethod
     def _remove_docstrings(string: str) -> str:
         if '"""' not in string:
@@ -154,60 +469,179 @@ class LazyTypeHintLive(LazyTypeHintABC):
             strings[idx] = "" if '"""' in string else string
         return "\n".join(strings)
 
+    @classmethod
+    def enable_write_behind(cls, flush_interval: Optional[float] = 1.0) -> None:
+        """
+        Postpone all file writes so that type hints are created without waiting for the disk.
+
+        Files are queued in memory and written by a background thread, at exit or when calling `flush`. Only the
+        latest version of each file is written, and nothing is written if its content did not change. The changes
+        made meanwhile by other processes are merged right before writing, under the same lock as without this mode.
+
+        Args:
+            flush_interval (Optional[float], optional): Seconds between two consecutive writes performed in the
+                background. If None, files are only written at exit or when calling `flush`. Defaults to 1.0.
+        """
+        cls.disable_write_behind()
+        with cls._thread_lock:
+            cls._records_flushed = cls._get_registry().snapshot()
+            cls._write_behind_queue = WriteBehindQueue(flush_interval, prepare_flush=cls._prepare_flush)
+
+    @classmethod
+    @contextmanager
+    def _prepare_flush(cls) -> Iterator[None]:
+        """
+        Hold the locks while the queued files are written, merging first the changes made by other processes.
+
+        The .pyi file and the manifest are queued again if other processes modified them. No transaction can run
+        meanwhile, so that the files written are consistent among them.
+        """
+        with cls._thread_lock:
+            if cls._write_behind_queue is None or not len(cls._write_behind_queue):
+                yield
+                return
+            registry = cls._get_registry()
+            os.makedirs(cls._custom_class_dir_path, exist_ok=True)
+            with cls._lock:
+                if cls._is_modified_by_other_process():
+                    records_flushed = cls._records_flushed
+                    cls._reload(
+                        keep=[name for name, record in registry.items() if records_flushed.get(name) is not record]
+                    )
+                    cls._write_this_file_pyi()
+                    cls._write_manifest()
+                yield
+                cls._this_file_pyi_stat = get_file_stat(cls._this_file_pyi_path)
+                cls._manifest_stat = get_file_stat(registry.manifest_path)
+                cls._records_flushed = registry.snapshot()
+
+    @classmethod
+    def disable_write_behind(cls) -> None:
+        """Write all pending files and go back to writing them as soon as type hints are created."""
+        if cls._write_behind_queue is not None:
+            cls._write_behind_queue.close()
+            cls._write_behind_queue = None
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write all files pending to be written. Only relevant if write-behind mode is enabled."""
+        if cls._write_behind_queue is not None:
+            cls._write_behind_queue.flush()
+
+    @classmethod
+    def enable_sharding(cls, n_modules: int = 16) -> None:
+        """
+        Spread the classes created from now on among a fixed number of shared modules.
+
+        Statements shared by multiple classes within the same module are only written once, and type checkers only
+        have to load a bounded number of modules no matter how many classes are created. Classes created before
+        are moved to their shared module the next time their type hints are generated.
+
+        Args:
+            n_modules (int, optional): Number of shared modules. Defaults to 16.
+        """
+        if n_modules <= 0:
+            raise LazyTypeHintLiveError(f"Number of modules must be greater than 0. Given one is: {n_modules}")
+        cls._n_shared_modules = n_modules
+
+    @classmethod
+    def disable_sharding(cls) -> None:
+        """Build the classes created from now on within their own module."""
+        cls._n_shared_modules = None
+
     @classmethod
     def reset(cls) -> None:
         """Remove all existing type hints generated by this class."""
+        if cls._write_behind_queue is not None:
+            cls._write_behind_queue.discard()
         if cls._custom_class_dir_path.exists():
             shutil.rmtree(cls._custom_class_dir_path)
         if cls._this_file_pyi_path.exists():
             os.remove(cls._this_file_pyi_path)
+        cls._registry = None
+        cls._shared_this_file_pyi = None
+        cls._build_store = BuildStore()
+        cls._this_file_pyi_stat = None
+        cls._manifest_stat = None
 
     @final
-    def _generate_this_file_pyi(self) -> PyFileModifier:
+    @classmethod
+    def _generate_this_file_pyi(cls) -> PyFileModifier:
+        """Generate the .pyi file without any class created.
+
+        It is cached within `__pycache__` by the hash of this module and of the module that transforms it, so that it
+        is only generated once per version of both.
+        """
         content = Path(__file__).read_text()
+        transform = Path(sys.modules[PyFileModifier.__module__].__file__ or "").read_text()
+        cache_path = THIS_DIR / "__pycache__" / f"{Path(__file__).stem}.{hash_content(content + transform)[:16]}.pyi"
+        with contextlib.suppress(OSError):
+            return PyFileModifier(cache_path.read_text(encoding="utf-8"))
 
         file_handler = PyFileModifier(content)
-        file_handler.remove_all_method_bodies()
-        file_handler.remove_all_private_methods()
-        file_handler.remove_all_instance_variables(class_name=(type(self)).__name__)
+        file_handler.keep_only_interface(class_name=cls.__name__)
+        with contextlib.suppress(OSError):  # The cache is optional, i.e. the package might be read-only
+            os.makedirs(cache_path.parent, exist_ok=True)
+            with atomic_write(cache_path) as file:
+                file.write(str(file_handler))
         return file_handler
 
     def _create_custom_class_py(self, string: str, class_name: str) -> None:
-        if not self._custom_class_dir_path.exists():
-            os.makedirs(self._custom_class_dir_path)
+        """Build the class within its own module, which is written once the ongoing transaction succeeds."""
+        self._pending_class_modules[self._custom_class_dir_path / f"{class_name}.py"] = string
 
-        path = self._custom_class_dir_path / f"{class_name}.py"
-        path.write_text(string)
+    @classmethod
+    def _write_class_modules(cls) -> None:
+        if cls._pending_class_modules and not cls._custom_class_dir_path.exists():
+            os.makedirs(cls._custom_class_dir_path)
+        for path, content in cls._pending_class_modules.items():
+            cls._write_module(path, content)
+        cls._pending_class_modules.clear()
 
     @final
-    def _add_new_class_to_loader_pyi(self, *, new_class: str) -> None:
-        self._add_class_created_to_this_file_pyi(new_class)
-        self._add_import_to_this_file_pyi(new_class)
-        for method_name in self._methods_to_be_overloaded:
-            self._add_overload_to_this_file_pyi(new_class=new_class, method_name=method_name)
+    @classmethod
+    def _add_new_class_to_loader_pyi(cls, *, new_class: str, module: str) -> None:
+        cls._add_class_created_to_this_file_pyi(new_class)
+        cls._add_import_to_this_file_pyi(new_class, module)
+        for method_name in cls._methods_to_be_overloaded:
+            cls._add_overload_to_this_file_pyi(new_class=new_class, method_name=method_name)
+        cls._update_this_file_pyi()
 
     @final
-    def _add_import_to_this_file_pyi(self, new_class: str) -> None:
-        import_statement = f"from lazy_type_hint.generators.build.{new_class} import {new_class}"
-        self.this_file_pyi.add_imports(
-            import_statement,
+    @classmethod
+    def _add_import_to_this_file_pyi(cls, new_class: str, module: str) -> None:
+        cls._load_this_file_pyi().add_imports(
+            cls._get_import_statement(new_class, module),
             in_type_checking_block=False,
         )
-        self._update_this_file_pyi()
 
     @final
+    @classmethod
+    def _move_class_in_this_file_pyi(cls, class_name: str, *, old_module: str, new_module: str) -> None:
+        this_file_pyi = cls._load_this_file_pyi()
+        idx = this_file_pyi.lines.index(cls._get_import_statement(class_name, old_module))
+        this_file_pyi.replace_line(idx, cls._get_import_statement(class_name, new_module))
+        cls._update_this_file_pyi()
+
+    @staticmethod
+    def _get_import_statement(class_name: str, module: str) -> str:
+        return f"from lazy_type_hint.generators.build.{module} import {class_name}"
+
+    @final
+    @classmethod
     def _add_overload_to_this_file_pyi(
-        self, *, new_class: str, method_name: str, input_argument: str = "class_name"
+        cls, *, new_class: str, method_name: str, input_argument: str = "class_name"
     ) -> None:
+        this_file_pyi = cls._load_this_file_pyi()
         # First time the function is called it will attach an extra @overload decorator
-        if not self.this_file_pyi.search_decorator(decorator_name="overload", method_name=method_name):
-            idx_lst = self.this_file_pyi.search_method(method_name, return_index_above_decorator=True)
+        if not this_file_pyi.search_decorator(decorator_name="overload", method_name=method_name):
+            idx_lst = this_file_pyi.search_method(method_name, return_index_above_decorator=True)
             if not idx_lst:
                 raise LazyTypeHintLiveError(f"No method `{method_name}` could be found")
 
-            self.this_file_pyi.add_line(idx_lst[-1], f"{TAB}@overload")
+            this_file_pyi.add_line(idx_lst[-1], f"{TAB}@overload")
 
-        signature, _ = self.this_file_pyi.get_signature(method_name)
+        signature, _ = this_file_pyi.get_signature(method_name)
 
         # At this point idx is the index of the line where the input argument was found
         first_idx = signature.find(input_argument)
@@ -225,15 +659,16 @@ class LazyTypeHintLive(LazyTypeHintABC):
         first_idx = signature.rfind("->")
         signature = signature[: first_idx + len("->") + 1] + new_class + signature[last_idx:]
 
-        idx = self.this_file_pyi.search_method(method_name=method_name, return_index_above_decorator=True)[-1]
-        self.this_file_pyi.add_line(idx, signature)
-        self._update_this_file_pyi()
+        idx = this_file_pyi.search_method(method_name=method_name, return_index_above_decorator=True)[-1]
+        this_file_pyi.add_line(idx, signature)
 
     @final
-    def _add_class_created_to_this_file_pyi(self, new_class: str) -> None:
+    @classmethod
+    def _add_class_created_to_this_file_pyi(cls, new_class: str) -> None:
         label = "classes_created"
+        this_file_pyi = cls._load_this_file_pyi()
 
-        value = self.this_file_pyi.search_assignment(label, only_values=True)[0]
+        value = this_file_pyi.search_assignment(label, only_values=True)[0]
         if not value:
             raise LazyTypeHintLiveError(f"No `{label}` was found in this file.")
         # Case: Any
@@ -243,9 +678,64 @@ class LazyTypeHintLive(LazyTypeHintABC):
         else:
             value = value.replace("], Any]", f', "{new_class}"], Any]')
 
-        self.this_file_pyi.replace_assignement(label, value)
-        self._update_this_file_pyi()
+        this_file_pyi.replace_assignement(label, value)
 
     @final
-    def _update_this_file_pyi(self) -> None:
-        self._this_file_pyi_path.write_text(str(self.this_file_pyi))
+    @classmethod
+    def _update_this_file_pyi(cls) -> None:
+        """Write the .pyi file, or postpone it until the end of the ongoing transaction."""
+        if cls._in_transaction:
+            cls._this_file_pyi_is_outdated = True
+        else:
+            cls._write_this_file_pyi()
+
+    @final
+    @classmethod
+    def _write_this_file_pyi(cls) -> None:
+        cls._write(cls._this_file_pyi_path, str(cls._load_this_file_pyi()))
+
+    @final
+    @classmethod
+    def _update_manifest(cls) -> None:
+        """Write the manifest of the classes created, or postpone it until the end of the ongoing transaction."""
+        if cls._in_transaction:
+            cls._manifest_is_outdated = True
+        else:
+            cls._write_manifest()
+
+    @final
+    @classmethod
+    def _write_manifest(cls) -> None:
+        registry = cls._get_registry()
+        cls._write(registry.manifest_path, registry.to_manifest())
+
+    @final
+    @classmethod
+    def _write_module(cls, path: Path, content: str) -> None:
+        """Write the module of any class built, storing its status so that it is not checked again."""
+        cls._write(path, content)
+        stat = get_file_stat(path) if cls._write_behind_queue is None else None
+        registry = cls._get_registry()
+        for class_name in registry.get_classes_in(path):
+            registry[class_name].module_stat = stat
+
+    @final
+    @classmethod
+    def _read(cls, path: Path) -> str:
+        """Read the file, taking into account the content that might still be pending to be written."""
+        if path in cls._pending_class_modules:
+            return cls._pending_class_modules[path]
+        if cls._write_behind_queue is not None:
+            content = cls._write_behind_queue.get_pending(path)
+            if content is not None:
+                return content
+        return path.read_text(encoding="utf-8")
+
+    @final
+    @classmethod
+    def _write(cls, path: Path, content: str) -> None:
+        if cls._write_behind_queue is not None:
+            cls._write_behind_queue.put(path, content)
+        else:
+            with atomic_write(path) as file:
+                file.write(content)
@@ -0,0 +1,200 @@
+"""Generation of the type hints of multiple classes that share the type aliases they have in common."""
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Final, Iterator, Set, Tuple, Union
+
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.data_type_tree.simple_data_type_tree import ReferenceDataTypeTree
+from lazy_type_hint.generators.lazy_type_hint import Tree
+from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintABC, LazyTypeHintError
+from lazy_type_hint.strategies import ParsingStrategies
+from lazy_type_hint.utils import ImportManager, atomic_write
+
+
+class LazyTypeHintSession(LazyTypeHintABC):
+    """Generate the type hints of multiple classes, defining only once the type aliases they have in common.
+
+    Type aliases are identified by their structure, regardless of their name. The first time one is found it is
+    registered within the session, and any other class (or any other node of the same class) with the same structure
+    reuses it under its registered name. Once all classes are parsed, the registered type aliases are written to a
+    single shared module, while the module of each class only defines what is not shared and imports the rest.
+
+    Example:
+        session = LazyTypeHintSession()
+        for name, payload in payloads.items():
+            session.from_data(payload, class_name=name)
+        session.to_dir("my_types", create_non_existing_dir=True)
+    """
+
+    strategies: ParsingStrategies
+    """Strategies to follow when parsing the objects."""
+    shared_module: str
+    """Name of the module where the shared type aliases are defined."""
+
+    _trees: Dict[str, DataTypeTree]
+    """Tree of each class parsed within the session."""
+    _registry: Dict[str, str]
+    """Name of the shared type alias registered for each structure."""
+    _shared_declarations: Dict[str, str]
+    """Declaration of each shared type alias, ordered so that each one is found after the ones it depends on."""
+    _shared_imports: ImportManager
+    """Imports required by any of the shared type aliases, and potentially more."""
+
+    _placeholder: Final = "__lazy_type_hint_name__"
+    """Name that replaces the one of a type alias to identify it only by its structure."""
+
+    def __init__(
+        self,
+        strategies: ParsingStrategies = ParsingStrategies(),  # noqa: B008
+        *,
+        shared_module: str = "shared",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(strategies)
+        if not shared_module.isidentifier():
+            raise LazyTypeHintError(f"The name of the shared module is not a valid module name: {shared_module}")
+        self.shared_module = shared_module
+        self._trees = {}
+        self._registry = {}
+        self._shared_declarations = {}
+        self._shared_imports = ImportManager()
+
+    def from_data(
+        self,
+        data: object,
+        *,
+        class_name: str,
+        **kwargs: Any,
+    ) -> Tree:
+        """
+        Parse the data of a new class and register the type aliases it defines.
+
+        Args:
+            data (object): Data to parse.
+            class_name (str): Name of the class. It must be unique within the session.
+            **kwargs (Any): Unused.
+
+        Returns:
+            Tree: Type hints of the class. Any type alias already registered is referenced by its registered name,
+                but the module rendered from it still defines everything it requires.
+        """
+        if class_name in self._trees or class_name in self._shared_declarations:
+            raise LazyTypeHintError(f"The name {class_name} is already in use within the session")
+        module = self.get_module_name(class_name)
+        if module == self.shared_module or module in map(self.get_module_name, self._trees):
+            raise LazyTypeHintError(f"The module of the class {class_name} ({module}) is already in use")
+
+        tree: DataTypeTree = super().from_data(data, class_name=class_name)
+        self._register(tree)
+        self._trees[class_name] = tree
+        return Tree(tree)
+
+    def _register(self, tree: DataTypeTree) -> None:
+        """
+        Rename the type aliases of the tree whose structure is already registered, and register the other ones.
+
+        Nodes are visited children first, so that the declaration of each one already references the registered
+        names of its children. Type aliases involved in a cycle are kept within the module of the class.
+        """
+        not_shareable: Set[int] = set()
+        for node in tree._iter_post_order():
+            if (
+                isinstance(node, ReferenceDataTypeTree)
+                or node.is_recursive
+                or any(id(child) in not_shareable for child in node.get_children())
+            ):
+                not_shareable.add(id(node))
+                continue
+            if node is tree or not node.permission_to_be_created_as_type_alias:
+                continue
+
+            pattern = rf"\b{re.escape(node.name)}\b"
+            structure = re.sub(pattern, self._placeholder, node.get_str_top_node())
+            name = self._registry.get(structure)
+            if name is None:
+                name = node.name
+                while name in self._shared_declarations or name in self._trees:
+                    name = f"_{name}"
+                self._registry[structure] = name
+                self._shared_declarations[name] = structure.replace(self._placeholder, name)
+                self._shared_imports = ImportManager({*self._shared_imports, *node.imports})
+            if name != node.name:
+                node.name = name
+                node.invalidate("name")
+
+    def get_shared_module(self) -> str:
+        """String that represents the .py file that defines all shared type aliases."""
+        declarations = list(self._shared_declarations.values())
+        imports = self._shared_imports.get_used_in("\n".join(declarations)).format()
+        return "".join(DataTypeTree._iter_formatted_node_strings([imports, *declarations])) + "\n"
+
+    def get_class_module(self, class_name: str) -> str:
+        """
+        String that represents the .py file of the given class.
+
+        It only defines the type aliases that are not shared, and imports the shared ones from the shared module.
+
+        Args:
+            class_name (str): Name of a class parsed within the session.
+
+        Returns:
+            str: Content of the module.
+        """
+        try:
+            tree = self._trees[class_name]
+        except KeyError as error:
+            raise LazyTypeHintError(f"No class named {class_name} was generated within the session") from error
+        shared_declarations = set(self._shared_declarations.values())
+        declarations = [
+            declaration
+            for declaration in tree.get_strs_all_nodes_unformatted(include_imports=False)
+            if declaration not in shared_declarations
+        ]
+        code = "\n".join(declarations)
+        imports = [tree.imports.get_used_in(code).format()]
+        shared_names = sorted(name for name in self._shared_declarations if re.search(rf"\b{name}\b", code))
+        if shared_names:
+            imports.append(f"from .{self.shared_module} import {', '.join(shared_names)}")
+        imports_str = "\n".join(import_ for import_ in imports if import_)
+        return "".join(DataTypeTree._iter_formatted_node_strings([imports_str, *declarations])) + "\n"
+
+    def iter_modules(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over the name and content of all modules: the shared one first and then one per class."""
+        yield self.shared_module, self.get_shared_module()
+        for class_name in self._trees:
+            yield self.get_module_name(class_name), self.get_class_module(class_name)
+
+    def to_dir(self, path: Union[Path, str], *, create_non_existing_dir: bool = False) -> None:
+        """
+        Write all modules within a package at the given directory.
+
+        Each module is replaced atomically. An `__init__.py` that re-exports all classes is written as well.
+
+        Args:
+            path (Union[Path, str]): Directory of the package.
+            create_non_existing_dir (bool, optional): Whether the directory is created if it does not exist. Defaults
+                to False.
+        """
+        path = Path(path)
+        if not path.exists():
+            if not create_non_existing_dir:
+                raise ValueError(
+                    "The given directory does not exist and permissions to create the folder "
+                    "(create_non_existing_dir input argument) were not set"
+                )
+            os.makedirs(path)
+        for module, content in self.iter_modules():
+            with atomic_write(path / f"{module}.py") as file:
+                file.write(content)
+        with atomic_write(path / "__init__.py") as file:
+            file.writelines(
+                f"from .{self.get_module_name(class_name)} import {class_name} as {class_name}\n"
+                for class_name in self._trees
+            )
+
+    @staticmethod
+    def get_module_name(class_name: str) -> str:
+        """Name of the module of the given class, in snake case."""
+        return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", class_name).lower()
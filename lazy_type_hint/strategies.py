@@ -1,10 +1,11 @@
 from dataclasses import dataclass, fields
-from typing import Literal, Optional, get_args, get_type_hints
+from typing import ClassVar, Dict, Literal, Mapping, Optional, Tuple, get_args, get_type_hints
 
 LIST_STRATEGIES = Literal["Sequence", "list"]
 TUPLE_SIZE_STRATEGIES = Literal["fixed", "any size"]
 MAPPING_STRATEGIES = Literal["TypedDict", "Mapping", "dict"]
 PANDAS_STRATEGIES = Literal["Full type hint", "Type hint only for autocomplete", "Do not type hint columns"]
+INSTANCE_STRATEGIES = Literal["class name", "Protocol"]
 
 
 @dataclass(frozen=True)
@@ -18,19 +19,23 @@ class ParsingStrategies:
     merge_different_typed_dicts_if_similarity_above: int = 50
     typed_dict_read_only_values: bool = False
     check_max_n_elements_within_container: Optional[int] = 500
+    instance_strategy: INSTANCE_STRATEGIES = "class name"
+    max_fixed_tuple_size: Optional[int] = None
+
+    _allowed_values_by_class: ClassVar[Dict[type, Mapping[str, Tuple[str, ...]]]] = {}
+    """Values allowed by each field typed as a `Literal` of strings, by class.
+
+    Resolving the type hints is expensive, so it is only done once per class rather than once per instance.
+    """
 
     def __post_init__(self) -> None:
-        type_hints = get_type_hints(self)
-        for field in fields(type(self)):
-            allowed_values = get_args(type_hints[field.name])
-            if (
-                allowed_values
-                and all(isinstance(value, str) for value in allowed_values)
-                and getattr(self, field.name) not in allowed_values
-            ):
+        if type(self) not in self._allowed_values_by_class:
+            self._allowed_values_by_class[type(self)] = self._get_allowed_values()
+        for name, allowed_values in self._allowed_values_by_class[type(self)].items():
+            if getattr(self, name) not in allowed_values:
                 raise ValueError(
-                    f"Invalid value for {field.name}. Expected any of ({', '.join(map(str, allowed_values))}) but got "
-                    f"{getattr(self, field.name)}"
+                    f"Invalid value for {name}. Expected any of ({', '.join(map(str, allowed_values))}) but got "
+                    f"{getattr(self, name)}"
                 )
         if self.min_height_to_define_type_alias < 0:
             raise ValueError("`min_height_to_define_type_alias` must be greater or equal than 0")
@@ -41,3 +46,14 @@ class ParsingStrategies:
             raise ValueError("`merge_typed_dicts_if_similarity_above` must be less than 100")
         if self.check_max_n_elements_within_container and self.check_max_n_elements_within_container <= 0:
             raise ValueError("`chec_max_n_type_elements_within_container` must at least 1")
+        if self.max_fixed_tuple_size is not None and self.max_fixed_tuple_size <= 0:
+            raise ValueError("`max_fixed_tuple_size` must be at least 1")
+
+    def _get_allowed_values(self) -> Mapping[str, Tuple[str, ...]]:
+        type_hints = get_type_hints(type(self))
+        allowed_values = {field.name: get_args(type_hints[field.name]) for field in fields(self)}
+        return {
+            name: values
+            for name, values in allowed_values.items()
+            if values and all(isinstance(value, str) for value in values)
+        }
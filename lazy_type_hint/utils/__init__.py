@@ -1,16 +1,30 @@
+from lazy_type_hint.utils.cached_property import CachedProperty as CachedProperty
+from lazy_type_hint.utils.cached_property import cached_property as cached_property
+from lazy_type_hint.utils.cached_property import invalidate_cached_properties as invalidate_cached_properties
 from lazy_type_hint.utils.docstring_formatter import format_string_as_docstring as format_string_as_docstring
+from lazy_type_hint.utils.file_lock import FileLock as FileLock
 from lazy_type_hint.utils.import_manager import ImportManager as ImportManager
+from lazy_type_hint.utils.inference_cache import InferenceCache as InferenceCache
+from lazy_type_hint.utils.instrumentation import Instrumentation as Instrumentation
+from lazy_type_hint.utils.jsonl_line_index import JsonlLineIndex as JsonlLineIndex
 from lazy_type_hint.utils.mypy import Mypy as Mypy
 from lazy_type_hint.utils.ordered_set import OrderedSet as OrderedSet
 from lazy_type_hint.utils.utils import (
     TAB as TAB,
 )
 from lazy_type_hint.utils.utils import (
-    cache_returned_value_per_instance as cache_returned_value_per_instance,
+    atomic_write as atomic_write,
 )
 from lazy_type_hint.utils.utils import (
     check_if_command_available as check_if_command_available,
 )
+from lazy_type_hint.utils.utils import (
+    get_stable_repr as get_stable_repr,
+)
 from lazy_type_hint.utils.utils import (
     is_string_python_keyword_compatible as is_string_python_keyword_compatible,
 )
+from lazy_type_hint.utils.utils import (
+    register_lazy_subclasses as register_lazy_subclasses,
+)
+from lazy_type_hint.utils.write_behind_queue import WriteBehindQueue as WriteBehindQueue
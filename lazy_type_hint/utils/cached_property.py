@@ -0,0 +1,161 @@
+"""Properties that are computed once per instance and can be invalidated whenever the attributes they use change."""
+
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+ValueT = TypeVar("ValueT")
+
+
+class CachedProperty(Generic[ValueT]):
+    """Property whose value is computed the first time it is accessed and then stored within the instance.
+
+    The value is stored within an attribute of its own (`_cached_<name>`), so that it also works with classes that
+    define `__slots__` as long as they include that attribute. Use `invalidate_cached_properties` to drop the values
+    that depend on any attribute that changed.
+    """
+
+    getter: Callable[[Any], ValueT]
+    """Function that computes the value."""
+    depends_on: FrozenSet[str]
+    """Attributes (including other cached properties) that the value is computed from."""
+    name: str
+    """Name of the property within the class."""
+    attribute: str
+    """Attribute of the instance where the value is stored."""
+
+    _by_class: ClassVar[Dict[Type[object], Tuple["CachedProperty[Any]", ...]]] = {}
+    """All cached properties of each class (including the inherited ones), so that they are only searched once."""
+
+    def __init__(self, getter: Callable[[Any], ValueT], *, depends_on: Iterable[str] = ()) -> None:
+        self.getter = getter
+        self.depends_on = frozenset(depends_on)
+        self.__doc__ = getter.__doc__
+        self.__set_name__(object, getter.__name__)
+
+    def __set_name__(self, owner: Type[object], name: str) -> None:
+        self.name = name
+        self.attribute = f"_cached_{name.lstrip('_')}"
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[Type[object]] = None) -> "CachedProperty[ValueT]":
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[Type[object]] = None) -> ValueT:
+        ...
+
+    def __get__(
+        self, instance: Optional[object], owner: Optional[Type[object]] = None
+    ) -> Union[ValueT, "CachedProperty[ValueT]"]:
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.attribute)  # type: ignore[no-any-return]
+        except AttributeError:
+            value = self.getter(instance)
+            setattr(instance, self.attribute, value)
+            return value
+
+    def is_cached(self, instance: object) -> bool:
+        """Whether the value was already computed for the given instance."""
+        return hasattr(instance, self.attribute)
+
+    def invalidate(self, instance: object) -> bool:
+        """Drop the value stored within the given instance. Return whether there was any."""
+        try:
+            delattr(instance, self.attribute)
+        except AttributeError:
+            return False
+        return True
+
+    @staticmethod
+    def get_all(cls: Type[object]) -> Tuple["CachedProperty[Any]", ...]:
+        """All cached properties available within the given class, including the inherited ones."""
+        if cls not in CachedProperty._by_class:
+            properties: Dict[str, CachedProperty[Any]] = {}
+            for base in reversed(cls.__mro__):
+                for name, value in vars(base).items():
+                    if isinstance(value, CachedProperty):
+                        properties[name] = value
+                    else:
+                        properties.pop(name, None)  # Overridden by anything else
+            CachedProperty._by_class[cls] = tuple(properties.values())
+        return CachedProperty._by_class[cls]
+
+
+@overload
+def cached_property(getter: Callable[[Any], ValueT]) -> CachedProperty[ValueT]:
+    ...
+
+
+@overload
+def cached_property(*, depends_on: Iterable[str]) -> Callable[[Callable[[Any], ValueT]], CachedProperty[ValueT]]:
+    ...
+
+
+def cached_property(
+    getter: Optional[Callable[[Any], ValueT]] = None, *, depends_on: Iterable[str] = ()
+) -> Union[CachedProperty[ValueT], Callable[[Callable[[Any], ValueT]], CachedProperty[ValueT]]]:
+    """
+    Decorator that turns a method without arguments into a `CachedProperty`.
+
+    Args:
+        getter (Optional[Callable[[Any], ValueT]], optional): Method decorated, if used without arguments.
+        depends_on (Iterable[str], optional): Attributes (including other cached properties) the value is computed
+            from. The value is only invalidated if any of them changes. Defaults to none.
+
+    Example:
+        class MyClass:
+            @cached_property(depends_on=("data",))
+            def size(self) -> int:
+                return len(self.data)
+    """
+    if getter is not None:
+        return CachedProperty(getter, depends_on=depends_on)
+    return lambda getter: CachedProperty(getter, depends_on=depends_on)
+
+
+def invalidate_cached_properties(instance: object, *changed: str) -> Set[str]:
+    """
+    Drop the values of the cached properties of an instance that depend on any of the changed attributes.
+
+    Dependencies are followed transitively: properties that depend on an invalidated property are also invalidated.
+
+    Args:
+        instance (object): Instance whose cached values are dropped.
+        *changed (str): Attributes that changed. If none is given, all cached values are dropped.
+
+    Returns:
+        Set[str]: Name of the cached properties whose value was dropped.
+    """
+    properties = CachedProperty.get_all(type(instance))
+    if not changed:
+        return {property_.name for property_ in properties if property_.invalidate(instance)}
+
+    dropped: Set[str] = set()
+    visited: Set[str] = set()
+    pending = set(changed)
+    while pending:
+        names: Set[str] = set()
+        for property_ in properties:
+            if property_.name not in visited and property_.depends_on & pending:
+                visited.add(property_.name)
+                names.add(property_.name)
+                if property_.invalidate(instance):
+                    dropped.add(property_.name)
+        pending = names
+    return dropped
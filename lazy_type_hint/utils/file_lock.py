@@ -0,0 +1,131 @@
+"""Lock that coordinates multiple processes through a file."""
+
+import os
+import sys
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Type, Union
+
+
+class FileLockError(Exception):
+    """Raised by `FileLock` class."""
+
+
+class FileLock:
+    """Exclusive lock shared among processes, based on an OS-level lock held on a file.
+
+    The operating system releases the lock if the process holding it dies, so no stale locks are left behind.
+    Acquiring it again with the same instance while it is already held is allowed.
+    """
+
+    path: Path
+    """Path to the file used as lock. It is created if it does not exist."""
+    timeout: Optional[float]
+    """Maximum seconds to wait for the lock. If None, it waits forever."""
+    poll_interval: float
+    """Seconds to wait between two consecutive attempts to acquire the lock."""
+
+    _file_descriptor: Optional[int]
+    _n_acquired: int
+    """Number of times the lock was acquired and not yet released by this same instance."""
+
+    def __init__(self, path: Union[str, Path], *, timeout: Optional[float] = None, poll_interval: float = 0.01) -> None:
+        """
+        Initialize the lock without acquiring it.
+
+        Args:
+            path (Union[str, Path]): Path to the file used as lock. It is created if it does not exist.
+            timeout (Optional[float], optional): Maximum seconds to wait for the lock. If None, it waits forever.
+                Defaults to None.
+            poll_interval (float, optional): Seconds to wait between two consecutive attempts to acquire the lock.
+                Defaults to 0.01.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._file_descriptor = None
+        self._n_acquired = 0
+
+    @property
+    def is_locked(self) -> bool:
+        """Whether the lock is held by this instance."""
+        return self._n_acquired > 0
+
+    def acquire(self) -> None:
+        """Block until the lock is acquired or the timeout expires."""
+        if self._n_acquired:
+            self._n_acquired += 1
+            return
+
+        file_descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        start = time.monotonic()
+        while not self._try_lock(file_descriptor):
+            if self.timeout is not None and time.monotonic() - start >= self.timeout:
+                os.close(file_descriptor)
+                raise FileLockError(f"The lock {self.path} could not be acquired within {self.timeout} seconds.")
+            time.sleep(self.poll_interval)
+        self._file_descriptor = file_descriptor
+        self._n_acquired = 1
+
+    def release(self) -> None:
+        """Release the lock. It is only released once it was released as many times as it was acquired."""
+        if not self._n_acquired:
+            raise FileLockError(f"The lock {self.path} cannot be released as it was not acquired.")
+        self._n_acquired -= 1
+        if self._n_acquired or self._file_descriptor is None:
+            return
+        try:
+            self._unlock(self._file_descriptor)
+        finally:
+            os.close(self._file_descriptor)
+            self._file_descriptor = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.release()
+
+    if sys.platform == "win32":
+
+        @staticmethod
+        def _try_lock(file_descriptor: int) -> bool:
+            import msvcrt
+
+            try:
+                msvcrt.locking(file_descriptor, msvcrt.LK_NBLCK, 1)
+            except OSError:
+                return False
+            return True
+
+        @staticmethod
+        def _unlock(file_descriptor: int) -> None:
+            import msvcrt
+
+            os.lseek(file_descriptor, 0, os.SEEK_SET)
+            msvcrt.locking(file_descriptor, msvcrt.LK_UNLCK, 1)
+
+    else:
+
+        @staticmethod
+        def _try_lock(file_descriptor: int) -> bool:
+            import fcntl
+
+            try:
+                fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return False
+            return True
+
+        @staticmethod
+        def _unlock(file_descriptor: int) -> None:
+            import fcntl
+
+            fcntl.flock(file_descriptor, fcntl.LOCK_UN)
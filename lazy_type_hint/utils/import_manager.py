@@ -1,7 +1,7 @@
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, Final, List, Literal, Mapping, Optional, Sequence, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Final, Iterator, List, Literal, Mapping, Optional, Sequence, Set, Tuple
 
 from typing_extensions import TypeGuard
 
@@ -124,6 +124,25 @@ class ImportManager:
     def _is_importable_symbol(self, symbol: str) -> TypeGuard[KEYWORDS_AVAILABLE]:
         return symbol in self.PACKAGE
 
+    def get_used_in(self, code: str) -> "ImportManager":
+        """
+        Get a new manager with only the imports whose names are referenced within the given code.
+
+        Args:
+            code (str): Code that uses the imports.
+
+        Returns:
+            ImportManager: The manager with the imports used.
+        """
+        names = set(re.findall(r"\b\w+\b", code))
+        return ImportManager(
+            {keyword for keyword in self._set if keyword == "annotations" or self._get_name(keyword) in names}
+        )
+
+    def _get_name(self, keyword: KEYWORDS_AVAILABLE) -> str:
+        """Name under which the given keyword is available once imported."""
+        return {"pandas": "pd", "numpy": "np"}.get(keyword, self.PACKAGE[keyword][-1])
+
     def format(self, *, line_length: int = 90) -> str:
         import_statements: Dict[str, List[str]] = defaultdict(list)
         for keyword in self._set:
@@ -160,3 +179,6 @@ class ImportManager:
 
     def __contains__(self, element: object) -> bool:
         return element in self._set
+
+    def __iter__(self) -> Iterator[KEYWORDS_AVAILABLE]:
+        return iter(self._set)
@@ -0,0 +1,135 @@
+"""Persistent cache that keeps the type hints inferred from data across different runs."""
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Final, Mapping, Optional, Union
+
+from lazy_type_hint.utils.utils import atomic_write, get_stable_repr
+
+
+class InferenceCacheError(Exception):
+    """Raised by `InferenceCache` class."""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_implementation_fingerprint() -> str:
+    """Fingerprint of the installed source code, so that entries created by any other version are never used."""
+    package_dir = Path(__file__).parents[1]
+    hasher = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        stat = path.stat()
+        hasher.update(f"{path.relative_to(package_dir).as_posix()}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return hasher.hexdigest()
+
+
+class InferenceCache:
+    """Cache stored on disk that can be shared among processes and runs.
+
+    Each entry is a single file, so that entries can be written and read concurrently. Whenever the total size of
+    the entries exceeds the maximum one, the least recently used ones are removed.
+    """
+
+    directory: Path
+    """Directory where the entries are stored."""
+    max_size: int
+    """Maximum size, in bytes, of all entries."""
+
+    suffix: Final = ".json"
+    """Suffix of the files that store each entry."""
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, *, max_size: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize the cache. Nothing is read or written until it is used.
+
+        Args:
+            directory (Optional[Union[str, Path]], optional): Directory where the entries are stored. If None,
+                `lazy_type_hint` within the user cache directory is used (`$XDG_CACHE_HOME` or `~/.cache`).
+                Defaults to None.
+            max_size (int, optional): Maximum size, in bytes, of all entries. Defaults to 64 MiB.
+        """
+        if max_size <= 0:
+            raise InferenceCacheError(f"Maximum size must be greater than 0. Given one is: {max_size}")
+        self.directory = Path(directory) if directory is not None else self.get_default_directory()
+        self.max_size = max_size
+
+    @staticmethod
+    def get_default_directory() -> Path:
+        cache_home = os.environ.get("XDG_CACHE_HOME")
+        return (Path(cache_home) if cache_home else Path.home() / ".cache") / "lazy_type_hint"
+
+    @staticmethod
+    def get_key(*parts: object) -> str:
+        """
+        Build the key of an entry from everything the cached value depends on.
+
+        The key also depends on the source code of this package, so that entries are invalidated on upgrades.
+
+        Args:
+            *parts (object): Objects built from types, tuples, frozensets and literals.
+
+        Returns:
+            str: The key.
+        """
+        content = get_stable_repr((_get_implementation_fingerprint(), *parts))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Mapping[str, str]]:
+        """
+        Get the value stored for the given key, marking it as the most recently used one.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            Optional[Mapping[str, str]]: The value, or None if it was not found.
+        """
+        path = self._get_path(key)
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value if isinstance(value, dict) else None
+
+    def put(self, key: str, value: Mapping[str, str]) -> None:
+        """
+        Store the value for the given key and evict the least recently used entries if needed.
+
+        Errors while writing are ignored, as the cache is only meant to speed things up.
+
+        Args:
+            key (str): Key of the entry.
+            value (Mapping[str, str]): JSON-serializable value.
+        """
+        with contextlib.suppress(OSError):
+            os.makedirs(self.directory, exist_ok=True)
+            with atomic_write(self._get_path(key)) as file:
+                json.dump(value, file)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob(f"*{self.suffix}"):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until all of them fit within the maximum size."""
+        entries: Dict[Path, os.stat_result] = {}
+        for path in self.directory.glob(f"*{self.suffix}"):
+            with contextlib.suppress(OSError):  # It might have been removed by another process
+                entries[path] = path.stat()
+        total_size = sum(stat.st_size for stat in entries.values())
+        for path in sorted(entries, key=lambda path: entries[path].st_mtime_ns):
+            if total_size <= self.max_size:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            total_size -= entries[path].st_size
@@ -0,0 +1,143 @@
+"""Collector that records where the time is spent while building and rendering the trees."""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import ClassVar, Dict, Final, Iterator, List, Literal, Mapping, Optional
+
+TIMED_OPERATIONS = Literal["construction", "hash", "render"]
+
+
+@dataclass
+class NodeStats:
+    """Statistics gathered for all nodes built from the same `DataTypeTree` subclass.
+
+    Times are given in seconds and exclude the time spent by any other node (such as the children), so that adding
+    them up across subclasses gives the total time spent.
+    """
+
+    n_nodes: int = 0
+    """Number of nodes built."""
+    construction_time: float = 0.0
+    """Time spent building the nodes."""
+    hash_time: float = 0.0
+    """Time spent computing the hash of the nodes. It is only computed once per node."""
+    render_time: float = 0.0
+    """Time spent building the string representation of the nodes."""
+    n_merges: int = 0
+    """Number of similar `TypedDict`-based children merged into a single one."""
+    n_skipped_elements: int = 0
+    """Number of elements that were not parsed due to `check_max_n_elements_within_container`."""
+
+
+class Instrumentation:
+    """Collect, per `DataTypeTree` subclass, statistics about the nodes built while it is active.
+
+    Only one collector can be active at a time. Whenever none is, the trees skip any measurement.
+    """
+
+    stats: Dict[str, NodeStats]
+    """Statistics gathered, by name of the `DataTypeTree` subclass."""
+
+    active: ClassVar[Optional["Instrumentation"]] = None
+    """Collector that is currently recording, if any."""
+
+    _children_times: List[float]
+    """Time spent by the nodes measured within each of the measurements in progress."""
+
+    _time_attributes: Final = {"construction": "construction_time", "hash": "hash_time", "render": "render_time"}
+
+    def __init__(self) -> None:
+        self.stats = {}
+        self._children_times = []
+
+    @contextmanager
+    def activate(self) -> Iterator["Instrumentation"]:
+        """Record the statistics of all the nodes built or rendered within the context."""
+        previous = Instrumentation.active
+        Instrumentation.active = self
+        try:
+            yield self
+        finally:
+            Instrumentation.active = previous
+
+    def start(self) -> float:
+        """Start a new measurement, which can hold further measurements within it."""
+        self._children_times.append(0.0)
+        return time.perf_counter()
+
+    def stop(self, name: str, operation: TIMED_OPERATIONS, start: float) -> None:
+        """
+        Stop the last measurement started.
+
+        Args:
+            name (str): Name of the `DataTypeTree` subclass measured.
+            operation (TIMED_OPERATIONS): Operation measured.
+            start (float): Value returned by `start`.
+        """
+        elapsed = time.perf_counter() - start
+        own_time = elapsed - self._children_times.pop()
+        if self._children_times:
+            self._children_times[-1] += elapsed
+        stats = self._get_stats(name)
+        attribute = self._time_attributes[operation]
+        setattr(stats, attribute, getattr(stats, attribute) + own_time)
+        if operation == "construction":
+            stats.n_nodes += 1
+
+    def record_merge(self, name: str, n_merged: int) -> None:
+        """Record that `n_merged` children of a node were merged into a single one."""
+        self._get_stats(name).n_merges += n_merged
+
+    def record_skipped_elements(self, name: str, n_skipped: int) -> None:
+        """Record that `n_skipped` elements of a node were not parsed."""
+        self._get_stats(name).n_skipped_elements += n_skipped
+
+    def get_total(self) -> NodeStats:
+        """Statistics gathered across all subclasses."""
+        total = NodeStats()
+        for stats in self.stats.values():
+            for field in fields(NodeStats):
+                setattr(total, field.name, getattr(total, field.name) + getattr(stats, field.name))
+        return total
+
+    def to_dict(self) -> Mapping[str, Mapping[str, float]]:
+        """Statistics gathered as builtin objects, by name of the `DataTypeTree` subclass."""
+        return {
+            name: {field.name: getattr(stats, field.name) for field in fields(NodeStats)}
+            for name, stats in self.stats.items()
+        }
+
+    def format(self) -> str:
+        """Table that summarizes the statistics gathered, sorted by total time spent. Times are given in ms."""
+        header = ("Node", "Nodes", "Construction", "Hash", "Render", "Merges", "Skipped")
+        rows = [header]
+        for name, stats in sorted(self.stats.items(), key=lambda item: -self._get_total_time(item[1])):
+            rows.append(
+                (
+                    name,
+                    str(stats.n_nodes),
+                    f"{stats.construction_time * 1000:.3f}",
+                    f"{stats.hash_time * 1000:.3f}",
+                    f"{stats.render_time * 1000:.3f}",
+                    str(stats.n_merges),
+                    str(stats.n_skipped_elements),
+                )
+            )
+        widths = [max(len(row[idx]) for row in rows) for idx in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if not idx else cell.rjust(width)
+                for idx, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+
+    def _get_stats(self, name: str) -> NodeStats:
+        if name not in self.stats:
+            self.stats[name] = NodeStats()
+        return self.stats[name]
+
+    @staticmethod
+    def _get_total_time(stats: NodeStats) -> float:
+        return stats.construction_time + stats.hash_time + stats.render_time
@@ -0,0 +1,207 @@
+"""Line-offset index that allows random access to the records of a JSONL file.
+
+The index is built once by scanning the file and persisted alongside it. Later on, any record can be
+located by its position without reading the rest of the file, so sampling K records costs K reads.
+"""
+
+import io
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import IO, Final, List, Optional, Tuple, Union
+
+from lazy_type_hint.utils.utils import atomic_write
+
+
+class JsonlLineIndexError(Exception):
+    """Raised by `JsonlLineIndex` class."""
+
+
+class JsonlLineIndex:
+    """Memory-mapped index that maps each non-empty line of a JSONL file to its byte offset."""
+
+    path: Path
+    """Path to the JSONL file being indexed."""
+    index_path: Path
+    """Path where the index is persisted."""
+
+    suffix: Final = ".lthidx"
+    """Suffix appended to the JSONL file name to build the path of its index."""
+    _magic: Final = b"LTHIDX01"
+    """Identifier written at the beginning of the index file."""
+    _header: Final = struct.Struct("<8sQQQ")
+    """Magic, size of the indexed file, modification time (ns) of the indexed file and number of lines."""
+    _offset: Final = struct.Struct("<Q")
+    _chunk_size: Final = 1 << 16
+    """Number of offsets buffered in memory before they are written to disk while building the index."""
+
+    _n_lines: int
+    _index_file: Optional[mmap.mmap]
+    _data_file: Optional[mmap.mmap]
+    _in_memory_index: Optional[bytes]
+    """Index kept in memory because it could not be persisted (e.g. read-only directory). None if persisted."""
+
+    def __init__(self, path: Union[str, Path], *, rebuild: bool = False) -> None:
+        """
+        Initialize the index, building it only if it does not exist or it is outdated.
+
+        Args:
+            path (Union[str, Path]): Path to the JSONL file.
+            rebuild (bool, optional): Build the index even if a valid one was found. Defaults to False.
+        """
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise JsonlLineIndexError(f"The given file does not exist: {self.path}")
+        self.index_path = self.path.with_name(self.path.name + self.suffix)
+        self._index_file = None
+        self._data_file = None
+        self._in_memory_index = None
+        if rebuild or not self._is_index_up_to_date():
+            self.build()
+        self._n_lines = self._read_header()[3]
+
+    def __len__(self) -> int:
+        """Number of records found within the file."""
+        return self._n_lines
+
+    def __enter__(self) -> "JsonlLineIndex":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory maps opened by the index."""
+        for memory_map in (self._index_file, self._data_file):
+            if memory_map is not None:
+                memory_map.close()
+        self._index_file = None
+        self._data_file = None
+
+    def build(self) -> None:
+        """
+        Scan the whole JSONL file once and persist the byte offset of every non-empty line.
+
+        If the index cannot be persisted (e.g. the directory of the file is read-only), it is kept in memory instead.
+        """
+        self.close()
+        self._in_memory_index = None
+        try:
+            with atomic_write(self.index_path, binary=True) as index_file:
+                self._write_index(index_file)
+        except OSError:
+            buffer = io.BytesIO()
+            self._write_index(buffer)
+            self._in_memory_index = buffer.getvalue()
+
+    def _write_index(self, index_file: IO[bytes]) -> None:
+        """Write the header and the byte offset of every non-empty line of the JSONL file."""
+        stat = os.stat(self.path)
+        n_lines = 0
+        index_file.write(self._header.pack(self._magic, 0, 0, 0))
+        if stat.st_size:
+            with open(self.path, "rb") as data_file, mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                offsets = array("Q")
+                start = 0
+                while start < stat.st_size:
+                    end = data.find(b"\n", start)
+                    if end == -1:
+                        end = stat.st_size
+                    if data[start:end].strip():
+                        offsets.append(start)
+                    start = end + 1
+                    if len(offsets) >= self._chunk_size:
+                        n_lines += len(offsets)
+                        self._write_offsets(index_file, offsets)
+                        offsets = array("Q")
+                n_lines += len(offsets)
+                self._write_offsets(index_file, offsets)
+        index_file.seek(0)
+        index_file.write(self._header.pack(self._magic, stat.st_size, stat.st_mtime_ns, n_lines))
+
+    def read_record(self, idx: int) -> object:
+        """
+        Parse the record located at the given position.
+
+        Args:
+            idx (int): Position of the record, ignoring empty lines.
+
+        Returns:
+            object: The parsed JSON record.
+        """
+        if not 0 <= idx < self._n_lines:
+            raise IndexError(f"Record {idx} is out of range. The file only contains {self._n_lines} records.")
+        data = self._get_data_file()
+        start = self._get_offset(idx)
+        end = data.find(b"\n", start)
+        return json.loads(data[start : end if end != -1 else len(data)])
+
+    def sample(self, n_records: int, *, seed: Optional[int] = None) -> List[object]:
+        """
+        Parse a uniform random sample of records without reading the rest of the file.
+
+        Args:
+            n_records (int): Number of records to sample. If it is greater than the number of records, all of
+                them are returned.
+            seed (Optional[int], optional): Seed used to draw the sample. Defaults to None.
+
+        Returns:
+            List[object]: The parsed records, in the same order as they appear within the file.
+        """
+        if n_records <= 0:
+            raise JsonlLineIndexError("At least one record must be sampled.")
+        if n_records >= self._n_lines:
+            indices = list(range(self._n_lines))
+        else:
+            indices = sorted(random.Random(seed).sample(range(self._n_lines), n_records))
+        return [self.read_record(idx) for idx in indices]
+
+    def _is_index_up_to_date(self) -> bool:
+        if not self.index_path.exists():
+            return False
+        try:
+            magic, size, mtime_ns, n_lines = self._read_header()
+        except (struct.error, OSError, ValueError):
+            return False
+        finally:
+            self.close()
+        stat = os.stat(self.path)
+        expected_size = self._header.size + n_lines * self._offset.size
+        return (
+            magic == self._magic
+            and size == stat.st_size
+            and mtime_ns == stat.st_mtime_ns
+            and os.path.getsize(self.index_path) == expected_size
+        )
+
+    def _read_header(self) -> Tuple[bytes, int, int, int]:
+        return self._header.unpack_from(self._get_index_file(), 0)
+
+    def _get_offset(self, idx: int) -> int:
+        return int(self._offset.unpack_from(self._get_index_file(), self._header.size + idx * self._offset.size)[0])
+
+    def _get_index_file(self) -> Union[mmap.mmap, bytes]:
+        if self._in_memory_index is not None:
+            return self._in_memory_index
+        if self._index_file is None:
+            with open(self.index_path, "rb") as file:
+                self._index_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._index_file
+
+    def _get_data_file(self) -> mmap.mmap:
+        if self._data_file is None:
+            with open(self.path, "rb") as file:
+                self._data_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._data_file
+
+    @staticmethod
+    def _write_offsets(file: IO[bytes], offsets: "array[int]") -> None:
+        """Write the offsets in little-endian order, no matter the byte order of the platform."""
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        offsets.tofile(file)
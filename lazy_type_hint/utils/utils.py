@@ -1,8 +1,14 @@
 import ast
+import importlib
 import os
 import subprocess
+import tempfile
+from contextlib import contextmanager
 from itertools import zip_longest
-from typing import Any, Final, List, Protocol, TypeVar, Union, cast
+from pathlib import Path
+from typing import IO, Any, Callable, Final, Iterator, List, Mapping, Optional, Tuple, Union
+
+from typing_extensions import TypeAlias
 
 TAB: Final = "    "
 
@@ -59,62 +65,116 @@ def compare_ast(
         return node1 == node2  # type: ignore
 
 
-class _AnyMethodProtocol(Protocol):
-    __name__: str
+def check_if_command_available(tool: str) -> bool:
+    """
+    Check if a command is available.
 
-    def __call__(*args: Any, **kwargs: Any) -> Any:
-        ...
+    Args:
+        tool (str): The name of the command to check.
 
+    Returns:
+        bool: True if the command is available, False otherwise.
+    """
+    result = subprocess.run(f"{tool} --help", stdout=open(os.devnull, "wb"), stderr=open(os.devnull, "wb"), shell=True)
+    return bool(not result.returncode)
+
+
+@contextmanager
+def atomic_write(path: Union[str, Path], *, binary: bool = False, encoding: str = "utf-8") -> Iterator[IO[Any]]:
+    """
+    Open a temporary file that atomically replaces `path` once everything was written successfully.
+
+    If an exception is raised while writing, `path` is left untouched and the temporary file is removed.
 
-_AnyMethodT = TypeVar("_AnyMethodT", bound=_AnyMethodProtocol)
+    Args:
+        path (Union[str, Path]): The path of the file to write.
+        binary (bool, optional): Whether the file is opened in binary mode. Defaults to False.
+        encoding (str, optional): The encoding used to write the file in text mode. Defaults to "utf-8".
+
+    Yields:
+        IO[Any]: The handler of the temporary file.
+    """
+    path = Path(path)
+    permissions = os.stat(path).st_mode if path.exists() else 0o644
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        if binary:
+            with os.fdopen(file_descriptor, "wb") as file:
+                yield file
+        else:
+            with os.fdopen(file_descriptor, "w", encoding=encoding) as file:
+                yield file
+        os.chmod(tmp_path, permissions)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
-def cache_returned_value_per_instance(method: _AnyMethodT) -> _AnyMethodT:
+def get_stable_repr(obj: object) -> str:
     """
-    A decorator that caches the returned value of a method.
+    Get a representation of a hashable object that does not change across different interpreters.
 
-    This decorator can be used to cache the returned value of a method
-    to improve performance by avoiding redundant computations.
+    Types are represented by their qualified name and the elements of sets are sorted, so that neither the memory
+    addresses nor the hash randomization affect the result.
 
     Args:
-        method: The method to be decorated.
+        obj (object): Object to represent. It is expected to be built from types, tuples, frozensets and literals.
 
     Returns:
-        The decorated method.
-
-    Usage:
-        @cache_returned_value
-        def my_method(self, args, **kwargs):
-            # method implementation
-
-    Example:
-        class MyClass:
-            @cache_returned_value
-            def my_method(self, args, **kwargs):
-                # method implementation
+        str: The stable representation.
     """
+    if isinstance(obj, type):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    if isinstance(obj, (tuple, list)):
+        return "(" + ",".join(get_stable_repr(element) for element in obj) + ")"
+    if isinstance(obj, (frozenset, set)):
+        return "{" + ",".join(sorted(get_stable_repr(element) for element in obj)) + "}"
+    return repr(obj)
 
-    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
-        cache_attr = f"{method.__name__}____"
-        if hasattr(self, cache_attr):
-            return getattr(self, cache_attr)
-        else:
-            result = method(self, *args, **kwargs)
-            setattr(self, cache_attr, result)
-            return result
 
-    return cast(_AnyMethodT, wrapper)
+FileStat: TypeAlias = Tuple[int, int, int]
+"""Inode, modification time (ns) and size of a file."""
 
 
-def check_if_command_available(tool: str) -> bool:
+def get_file_stat(path: Union[str, Path]) -> Optional[FileStat]:
     """
-    Check if a command is available.
+    Get the information used to detect whether a file was modified or replaced.
 
     Args:
-        tool (str): The name of the command to check.
+        path (Union[str, Path]): The path of the file.
 
     Returns:
-        bool: True if the command is available, False otherwise.
+        Optional[FileStat]: Inode, modification time (ns) and size of the file. None if it does not exist.
     """
-    result = subprocess.run(f"{tool} --help", stdout=open(os.devnull, "wb"), stderr=open(os.devnull, "wb"), shell=True)
-    return bool(not result.returncode)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def register_lazy_subclasses(module_name: str, package: str, subclasses: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Register the subclasses that parse the types of a third-party package, so that they are only imported when needed.
+
+    Args:
+        module_name (str): Module that exposes the subclasses (usually `__name__` of the caller).
+        package (str): Top-level package of the types parsed (e.g. `pandas`).
+        subclasses (Mapping[str, str]): Module that defines each subclass, by the name of the subclass.
+
+    Returns:
+        Callable[[str], Any]: Module-level `__getattr__` that imports the subclasses the first time they are accessed.
+    """
+    from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree  # Avoid circular import
+
+    for module in subclasses.values():
+        DataTypeTree.register_lazy_subclass(package, module)
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name in subclasses:
+            return getattr(importlib.import_module(subclasses[name]), name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
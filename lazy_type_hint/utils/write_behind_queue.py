@@ -0,0 +1,144 @@
+"""Queue that postpones file writes so that they can be performed in the background."""
+
+import atexit
+import contextlib
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Optional, Tuple
+
+from lazy_type_hint.utils.utils import atomic_write
+
+
+class WriteBehindQueueError(Exception):
+    """Raised by `WriteBehindQueue` class."""
+
+
+class WriteBehindQueue:
+    """In-memory queue of files to be written, flushed periodically by a background thread and at exit.
+
+    Only the latest content queued for each path is kept, and content identical to the one last written to that
+    same path is never queued again.
+    """
+
+    flush_interval: Optional[float]
+    """Seconds between two consecutive flushes performed in the background. If None, no thread is started."""
+    prepare_flush: Optional[Callable[[], ContextManager[None]]]
+    """Context entered around each flush, before the pending files are taken. None if not needed."""
+
+    _pending: Dict[Path, Tuple[str, str]]
+    """Content and its hash to be written for each path."""
+    _written: Dict[Path, str]
+    """Hash of the last content written for each path."""
+    _lock: threading.Lock
+    """Lock that protects the pending and written entries."""
+    _flush_lock: threading.Lock
+    """Lock that prevents two flushes from writing at the same time."""
+    _stop: threading.Event
+    _thread: Optional[threading.Thread]
+
+    def __init__(
+        self,
+        flush_interval: Optional[float] = 1.0,
+        *,
+        prepare_flush: Optional[Callable[[], ContextManager[None]]] = None,
+    ) -> None:
+        """
+        Initialize the queue and start its background thread.
+
+        Args:
+            flush_interval (Optional[float], optional): Seconds between two consecutive flushes performed in the
+                background. If None, the queue is only flushed on demand or at exit. Defaults to 1.0.
+            prepare_flush (Optional[Callable[[], ContextManager[None]]], optional): Context entered around each
+                flush, i.e. to acquire the locks required to write the files or to queue newer content before they
+                are taken. Defaults to None.
+        """
+        if flush_interval is not None and flush_interval <= 0:
+            raise WriteBehindQueueError(f"Flush interval must be greater than 0. Given one is: {flush_interval}")
+        self.flush_interval = flush_interval
+        self.prepare_flush = prepare_flush
+        self._pending = {}
+        self._written = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        if flush_interval is not None:
+            self._thread = threading.Thread(target=self._run, name="WriteBehindQueue", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def __len__(self) -> int:
+        """Number of files waiting to be written."""
+        return len(self._pending)
+
+    def put(self, path: Path, content: str) -> bool:
+        """
+        Queue the content to be written to the given path.
+
+        Args:
+            path (Path): Path of the file to be written.
+            content (str): Content of the file.
+
+        Returns:
+            bool: False if the content was discarded because it matches the one already written or queued.
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        with self._lock:
+            if path in self._pending:
+                if self._pending[path][1] == content_hash:
+                    return False
+            elif self._written.get(path) == content_hash:
+                return False
+            self._pending[path] = (content, content_hash)
+        return True
+
+    def get_pending(self, path: Path) -> Optional[str]:
+        """Content queued to be written to the given path, if any."""
+        with self._lock:
+            entry = self._pending.get(path)
+        return entry[0] if entry is not None else None
+
+    def discard(self) -> None:
+        """Drop all pending writes and forget what was written so far."""
+        with self._flush_lock, self._lock:
+            self._pending.clear()
+            self._written.clear()
+
+    def flush(self) -> None:
+        """Write all pending files, each of them atomically."""
+        prepare_flush: Callable[[], ContextManager[None]] = self.prepare_flush or contextlib.nullcontext
+        with prepare_flush(), self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            while pending:
+                path, (content, content_hash) = next(iter(pending.items()))
+                try:
+                    os.makedirs(path.parent, exist_ok=True)
+                    with atomic_write(path) as file:
+                        file.write(content)
+                except BaseException:
+                    with self._lock:  # Files not written are queued again, unless newer content was queued meanwhile
+                        for path_not_written, entry in pending.items():
+                            self._pending.setdefault(path_not_written, entry)
+                    raise
+                with self._lock:
+                    self._written[path] = content_hash
+                del pending[path]
+
+    def close(self) -> None:
+        """Stop the background thread and write all pending files."""
+        atexit.unregister(self.close)
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        assert self.flush_interval is not None
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001 Pending files are kept and written in the next flush
+                continue
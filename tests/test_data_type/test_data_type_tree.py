@@ -1,29 +1,38 @@
 import itertools
+import os
 import re
 import subprocess
+import sys
 import timeit
+from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
 from types import MappingProxyType
+from unittest.mock import patch
 from typing import (
     Any,
     Callable,
     Dict,
     Final,
+    Hashable,
     Iterable,
     List,
     Literal,
     Mapping,
+    Sequence,
     Set,
     Tuple,
 )
 
+import numpy as np
 import pandas as pd
 import pytest
+import yaml
 
 from lazy_type_hint.data_type_tree import DataTypeTree, data_type_tree_factory
+from lazy_type_hint.data_type_tree.generic_type import MappingDataTypeTree
 from lazy_type_hint.strategies import ParsingStrategies
-from lazy_type_hint.utils import TAB, check_if_command_available
+from lazy_type_hint.utils import TAB, Instrumentation, check_if_command_available
 
 
 @dataclass(frozen=True)
@@ -266,25 +275,89 @@ class TestHash:
         assert should_be_equal == (hash(tree1) == hash(tree2))
 
 
+class TestFingerprint:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "data1, data2, strategies, should_be_equal",
+        [
+            ([1, 2, 3], [4, 5, 6], ParsingStrategies(), True),
+            ([1, "str", 3], ["a", 5, 6], ParsingStrategies(), True),
+            ([1, 2, 3], {1, 2, 3}, ParsingStrategies(), False),
+            ([1, 2, 3], [1, "str"], ParsingStrategies(), False),
+            ((1, "str"), ("str", 1), ParsingStrategies(), False),
+            ((1, "str"), ("str", 1), ParsingStrategies(tuple_size_strategy="any size"), True),
+            ([int], [str], ParsingStrategies(), False),
+            ({"name": "Patrick"}, {"name": "Peter"}, ParsingStrategies(), True),
+            ({"name": "Patrick"}, {"age": "22"}, ParsingStrategies(), False),
+            ({"name": "Patrick", "age": 22}, {"age": 22, "name": "Patrick"}, ParsingStrategies(), False),
+            ({"name": "Patrick", "doc": "A"}, {"name": "Patrick", "doc": "B"}, ParsingStrategies(key_used_as_doc="doc"), False),
+            (np.array([1], dtype=np.int32), np.array([1], dtype=np.float64), ParsingStrategies(), False),
+            (pd.DataFrame({"A": [1]}), pd.DataFrame({"B": [2]}), ParsingStrategies(), False),
+        ],
+    )
+    # fmt: on
+    def test_fingerprint(
+        self, data1: object, data2: object, should_be_equal: bool, strategies: ParsingStrategies
+    ) -> None:
+        tree1 = data_type_tree_factory(data1, name="Example", strategies=strategies)
+        tree2 = data_type_tree_factory(data2, name="Example", strategies=strategies)
+        assert should_be_equal == (tree1.get_fingerprint() == tree2.get_fingerprint())
+
+    def test_fingerprint_depends_on_name(self) -> None:
+        tree1 = data_type_tree_factory([1, {"a": 1}], name="Example1")
+        tree2 = data_type_tree_factory([1, {"a": 1}], name="Example2")
+        assert tree1.get_fingerprint() != tree2.get_fingerprint()
+
+    def test_fingerprint_without_docstrings(self) -> None:
+        tree1 = data_type_tree_factory({"a": 1, "___docstring_hidden_key_a": "Doc"}, name="Example")
+        tree2 = data_type_tree_factory({"a": 2}, name="Example")
+        assert tree1.get_fingerprint() != tree2.get_fingerprint()
+        assert tree1.get_fingerprint(include_docstrings=False) == tree2.get_fingerprint(include_docstrings=False)
+
+    def test_fingerprint_is_stable_across_interpreters(self) -> None:
+        code = (
+            "from lazy_type_hint.data_type_tree import data_type_tree_factory;"
+            "print(data_type_tree_factory([1, 'a', {'b': (1.0, None)}, {1, 'c'}], name='Example').get_fingerprint())"
+        )
+        fingerprints = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout
+            for seed in ("1", "2")
+        }
+        assert len(fingerprints) == 1
+
+
 @pytest.mark.usefixtures("_serial")
 class TestCheckNMaxElementsFeature:
     @pytest.mark.parametrize("type_", [set, frozenset, list, tuple])
     def test_sequence_and_set(self, type_: Any) -> None:
-        iterable = type_(list(range(1_000_000)))
-        n = 10  # Number of executions
-        total_time = timeit.timeit(
-            lambda: data_type_tree_factory(
-                iterable, name="Example", strategies=ParsingStrategies(check_max_n_elements_within_container=100)
-            ),
-            number=n,
+        # Use containers, as leaves of the same type are shared among siblings and only parsed once
+        iterable = type_([(idx,) for idx in range(1_000_000)])
+        n = 10  # Number of executions within each repetition. The fastest repetition is kept to reduce the noise
+        total_time = min(
+            timeit.repeat(
+                lambda: data_type_tree_factory(
+                    iterable, name="Example", strategies=ParsingStrategies(check_max_n_elements_within_container=100)
+                ),
+                number=n,
+                repeat=3,
+            )
         )
 
         average_time = total_time / n
-        total_time = timeit.timeit(
-            lambda: data_type_tree_factory(
-                iterable, name="Example", strategies=ParsingStrategies(check_max_n_elements_within_container=200)
-            ),
-            number=n,
+        total_time = min(
+            timeit.repeat(
+                lambda: data_type_tree_factory(
+                    iterable, name="Example", strategies=ParsingStrategies(check_max_n_elements_within_container=200)
+                ),
+                number=n,
+                repeat=3,
+            )
         )
 
         assert average_time * 1.5 < (
@@ -295,25 +368,31 @@ class TestCheckNMaxElementsFeature:
     @pytest.mark.parametrize("type_", [dict, MappingProxyType])
     def test_mapping(self, strategy: Literal["dict", "Mapping"], type_: Any) -> None:
         n_elements = 1_000_000
-        dct = type_(dict(zip(range(n_elements), range(n_elements))))
-        n = 10  # Number of executions
-        total_time = timeit.timeit(
-            lambda: data_type_tree_factory(
-                dct,
-                name="Example",
-                strategies=ParsingStrategies(dict_strategy=strategy, check_max_n_elements_within_container=100),
-            ),
-            number=n,
+        dct = type_({idx: (idx,) for idx in range(n_elements)})  # Leaves of the same type would be shared
+        n = 10  # Number of executions within each repetition. The fastest repetition is kept to reduce the noise
+        total_time = min(
+            timeit.repeat(
+                lambda: data_type_tree_factory(
+                    dct,
+                    name="Example",
+                    strategies=ParsingStrategies(dict_strategy=strategy, check_max_n_elements_within_container=100),
+                ),
+                number=n,
+                repeat=3,
+            )
         )
 
         average_time = total_time / n
-        total_time = timeit.timeit(
-            lambda: data_type_tree_factory(
-                dct,
-                name="Example",
-                strategies=ParsingStrategies(dict_strategy=strategy, check_max_n_elements_within_container=200),
-            ),
-            number=n,
+        total_time = min(
+            timeit.repeat(
+                lambda: data_type_tree_factory(
+                    dct,
+                    name="Example",
+                    strategies=ParsingStrategies(dict_strategy=strategy, check_max_n_elements_within_container=200),
+                ),
+                number=n,
+                repeat=3,
+            )
         )
 
         assert average_time * 1.5 < (
@@ -325,11 +404,151 @@ class TestCachedHash:
     def test(self, generate_tree_based_list: Callable[[int, int], List[Any]]) -> None:
         lst = generate_tree_based_list(depth=10, n_elements=3)  # type: ignore
         tree = data_type_tree_factory(lst, name="Example")
+        DataTypeTree._hash.invalidate(tree)
+        calls: List[DataTypeTree] = []
+        get_hash: Callable[[DataTypeTree], Hashable] = type(tree)._get_hash
+
+        def counting_get_hash(self: DataTypeTree) -> Hashable:
+            calls.append(self)
+            return get_hash(self)
+
+        with patch.object(type(tree), "_get_hash", counting_get_hash):
+            assert hash(tree) == hash(tree)
+        assert calls == [tree]
+
+
+class TestCacheInvalidation:
+    def test_rename_after_rendering(self) -> None:
+        tree = data_type_tree_factory({"a": [1, 2], "b": {"c": [1.0]}}, name="Example")
+        tree.get_str_all_nodes()
+        tree.rename("Renamed")
+        assert "Example" not in tree.get_str_all_nodes()
+        assert "class Renamed(TypedDict):" in tree.get_str_all_nodes()
+
+    def test_rename_descendant_invalidates_ancestors(self) -> None:
+        tree = data_type_tree_factory({"a": {"b": {"c": [1, 2]}}}, name="Example")
+        original_hash = hash(tree)
+        tree.get_str_all_nodes()
+        assert isinstance(tree, MappingDataTypeTree)
+        child = tree.children["a"]
+        assert isinstance(child, MappingDataTypeTree)
+        child.children["b"].rename("Other")
+        assert "class Other(TypedDict):" in tree.get_str_all_nodes()
+        assert "b: Other" in tree.get_str_all_nodes()
+        assert hash(tree) == original_hash
+
+    def test_arguments_are_not_cached(self) -> None:
+        tree = data_type_tree_factory({"a": [1, 2]}, name="Example")
+        with_imports = tree.get_strs_all_nodes_unformatted(include_imports=True)
+        without_imports = tree.get_strs_all_nodes_unformatted(include_imports=False)
+        assert with_imports[1:] == without_imports
+
+
+@pytest.mark.parametrize("include_imports", (True, False))
+@pytest.mark.parametrize("make_parent_class_inherit_from_original_type", (True, False))
+def test_iter_str_all_nodes(include_imports: bool, make_parent_class_inherit_from_original_type: bool) -> None:
+    tree = data_type_tree_factory({"a": [1, 2], "b": {"c": {"d": "e"}}, "f": {"g": 1}}, name="Example")
+    kwargs = {
+        "include_imports": include_imports,
+        "make_parent_class_inherit_from_original_type": make_parent_class_inherit_from_original_type,
+    }
+    assert "".join(tree.iter_str_all_nodes(**kwargs)) == tree.get_str_all_nodes(**kwargs)
+
+
+class TestDeepStructures:
+    DEPTH: Final = 2 * sys.getrecursionlimit()
+    """Depth beyond what any recursive implementation would support."""
 
-        time_before_cache = timeit.timeit(lambda: hash(tree), number=1)
-        time_after_cache = timeit.timeit(lambda: hash(tree), number=1)
+    @staticmethod
+    def nest(depth: int, wrap: Callable[[object], object]) -> object:
+        data: object = 1
+        for _ in range(depth):
+            data = wrap(data)
+        return data
 
-        assert time_after_cache < time_before_cache / 1_000
+    @pytest.mark.parametrize(
+        "wrap",
+        [
+            pytest.param(lambda data: [data], id="list"),
+            pytest.param(lambda data: {"a": data, "b": 2}, id="dict"),
+            pytest.param(lambda data: (data,), id="tuple"),
+        ],
+    )
+    def test_deep_structure(self, wrap: Callable[[object], object]) -> None:
+        tree = data_type_tree_factory(self.nest(self.DEPTH, wrap), name="Example")
+        assert tree.height == self.DEPTH
+        assert tree == data_type_tree_factory(self.nest(self.DEPTH, wrap), name="Other")
+        assert tree.get_fingerprint()
+        tree.rename("Renamed")
+        strs = tree.get_strs_all_nodes_unformatted(include_imports=False)
+        assert len(strs) >= self.DEPTH - 1
+        assert strs[-1] == tree.get_str_top_node()
+        assert all(re.match(r"(class )?Renamed", string) for string in strs)
+
+    def test_same_output_as_shallow_structure(self) -> None:
+        tree = data_type_tree_factory(self.nest(3, lambda data: {"a": data}), name="Example")
+        expected = data_type_tree_factory({"a": {"a": {"a": 1}}}, name="Example")
+        assert tree.get_str_all_nodes() == expected.get_str_all_nodes()
+
+    def test_print_all_children(self, capsys: pytest.CaptureFixture[str]) -> None:
+        data_type_tree_factory([{"a": 1}], name="Example").print_all_children()
+        assert capsys.readouterr().out.splitlines() == [
+            "ListDataTypeTree-Example",
+            "    DictDataTypeTree-ExampleDict",
+            "        InstanceDataTypeTree-ExampleDictA",
+        ]
+
+
+class TestSharedObjects:
+    def test_shared_objects_are_parsed_once(self) -> None:
+        shared = {"a": 1, "b": [1.0, 2.0]}
+        instrumentation = Instrumentation()
+        with instrumentation.activate():
+            tree = data_type_tree_factory({f"key{idx}": shared for idx in range(1000)}, name="Example")
+        assert instrumentation.stats["DictDataTypeTree"].n_nodes == 2
+        assert len({id(child) for child in tree}) == 1
+
+    @pytest.mark.parametrize(
+        "shared, sibling",
+        [
+            ({"a": 1, "b": [1.0, 2.0]}, {"a": 2, "b": [3.0]}),
+            ({"a": 1}, {"a": 1, "b": "x"}),
+            ((1, "a"), (2, "b")),
+        ],
+    )
+    def test_shared_objects_at_different_depths(self, shared: object, sibling: object) -> None:
+        data = {"x": shared, "y": [shared, sibling], "z": [[shared]]}
+        tree = data_type_tree_factory(data, name="Example")
+        expected = data_type_tree_factory(deepcopy(data), name="Example").get_str_all_nodes()
+        assert tree.get_str_all_nodes() == expected
+        for node in tree._iter_post_order():
+            for child in node.get_children():
+                assert child.parent is node
+                assert child.depth == node.depth + 1
+
+    def test_yaml_anchors(self) -> None:
+        data = yaml.safe_load(
+            "base: &base\n  a: 1\nitems:\n  - *base\n  - <<: *base\n    b: x\nnested:\n  inner: *base\n"
+        )
+        tree = data_type_tree_factory(data, name="Example")
+        assert "ExampleItemsDict(TypedDict)" in tree.get_str_all_nodes()
+        assert "ExampleNestedInner(TypedDict)" in tree.get_str_all_nodes()
+
+    def test_leaves_are_shared_among_siblings(self) -> None:
+        tree = data_type_tree_factory({"a": 1, "b": 2, "c": "3", "d": (4, 5)}, name="Example")
+        assert isinstance(tree, MappingDataTypeTree)
+        children = tree.children
+        items = children["d"].children
+        assert isinstance(items, Sequence)
+        assert children["a"] is children["b"]
+        assert children["a"] is not children["c"]
+        assert children["a"] is not items[0]
+        assert items[0] is items[1]
+
+    def test_nodes_do_not_hold_dict(self) -> None:
+        tree = data_type_tree_factory({"a": [1, (2, 3)], "b": {1}}, name="Example")
+        for node in tree._iter_post_order():
+            assert not hasattr(node, "__dict__"), type(node).__name__
 
 
 class TestRenameDeclaration:
@@ -345,3 +564,35 @@ class TestRenameDeclaration:
     )
     def test(self, declaration: str, new_name: str, expected_output: Tuple[str, str]) -> None:
         assert expected_output == DataTypeTree.rename_declaration(declaration, new_name=new_name)
+
+
+class TestLazySubclasses:
+    @staticmethod
+    def run(code: str) -> str:
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parents[2],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    def test_third_party_packages_are_not_imported(self) -> None:
+        code = "import sys, lazy_type_hint; print(any(name in sys.modules for name in ('pandas', 'numpy')))"
+        assert self.run(code) == "False"
+
+    def test_subclasses_are_imported_when_needed(self) -> None:
+        code = (
+            "import numpy as np, pandas as pd; "
+            "from lazy_type_hint.data_type_tree import DataTypeTree; "
+            "print(*(DataTypeTree.get_subclass(data).__name__ for data in (pd.DataFrame(), pd.Series(), np.zeros(1))))"
+        )
+        assert self.run(code) == "PandasDataFrameDataTypeTree PandasSeriesDataTypeTree NumpyDataTypeTree"
+
+    def test_register_lazy_subclass(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(DataTypeTree, "lazy_subclasses", {})
+        DataTypeTree.register_lazy_subclass("fractions", "non_existing_module")
+        from fractions import Fraction
+
+        assert DataTypeTree.get_subclass(Fraction(1, 2)) is DataTypeTree.subclasses[int]
+        assert not DataTypeTree.lazy_subclasses
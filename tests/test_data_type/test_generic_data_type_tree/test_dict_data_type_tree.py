@@ -52,9 +52,7 @@ class TestGetStrPy:
         "tree, expected_output, expected_n_children",
         [
             (
-                DictDataTypeTree(
-                    {}, name=NAME, strategies=ParsingStrategies(min_height_to_define_type_alias=0)
-                ),
+                DictDataTypeTree({}, name=NAME, strategies=ParsingStrategies(min_height_to_define_type_alias=0)),
                 f"""class {NAME}(TypedDict):
 {TAB}...""",
                 0,
@@ -660,7 +658,7 @@ class TestDictMetadata:
             expected_output
             == DictMetadata(
                 data, hidden_key_prefix="", strategies=ParsingStrategies(dict_strategy="TypedDict")
-            )._all_keys_are_parsable()
+            )._all_keys_are_parsable
         )
 
     @pytest.mark.parametrize(
@@ -1,3 +1,4 @@
+import itertools
 from typing import Any, Final, Iterator
 
 import pytest
@@ -24,3 +25,19 @@ class TestIterator:
         assert expected_str == tree.get_str_top_node()
         assert "Iterator" in tree.imports
         assert "TypeAlias" in tree.imports
+
+    def test_elements_are_replayed(self) -> None:
+        data = iter(range(10))
+        tree = IteratorDataTypeTree(
+            data, name=self.NAME, strategies=ParsingStrategies(check_max_n_elements_within_container=3)
+        )
+        assert tree.sample == (0, 1, 2)
+        assert next(data) == 3  # Only the sampled elements were consumed
+        assert list(tree.data) == [0, 1, 2, *range(4, 10)]
+
+    def test_infinite_iterator(self) -> None:
+        tree = IteratorDataTypeTree(
+            itertools.count(), name=self.NAME, strategies=ParsingStrategies(check_max_n_elements_within_container=5)
+        )
+        assert f"{self.NAME}: TypeAlias = Iterator[int]" == tree.get_str_top_node()
+        assert list(itertools.islice(tree.data, 7)) == list(range(7))
@@ -0,0 +1,164 @@
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, List, NamedTuple, Optional
+
+import pytest
+
+from lazy_type_hint.data_type_tree import data_type_tree_factory
+from lazy_type_hint.data_type_tree.generic_type import ObjectDataTypeTree
+from lazy_type_hint.data_type_tree.simple_data_type_tree import ReferenceDataTypeTree
+from lazy_type_hint.strategies import ParsingStrategies
+from lazy_type_hint.utils import TAB
+
+
+@dataclass
+class Address:
+    street: str
+    number: int
+
+
+class Point(NamedTuple):
+    x: float
+    y: float
+
+
+@dataclass(frozen=True)
+class FrozenAddress:
+    street: str
+
+    @property
+    def upper_street(self) -> str:
+        return self.street.upper()
+
+
+class Slotted:
+    __slots__ = ("a", "b", "_c")
+
+    def __init__(self) -> None:
+        self.a = 1
+        self._c = 2
+
+
+class Person:
+    def __init__(self, name: str, parent: "Optional[Person]" = None) -> None:
+        self.name = name
+        self.parent = parent
+        self._private = 1
+
+
+class Empty:
+    pass
+
+
+class TestObjectDataTypeTree:
+    NAME: Final = "Example"
+    STRATEGIES: Final = ParsingStrategies(instance_strategy="Protocol")
+
+    @pytest.mark.parametrize(
+        "data, expected_str",
+        [
+            (Address("street", 1), f"class {NAME}(Protocol):\n{TAB}street: str\n{TAB}number: int"),
+            (
+                Point(1.0, 2.0),
+                f"class {NAME}(Protocol):\n{TAB}@property\n{TAB}def x(self) -> float: ...\n"
+                f"{TAB}@property\n{TAB}def y(self) -> float: ...",
+            ),
+            (
+                FrozenAddress("street"),
+                f"class {NAME}(Protocol):\n{TAB}@property\n{TAB}def street(self) -> str: ...\n"
+                f"{TAB}@property\n{TAB}def upper_street(self) -> str: ...",
+            ),
+            (Slotted(), f"class {NAME}(Protocol):\n{TAB}a: int"),
+            (Person("name"), f"class {NAME}(Protocol):\n{TAB}name: str\n{TAB}parent: Optional[object]"),
+            (Empty(), f"class {NAME}(Protocol):\n{TAB}..."),
+        ],
+    )
+    def test_get_str_top_node(self, data: object, expected_str: str) -> None:
+        tree = data_type_tree_factory(data, self.NAME, strategies=self.STRATEGIES)
+        assert isinstance(tree, ObjectDataTypeTree)
+        assert tree.get_str_top_node() == expected_str
+        assert "Protocol" in tree.imports
+
+    def test_properties(self) -> None:
+        class WithProperties:
+            def __init__(self) -> None:
+                self.a = 1
+
+            @property
+            def read_only(self) -> int:
+                return 1
+
+            @property
+            def settable(self) -> int:
+                return 1
+
+            @settable.setter
+            def settable(self, value: int) -> None:
+                pass
+
+            @property
+            def failing(self) -> int:
+                raise RuntimeError
+
+        tree = data_type_tree_factory(WithProperties(), self.NAME, strategies=self.STRATEGIES)
+        assert tree.get_str_top_node() == (
+            f"class {self.NAME}(Protocol):\n{TAB}@property\n{TAB}def read_only(self) -> int: ...\n"
+            f"{TAB}settable: int\n{TAB}a: int"
+        )
+
+    @pytest.mark.parametrize("data", ["Address('street', 1)", "Point(1.0, 2.0)", "FrozenAddress('street')"])
+    def test_instances_are_compatible_with_their_protocol(self, data: str, tmp_path: Path) -> None:
+        mypy_api = pytest.importorskip("mypy.api")
+        tree = data_type_tree_factory(eval(data), self.NAME, strategies=self.STRATEGIES)
+        path = tmp_path / "module.py"
+        classes = "\n\n".join(inspect.getsource(class_) for class_ in (Address, Point, FrozenAddress))
+        path.write_text(
+            "from dataclasses import dataclass\nfrom typing import NamedTuple\n"
+            f"{tree.get_str_all_nodes()}\n\n{classes}\n\nvalue: {self.NAME} = {data}\n"
+        )
+        stdout, _, exit_status = mypy_api.run(["--strict", "--no-incremental", "--config-file=", str(path)])
+        assert exit_status == 0, stdout
+
+    def test_nested_instances(self) -> None:
+        tree = data_type_tree_factory(Person("child", Person("parent")), self.NAME, strategies=self.STRATEGIES)
+        assert (
+            tree.get_str_top_node() == f"class {self.NAME}(Protocol):\n{TAB}name: str\n{TAB}parent: {self.NAME}Parent"
+        )
+        assert f"class {self.NAME}Parent(Protocol):" in tree.get_str_all_nodes()
+
+    def test_cycles_are_represented_by_recursive_protocols(self) -> None:
+        person = Person("name")
+        person.parent = person
+        tree = data_type_tree_factory(person, self.NAME, strategies=self.STRATEGIES)
+        assert isinstance(tree, ObjectDataTypeTree)
+        assert isinstance(tree.children["parent"], ReferenceDataTypeTree)
+        assert tree.get_str_top_node() == f'class {self.NAME}(Protocol):\n{TAB}name: str\n{TAB}parent: "{self.NAME}"'
+
+    def test_instances_with_same_attributes_share_the_same_type(self) -> None:
+        data: List[object] = [Address("a", 1), Address("b", 2)]
+        tree = data_type_tree_factory(data, self.NAME, strategies=self.STRATEGIES)
+        assert len({hash(child) for child in tree}) == 1
+
+    @pytest.mark.parametrize("data", [1, "a", None, Address("street", 1)])
+    def test_default_strategy(self, data: object) -> None:
+        assert not isinstance(data_type_tree_factory(data, self.NAME), ObjectDataTypeTree)
+
+    @pytest.mark.parametrize("data", [1, "a", None, [1], (1, 2), {"a": 1}])
+    def test_builtin_types_are_not_introspected(self, data: object) -> None:
+        assert ObjectDataTypeTree.get_layout(data) is None
+        tree = data_type_tree_factory(data, self.NAME, strategies=self.STRATEGIES)
+        assert not isinstance(tree, ObjectDataTypeTree)
+
+    def test_layout_is_analyzed_once_per_class(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ObjectDataTypeTree, "_layouts", {})
+        calls: List[object] = []
+        analyze_layout = ObjectDataTypeTree._analyze_layout
+
+        def count_calls(data: object) -> object:
+            calls.append(data)
+            return analyze_layout(data)
+
+        monkeypatch.setattr(ObjectDataTypeTree, "_analyze_layout", staticmethod(count_calls))
+        data_type_tree_factory([Address(str(idx), idx) for idx in range(100)], self.NAME, strategies=self.STRATEGIES)
+        assert sum(isinstance(data, Address) for data in calls) == 1
@@ -1,7 +1,8 @@
-from typing import Callable, Final, Iterable
+from typing import Callable, Final, Iterable, Optional, Sequence, Tuple
 
 import pytest
 
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.data_type_tree.generic_type import TupleDataTypeTree
 from lazy_type_hint.strategies import ParsingStrategies
 
@@ -61,6 +62,81 @@ class TestGetStrPy:
         assert_imports(tree, self.imports_to_check)
 
 
+class TestMaxFixedTupleSize:
+    NAME: Final = "Example"
+    """Name that will be used to create the class."""
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "data, max_fixed_tuple_size, expected_output",
+        [
+            ((1, 2, 3), 3, f"{NAME}: TypeAlias = Tuple[int, int, int]"),
+            ((1, 2, 3), 2, f"{NAME}: TypeAlias = Tuple[int, ...]"),
+            ((1, 2, 3), None, f"{NAME}: TypeAlias = Tuple[int, int, int]"),
+            ((1, 2, "a"), 2, f"{NAME}: TypeAlias = Tuple[int, int, str]"),
+            (((1,), (2,), ("a",)), 2, f"{NAME}: TypeAlias = Tuple[Union[{NAME}Tuple, {NAME}Tuple2], ...]"),
+            (tuple(range(1000)), 100, f"{NAME}: TypeAlias = Tuple[int, ...]"),
+        ],
+    )
+    # fmt: on
+    def test_max_fixed_tuple_size(
+        self, data: Tuple[object, ...], max_fixed_tuple_size: Optional[int], expected_output: str
+    ) -> None:
+        strategies = ParsingStrategies(
+            tuple_size_strategy="fixed",
+            max_fixed_tuple_size=max_fixed_tuple_size,
+            min_height_to_define_type_alias=0,
+        )
+        tree = TupleDataTypeTree(data, name=self.NAME, strategies=strategies)
+        assert expected_output == tree.get_str_top_node()
+
+    def test_all_elements_are_checked(self) -> None:
+        strategies = ParsingStrategies(max_fixed_tuple_size=2, check_max_n_elements_within_container=2)
+        tree = TupleDataTypeTree((1, 2, "a"), name=self.NAME, strategies=strategies)
+        assert tree.is_fixed_size
+
+    def test_size_is_type_hinted_by_default(self) -> None:
+        tree = TupleDataTypeTree(tuple(range(1000)), name=self.NAME)
+        assert tree.is_fixed_size
+
+    def test_max_fixed_tuple_size_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="max_fixed_tuple_size"):
+            ParsingStrategies(max_fixed_tuple_size=0)
+
+
+class TestRunLengthChildren:
+    NAME: Final = "Example"
+    """Name that will be used to create the class."""
+
+    @staticmethod
+    def get_children(tree: TupleDataTypeTree) -> Sequence[DataTypeTree]:
+        assert isinstance(tree.children, Sequence)
+        return tree.children
+
+    def test_runs_share_the_same_child(self) -> None:
+        strategies = ParsingStrategies(tuple_size_strategy="fixed", max_fixed_tuple_size=None)
+        tree = TupleDataTypeTree((1, 2, 3, "a", "b", 4), name=self.NAME, strategies=strategies)
+        children = self.get_children(tree)
+        assert len(children) == 6
+        assert children[0] is children[1] is children[2]
+        assert children[3] is children[4]
+        assert children[2] is children[5]  # Leaves of the same type are shared among siblings
+        assert f"{self.NAME}: TypeAlias = Tuple[int, int, int, str, str, int]" == tree.get_str_top_node()
+
+    def test_containers_are_not_shared(self) -> None:
+        strategies = ParsingStrategies(tuple_size_strategy="fixed", max_fixed_tuple_size=None)
+        tree = TupleDataTypeTree(([1], [1]), name=self.NAME, strategies=strategies)
+        children = self.get_children(tree)
+        assert children[0] is not children[1]
+
+    def test_same_container_is_shared(self) -> None:
+        strategies = ParsingStrategies(tuple_size_strategy="fixed", max_fixed_tuple_size=None)
+        container = [1]
+        tree = TupleDataTypeTree((container, container), name=self.NAME, strategies=strategies)
+        children = self.get_children(tree)
+        assert children[0] is children[1]
+
+
 class TestTypeAliasHeight:
     NAME: Final = "Example"
     """Name that will be used to create the class."""
@@ -1,10 +1,14 @@
-from typing import Final, List, Sequence
+import functools
+import inspect
+from typing import Any, Callable, Dict, Final, List, Sequence, TypeVar
 
 import pytest
 
 from lazy_type_hint.data_type_tree.simple_data_type_tree.function_data_type_tree import FunctionDataTypeTree
 from lazy_type_hint.utils import TAB
 
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
 
 class TestLambda:
     NAME: Final = "Example"
@@ -152,3 +156,108 @@ class TestFunction:
         assert "Protocol" in tree.imports
         for expected_import in expected_imports:
             assert expected_import in tree.imports
+
+
+# fmt: off
+def func13(a): return a if a else None  # type: ignore
+def func14(): return None  # type: ignore
+def func15():  # type: ignore
+    def inner(): return 2  # type: ignore
+    return inner
+def func16():  # type: ignore
+    def inner(): return 2  # type: ignore
+# fmt: on
+
+
+class TestFunctionBytecode:
+    NAME: Final = "Example"
+
+    @pytest.mark.parametrize(
+        "data, expected_out",
+        [
+            [func13, True],
+            [func14, False],
+            [func15, True],
+            [func16, False],
+        ],
+    )
+    def test_has_return(self, data: object, expected_out: bool) -> None:
+        tree = FunctionDataTypeTree(data, self.NAME)
+        assert expected_out == tree._has_return()
+
+    def test_source_is_not_needed(self) -> None:
+        namespace: Dict[str, Any] = {}
+        exec("def func(a: int):\n    return a", namespace)
+        tree = FunctionDataTypeTree(namespace["func"], self.NAME)
+        assert tree.get_str_top_node() == f"class {self.NAME}(Protocol):\n{TAB}def __call__(a: int) -> Any: ..."
+        assert "Any" in tree.imports
+
+    @pytest.mark.parametrize(
+        "data, expected_args",
+        [
+            [len, "(obj, /)"],
+            [sorted, "(iterable, /, *, key=None, reverse=False)"],
+            [[].append, "(object, /)"],
+        ],
+    )
+    def test_unknown_return_is_any(self, data: object, expected_args: str) -> None:
+        tree = FunctionDataTypeTree(data, self.NAME)
+        assert tree._has_return() is None
+        assert tree.get_str_top_node() == f"class {self.NAME}(Protocol):\n{TAB}def __call__{expected_args} -> Any: ..."
+        assert "Any" in tree.imports
+
+
+class TestCallableInfoCache:
+    NAME: Final = "Example"
+
+    @staticmethod
+    def make_callback(default: int) -> Callable[[int], int]:
+        def callback(a: int, b: int = default) -> int:
+            return a + b
+
+        return callback
+
+    def test_info_is_shared_among_same_functions(self) -> None:
+        tree1 = FunctionDataTypeTree(self.make_callback(1), self.NAME)
+        tree2 = FunctionDataTypeTree(self.make_callback(1), self.NAME)
+        assert tree1.callable_info is tree2.callable_info
+
+    def test_info_depends_on_defaults(self) -> None:
+        tree1 = FunctionDataTypeTree(self.make_callback(1), self.NAME)
+        tree2 = FunctionDataTypeTree(self.make_callback(2), self.NAME)
+        assert tree1.callable_info is not tree2.callable_info
+        assert tree1.get_str_top_node() != tree2.get_str_top_node()
+
+    def test_cache_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(FunctionDataTypeTree, "_callable_info_cache", {})
+        monkeypatch.setattr(FunctionDataTypeTree, "callable_info_cache_size", 2)
+        for default in range(5):
+            FunctionDataTypeTree(self.make_callback(default), self.NAME).callable_info  # noqa: B018
+        assert len(FunctionDataTypeTree._callable_info_cache) == 2
+
+    @staticmethod
+    def decorator(func: FuncT) -> FuncT:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    def test_wrappers_are_identified_by_the_wrapped_function(self) -> None:
+        @self.decorator
+        def f(a, b):  # type: ignore
+            pass
+
+        @self.decorator
+        def g(x):  # type: ignore
+            return 1
+
+        assert FunctionDataTypeTree(f, self.NAME).get_str_top_node().endswith("def __call__(a, b) -> None: ...")
+        assert FunctionDataTypeTree(g, self.NAME).get_str_top_node().endswith("def __call__(x) -> Any: ...")
+
+    def test_explicit_signatures_are_not_cached(self) -> None:
+        callback = self.make_callback(1)
+        callback.__signature__ = inspect.signature(lambda x: x)  # type: ignore[attr-defined]
+        tree = FunctionDataTypeTree(callback, self.NAME)
+        assert tree._get_callable_key(callback) is None
+        assert tree.get_str_top_node().endswith("def __call__(x) -> Any: ...")
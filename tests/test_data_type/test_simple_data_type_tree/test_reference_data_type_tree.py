@@ -0,0 +1,52 @@
+from typing import Dict, Final, List, Sequence
+
+from lazy_type_hint.data_type_tree import data_type_tree_factory
+from lazy_type_hint.data_type_tree.generic_type import MappingDataTypeTree
+from lazy_type_hint.data_type_tree.simple_data_type_tree.reference_data_type_tree import ReferenceDataTypeTree
+from lazy_type_hint.utils import TAB
+
+
+class TestCycles:
+    NAME: Final = "Example"
+
+    def test_self_referencing_list(self) -> None:
+        data: List[object] = [1]
+        data.append(data)
+        tree = data_type_tree_factory(data, self.NAME)
+        assert tree.is_recursive
+        assert tree.get_str_top_node() == f'{self.NAME}: TypeAlias = List[Union["{self.NAME}", int]]'
+
+    def test_self_referencing_typed_dict(self) -> None:
+        data: Dict[str, object] = {"name": "node"}
+        data["child"] = data
+        tree = data_type_tree_factory(data, self.NAME)
+        assert isinstance(tree, MappingDataTypeTree)
+        reference = tree.children["child"]
+        assert isinstance(reference, ReferenceDataTypeTree)
+        assert reference.target is tree
+        assert tree.get_str_top_node() == f'class {self.NAME}(TypedDict):\n{TAB}name: str\n{TAB}child: "{self.NAME}"'
+
+    def test_nested_cycle_is_defined_as_type_alias(self) -> None:
+        inner: Dict[int, object] = {}
+        inner[1] = inner
+        tree = data_type_tree_factory({"a": inner}, self.NAME)
+        assert f'{self.NAME}A: TypeAlias = Dict[int, "{self.NAME}A"]' in tree.get_str_all_nodes()
+
+    def test_indirect_cycle(self) -> None:
+        data: Dict[str, object] = {}
+        data["children"] = [data]
+        tree = data_type_tree_factory(data, self.NAME)
+        assert isinstance(tree, MappingDataTypeTree)
+        items = tree.children["children"].children
+        assert isinstance(items, Sequence)
+        reference = items[0]
+        assert isinstance(reference, ReferenceDataTypeTree)
+        assert reference.distance == 2
+        assert f'children: List["{self.NAME}"]' in tree.get_str_all_nodes()
+
+    def test_same_cycle_gives_same_hash(self) -> None:
+        first: List[object] = []
+        first.append(first)
+        second: List[object] = []
+        second.append(second)
+        assert data_type_tree_factory(first, self.NAME) == data_type_tree_factory(second, "Other")
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Union
+from typing import Final, List, Tuple, Union
 
 import pytest
 
@@ -348,3 +348,101 @@ class LazyTypeHint:
     def method3(self):
         pass"""
         assert str(file_handler) == expected_string
+
+
+class TestPyFileModifierIndex:
+    """Test that the index of methods and assignments is kept in sync with the lines of the file."""
+
+    @staticmethod
+    def assert_index_is_in_sync(file_handler: PyFileModifier) -> None:
+        expected = PyFileModifier(str(file_handler))
+        for method_name in ("method", "method1", "method2", "run", ""):
+            assert expected.search_method(method_name) == file_handler.search_method(method_name)
+            assert expected.search_decorator(decorator_name="overload", method_name=method_name) == (
+                file_handler.search_decorator(decorator_name="overload", method_name=method_name)
+            )
+        for variable in ("a", "b", "c"):
+            assert expected.search_assignment(variable) == file_handler.search_assignment(variable)
+
+    @pytest.fixture
+    def file_handler(self) -> PyFileModifier:
+        return PyFileModifier("a = 1\n\ndef method1():\n    b: int = 2\n\n@overload\ndef method2(): ...\nc = 3")
+
+    def test_add_line(self, file_handler: PyFileModifier) -> None:
+        file_handler.add_line(0, "b = 2")
+        file_handler.add_line(4, "@overload")
+        file_handler.add_line(5, "def run(): ...")
+        file_handler.add_line(-1, "def method(a = 1): ...")
+        file_handler.add_imports(["import os", "import sys"])
+        self.assert_index_is_in_sync(file_handler)
+        assert [(2, "2"), (8, "2")] == file_handler.search_assignment("b")
+
+    def test_replace_line(self, file_handler: PyFileModifier) -> None:
+        file_handler.replace_line(2, "def run():")
+        file_handler.replace_line(0, "b = 4")
+        file_handler.replace_assignement("c", "5")
+        self.assert_index_is_in_sync(file_handler)
+        assert [] == file_handler.search_method("method1")
+        assert [] == file_handler.search_assignment("a")
+        assert [(7, "5")] == file_handler.search_assignment("c")
+
+    def test_insert_many_lines_at_the_same_position(self, file_handler: PyFileModifier) -> None:
+        for idx in range(300):
+            file_handler.add_line(file_handler.search_method("method2")[-1], f"def run{idx}(): ...")
+        self.assert_index_is_in_sync(file_handler)
+        assert len(file_handler.search_method("run")) == 300
+
+    def test_lines_are_replaced(self, file_handler: PyFileModifier) -> None:
+        file_handler.lines = ["def run(): ...", "a = 2"]
+        self.assert_index_is_in_sync(file_handler)
+        assert [(1, "2")] == file_handler.search_assignment("a")
+
+
+class TestKeepOnlyInterface:
+    REPRESENTATION: Final = '''import os
+
+
+def _helper() -> None:
+    pass
+
+
+class Loader:
+    """Docstring."""
+
+    path: str
+    """Path."""
+    classes_created: "TypeAlias" = Any
+    """Classes created."""
+
+    @final
+    def __init__(self) -> None:
+        self.path = os.getcwd()
+
+    def _private(self) -> None:
+        pass
+
+    @overload
+    def public(self, a: int) -> None:
+        def nested() -> None:
+            pass
+
+    def __str__(self) -> str:
+        return self.path'''
+
+    def test_keep_only_interface(self) -> None:
+        file_handler = PyFileModifier(self.REPRESENTATION)
+        file_handler.keep_only_interface(class_name="Loader")
+        expected_string = """import os
+
+class Loader:
+    classes_created: 'TypeAlias' = Any
+    'Classes created.'
+
+    @final
+    def __init__(self) -> None:...
+
+    @overload
+    def public(self, a: int) -> None:...
+
+    def __str__(self) -> str:..."""
+        assert expected_string == str(file_handler)
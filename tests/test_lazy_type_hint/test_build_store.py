@@ -0,0 +1,82 @@
+import pytest
+
+from lazy_type_hint.generators.build_store import BuildStore, BuildStoreError, split_module
+
+MODULE_1 = '''from typing import List, TypedDict
+from typing_extensions import TypeAlias
+
+
+class ExampleB(TypedDict):
+    c: int
+
+
+Example1: TypeAlias = List[ExampleB]
+"""Docstring."""
+'''
+
+MODULE_2 = """from __future__ import annotations
+
+from typing import List, TypedDict
+
+
+class ExampleB(TypedDict):
+    c: int
+
+
+class Example2(TypedDict):
+    b: List[ExampleB]
+"""
+
+
+class TestSplitModule:
+    def test_split_module(self) -> None:
+        assert [
+            "from typing import List, TypedDict",
+            "from typing_extensions import TypeAlias",
+            "class ExampleB(TypedDict):\n    c: int",
+            'Example1: TypeAlias = List[ExampleB]\n"""Docstring."""',
+        ] == split_module(MODULE_1)
+
+    def test_decorators_are_kept(self) -> None:
+        assert ["import dataclasses", "@dataclasses.dataclass\nclass A:\n    a: int"] == split_module(
+            "import dataclasses\n\n@dataclasses.dataclass\nclass A:\n    a: int\n"
+        )
+
+    def test_invalid_module(self) -> None:
+        with pytest.raises(BuildStoreError):
+            split_module("class A(")
+
+
+class TestBuildStore:
+    @pytest.fixture
+    def build_store(self) -> BuildStore:
+        return BuildStore()
+
+    def test_shared_statements_are_stored_once(self, build_store: BuildStore) -> None:
+        statements_1 = build_store.add(MODULE_1)
+        statements_2 = build_store.add(MODULE_2)
+        assert statements_1[2] == statements_2[2]
+        assert all(statement in build_store for statement in statements_1 + statements_2)
+
+    def test_render(self, build_store: BuildStore) -> None:
+        content = build_store.render([build_store.add(MODULE_1), build_store.add(MODULE_2)])
+        assert content.startswith(
+            "from __future__ import annotations\n"
+            "from typing import List, TypedDict\n"
+            "from typing_extensions import TypeAlias\n\n\n"
+        )
+        assert content.count("class ExampleB(TypedDict)") == 1
+        namespace: dict = {}
+        exec(content, namespace)
+        assert {"ExampleB", "Example1", "Example2"} <= set(namespace)
+
+    def test_render_is_stable(self, build_store: BuildStore) -> None:
+        content = build_store.render([build_store.add(MODULE_1)])
+        assert content == build_store.render([build_store.add(content)])
+
+    def test_find_conflicts(self, build_store: BuildStore) -> None:
+        statements_1 = build_store.add(MODULE_1)
+        statements_2 = build_store.add(MODULE_2)
+        statements_3 = build_store.add("class ExampleB:\n    d: str\n")
+        assert not build_store.find_conflicts(statements_2, [statements_1])
+        assert {"ExampleB"} == build_store.find_conflicts(statements_3, [statements_1, statements_2])
@@ -1,10 +1,17 @@
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union, cast
 
 import pytest
 import yaml
 
-from lazy_type_hint.generators.lazy_type_hint import LazyTypeHint
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
+from lazy_type_hint.generators.lazy_type_hint import LazyTypeHint, LazyTypeHintError, Tree
+from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintABC
+from lazy_type_hint.utils import InferenceCache
 
 
 @pytest.fixture
@@ -27,6 +34,54 @@ class TestLazyTypeHintFromData:
         result.to_string()
         result.to_file(Path(tmp_path) / "file.py")
 
+    def test_iterator_elements_are_not_lost(self, lazy_type_hint: LazyTypeHint) -> None:
+        data = iter(range(1000))
+        tree = lazy_type_hint.from_data(data, class_name="Example")
+        assert "Iterator[int]" in tree.to_string()
+        assert list(cast(Iterator[int], tree.data)) == list(range(1000))
+
+
+class TestToFile:
+    @pytest.fixture
+    def tree(self, lazy_type_hint: LazyTypeHint) -> Tree:
+        return lazy_type_hint.from_data({"a": [1, 2], "b": {"c": {"d": "e"}}}, class_name="Example")
+
+    def test_content(self, tree: Tree, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        path.write_text("Previous content")
+        tree.to_file(path)
+        assert path.read_text() == tree.to_string()
+        assert os.listdir(tmp_path) == ["file.py"]
+
+    def test_whole_string_is_not_built(self, tree: Tree, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        expected = tree.to_string()
+        monkeypatch.setattr(DataTypeTree, "get_str_all_nodes", None)
+        tree.to_file(tmp_path / "file.py")
+        assert (tmp_path / "file.py").read_text() == expected
+
+    def test_file_is_untouched_if_writing_fails(
+        self, tree: Tree, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "file.py"
+        path.write_text("Previous content")
+
+        def iter_str_all_nodes(*args: object, **kwargs: object) -> Iterator[str]:  # noqa: ARG001
+            yield "Example = int"
+            raise RuntimeError("Rendering failed")
+
+        monkeypatch.setattr(DataTypeTree, "iter_str_all_nodes", iter_str_all_nodes)
+        with pytest.raises(RuntimeError, match="Rendering failed"):
+            tree.to_file(path)
+        assert path.read_text() == "Previous content"
+        assert os.listdir(tmp_path) == ["file.py"]
+
+    def test_non_existing_dir(self, tree: Tree, tmp_path: Path) -> None:
+        path = tmp_path / "dir" / "file.py"
+        with pytest.raises(ValueError, match="does not exist"):
+            tree.to_file(path)
+        tree.to_file(path, create_non_existing_dir=True)
+        assert path.read_text() == tree.to_string()
+
 
 class TestLazyTypeHintFromYamlFile:
     @pytest.fixture
@@ -60,3 +115,107 @@ class TestLazyTypeHintFromYamlFile:
         result = lazy_type_hint.from_yaml_file(loader=self.yaml_file_loader, path=yaml_file, class_name="Example")
         result.to_string()
         result.to_file(Path(tmp_path) / "file.py")
+
+
+class TestLazyTypeHintFromJsonlFile:
+    @pytest.fixture
+    def jsonl_file(self, tmp_path: str) -> Path:
+        path = Path(tmp_path) / "file.jsonl"
+        path.write_text("\n".join(json.dumps({"name": f"name{idx}", "age": idx}) for idx in range(50)))
+        return path
+
+    @pytest.mark.parametrize("sample_size", [None, 1, 10, 100])
+    def test_from_jsonl_file(self, lazy_type_hint: LazyTypeHint, jsonl_file: Path, sample_size: int) -> None:
+        result = lazy_type_hint.from_jsonl_file(jsonl_file, class_name="Example", sample_size=sample_size, seed=0)
+        string = result.to_string()
+        assert "ExampleDict(TypedDict)" in string
+        assert "Example: TypeAlias = List[ExampleDict]" in string
+
+
+class TestLazyTypeHintCache:
+    @pytest.fixture
+    def cached_lazy_type_hint(self, tmp_path: Path) -> LazyTypeHint:
+        return LazyTypeHint(cache=InferenceCache(tmp_path / "cache"))
+
+    def test_from_data(self, cached_lazy_type_hint: LazyTypeHint, monkeypatch: pytest.MonkeyPatch) -> None:
+        data = {"nested": {"key": "value"}}
+        expected = LazyTypeHint().from_data(data, class_name="Example")
+        assert cached_lazy_type_hint.from_data(data, class_name="Example").to_string() == expected.to_string()
+
+        with monkeypatch.context() as context:
+            context.setattr(LazyTypeHintABC, "from_data", self.fail)
+            result = cached_lazy_type_hint.from_data(data, class_name="Example")
+            assert result.to_string() == expected.to_string()
+            assert result.to_string(include_imports=False) == expected.to_string(include_imports=False)
+            with pytest.raises(AssertionError):
+                cached_lazy_type_hint.from_data(data, class_name="Other")
+
+    def test_from_jsonl_file(
+        self, cached_lazy_type_hint: LazyTypeHint, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "file.jsonl"
+        path.write_text(json.dumps({"name": "name"}))
+        expected = cached_lazy_type_hint.from_jsonl_file(path, class_name="Example", seed=0).to_string()
+
+        with monkeypatch.context() as context:
+            context.setattr(LazyTypeHintABC, "from_data", self.fail)
+            assert cached_lazy_type_hint.from_jsonl_file(path, class_name="Example", seed=0).to_string() == expected
+            path.write_text(json.dumps({"name": 1}))
+            with pytest.raises(AssertionError):
+                cached_lazy_type_hint.from_jsonl_file(path, class_name="Example", seed=0)
+
+    @pytest.mark.parametrize("value", (lambda: None, os.stat, Path, os, Path.cwd, InferenceCache()))
+    def test_data_not_identified_by_its_content_is_not_cached(
+        self, cached_lazy_type_hint: LazyTypeHint, tmp_path: Path, value: object
+    ) -> None:
+        cached_lazy_type_hint.from_data({"key": value}, class_name="Example").to_string()
+        assert not (tmp_path / "cache").exists()
+
+    def test_iterators_are_not_cached(self, cached_lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        data = iter([{"key": 1}, {"key": 2}])
+        tree = cached_lazy_type_hint.from_data([data], class_name="Example")
+        assert not (tmp_path / "cache").exists()
+        assert tree.data == [data]
+
+    def test_data_is_not_kept_when_cached(self, cached_lazy_type_hint: LazyTypeHint) -> None:
+        cached_lazy_type_hint.from_data({"key": 1}, class_name="Example")
+        with pytest.raises(LazyTypeHintError, match="not kept"):
+            cached_lazy_type_hint.from_data({"key": 1}, class_name="Example").data  # noqa: B018
+
+    def test_builtins_are_cached(self, cached_lazy_type_hint: LazyTypeHint, tmp_path: Path) -> None:
+        cached_lazy_type_hint.from_data({"key": {1, 2}, "type": int}, class_name="Example").to_string()
+        assert (tmp_path / "cache").exists()
+
+    def test_sets_are_identified_across_runs(self) -> None:
+        code = (
+            "from lazy_type_hint.generators.lazy_type_hint import LazyTypeHint; "
+            "print(LazyTypeHint._hash_data({'key': {'a', 'b', ('c', frozenset({'d', 'e', 1}))}}))"
+        )
+        hashes = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, "PYTHONHASHSEED": str(seed)},
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            for seed in range(5)
+        }
+        assert len(hashes) == 1
+
+    @staticmethod
+    def fail(*args: object, **kwargs: object) -> None:  # noqa: ARG004
+        raise AssertionError("The data should not be parsed again")
+
+
+class TestLazyTypeHintInstrumentation:
+    def test_instrumentation_is_returned_with_the_tree(self) -> None:
+        tree = LazyTypeHint(instrumentation=True).from_data({"a": [1, 2]}, class_name="Example")
+        assert tree.instrumentation is not None
+        assert tree.instrumentation.stats["DictDataTypeTree"].n_nodes == 1
+        assert tree.instrumentation.stats["DictDataTypeTree"].render_time == 0
+        tree.to_string()
+        assert tree.instrumentation.stats["DictDataTypeTree"].render_time > 0
+
+    def test_instrumentation_is_disabled_by_default(self, lazy_type_hint: LazyTypeHint) -> None:
+        assert lazy_type_hint.from_data({"a": 1}, class_name="Example").instrumentation is None
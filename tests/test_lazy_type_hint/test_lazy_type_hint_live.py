@@ -1,9 +1,17 @@
+import json
+import os
+import subprocess
+import sys
+import threading
 from pathlib import Path
-from typing import Any, Final, Literal, Mapping, Union, cast
+from typing import Any, Final, List, Literal, Mapping, Type, Union, cast
 
 import pytest
 import yaml
 
+from lazy_type_hint.data_type_tree import DataTypeTree
+from lazy_type_hint.file_modifiers import PyFileModifier
+from lazy_type_hint.generators.build_store import BuildStore
 from lazy_type_hint.generators.lazy_type_hint_live import LazyTypeHintLive, LazyTypeHintLiveError
 from lazy_type_hint.strategies import ParsingStrategies
 from lazy_type_hint.utils import Mypy
@@ -186,6 +194,17 @@ class TestLazyTypeHintLiveFromYaml:
         lazy_type_hint_live.from_yaml_file(loader=yaml_file_loader, path=yaml_file, class_name="Example")
 
 
+@pytest.mark.usefixtures("_serial")
+def test_from_jsonl_file(tmp_path: Path) -> None:
+    path = tmp_path / "file.jsonl"
+    path.write_text("\n".join(json.dumps({"a": idx}) for idx in range(10)))
+    assert LazyTypeHintLive().from_jsonl_file(path, class_name="Example", sample_size=None) == [
+        {"a": idx} for idx in range(10)
+    ]
+    this_file_pyi = LazyTypeHintLive._this_file_pyi_path.read_text(encoding="utf-8")
+    assert 'def from_jsonl_file(self, path: Union[str, Path], *, class_name: Literal["Example"]' in this_file_pyi
+
+
 @pytest.mark.usefixtures("_serial")
 class TestLazyTypeHintFromYamlFileMutation:
     CONTENT_FILE: Final = """---
@@ -228,3 +247,372 @@ level1:
     ) -> None:
         output = lazy_type_hint_live.from_yaml_file(loader=yaml_file_loader, path=yaml_file, class_name="Example")
         assert original_content_of_yaml_file == output, "The YAML data was mutated"
+
+
+@pytest.mark.usefixtures("_serial")
+class TestLazyTypeHintLiveRegistry:
+    def test_registry_is_shared(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example1")
+        registry = LazyTypeHintLive._get_registry()
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example2")
+        assert registry is LazyTypeHintLive._get_registry(), "The registry was loaded again"
+        assert {"Example1", "Example2"} == set(LazyTypeHintLive()._get_classes_added())
+
+    def test_registry_is_kept_in_sync(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        record = LazyTypeHintLive._get_registry()["Example"]
+        content_hash = record.content_hash
+        LazyTypeHintLive().from_data([1, "a"], class_name="Example")
+        assert content_hash != LazyTypeHintLive._get_registry()["Example"].content_hash
+
+    def test_registry_is_loaded_from_pyi(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        LazyTypeHintLive._registry = None
+        LazyTypeHintLive._shared_this_file_pyi = None
+        assert ["Example"] == list(LazyTypeHintLive._get_registry())
+
+    def test_registry_missing_source_code(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        LazyTypeHintLive._get_registry()["Example"].path.unlink()
+        LazyTypeHintLive._registry = None
+        with pytest.raises(LazyTypeHintLiveError):
+            LazyTypeHintLive().from_data([1, 2], class_name="Example")
+
+
+@pytest.mark.usefixtures("_serial")
+def test_this_file_pyi_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = str(LazyTypeHintLive._generate_this_file_pyi())
+    monkeypatch.setattr(PyFileModifier, "keep_only_interface", None)
+    assert expected == str(LazyTypeHintLive._generate_this_file_pyi())
+
+
+@pytest.mark.usefixtures("_serial")
+def test_iterator_elements_are_not_lost() -> None:
+    data = (idx for idx in range(1000))
+    assert list(LazyTypeHintLive().from_data(data, class_name="Example")) == list(range(1000))
+
+
+@pytest.mark.usefixtures("_serial")
+class TestLazyTypeHintLiveTransaction:
+    def test_register_many_writes_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        n_writes = 0
+        write_this_file_pyi = LazyTypeHintLive._write_this_file_pyi
+
+        def counted_write() -> None:
+            nonlocal n_writes
+            n_writes += 1
+            write_this_file_pyi()
+
+        monkeypatch.setattr(LazyTypeHintLive, "_write_this_file_pyi", counted_write)
+        LazyTypeHintLive().register_many({"Example1": [1, 2], "Example2": {"a": 1}, "Example3": (1, "a")})
+        assert n_writes == 1
+        assert {"Example1", "Example2", "Example3"} == set(LazyTypeHintLive()._get_classes_added())
+        for class_name in ("Example1", "Example2", "Example3"):
+            assert class_name in LazyTypeHintLive._this_file_pyi_path.read_text(encoding="utf-8")
+
+    def test_register_many_is_rolled_back(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example1")
+        this_file_pyi_before = LazyTypeHintLive._this_file_pyi_path.read_text(encoding="utf-8")
+        with pytest.raises(LazyTypeHintLiveError):
+            LazyTypeHintLive(if_type_hint_exists="validate").register_many({"Example2": {"a": 1}, "Example1": [1, "a"]})
+        assert this_file_pyi_before == LazyTypeHintLive._this_file_pyi_path.read_text(encoding="utf-8")
+        assert this_file_pyi_before == str(LazyTypeHintLive._load_this_file_pyi())
+        assert ["Example1"] == list(LazyTypeHintLive()._get_classes_added())
+
+    def test_class_modules_are_rolled_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example1")
+        path = LazyTypeHintLive._get_registry()["Example1"].path
+        content_before = path.read_text(encoding="utf-8")
+        register = LazyTypeHintLive._register
+
+        def failing_register(self: LazyTypeHintLive, data: object, *, class_name: str) -> object:
+            if class_name == "Example2":
+                raise RuntimeError("Registration failed")
+            return register(self, data, class_name=class_name)
+
+        monkeypatch.setattr(LazyTypeHintLive, "_register", failing_register)
+        with pytest.raises(RuntimeError, match="Registration failed"):
+            LazyTypeHintLive().register_many({"Example1": {"b": "x"}, "Example2": [1]})
+        assert content_before == path.read_text(encoding="utf-8")
+        assert not LazyTypeHintLive._get_registry().get_path("Example2").exists()
+
+        monkeypatch.undo()
+        LazyTypeHintLive._registry = None
+        LazyTypeHintLive._shared_this_file_pyi = None
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example1")
+        assert content_before == path.read_text(encoding="utf-8")
+
+    def test_nested_transactions(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        with LazyTypeHintLive.transaction():
+            LazyTypeHintLive().from_data([1, 2], class_name="Example1")
+            LazyTypeHintLive().from_data([1, "a"], class_name="Example2")
+            assert "Example1" not in LazyTypeHintLive._this_file_pyi_path.read_text(encoding="utf-8")
+        assert "Example2" in LazyTypeHintLive._this_file_pyi_path.read_text(encoding="utf-8")
+
+    def test_register_many_invalid_name(self) -> None:
+        with pytest.raises(LazyTypeHintLiveError):
+            LazyTypeHintLive().register_many({"Example": [1, 2], "1nvalid": [1, 2]})
+        assert not LazyTypeHintLive()._get_classes_added()
+
+
+@pytest.mark.usefixtures("_serial")
+class TestLazyTypeHintLiveWriteBehind:
+    @pytest.fixture(autouse=True)
+    def _write_behind(self) -> Any:
+        LazyTypeHintLive.enable_write_behind(flush_interval=None)
+        yield
+        LazyTypeHintLive.disable_write_behind()
+
+    def test_files_are_written_when_flushing(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        path = LazyTypeHintLive._get_registry().get_path("Example")
+        assert not path.exists()
+        assert not LazyTypeHintLive._this_file_pyi_path.exists()
+        LazyTypeHintLive.flush()
+        assert path.exists()
+        assert "Example" in LazyTypeHintLive._this_file_pyi_path.read_text(encoding="utf-8")
+
+    def test_files_are_written_when_disabled(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        LazyTypeHintLive.disable_write_behind()
+        assert LazyTypeHintLive._get_registry().get_path("Example").exists()
+
+    def test_validate_pending_files(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data([1, 3], class_name="Example")
+        with pytest.raises(LazyTypeHintLiveError):
+            LazyTypeHintLive(if_type_hint_exists="validate").from_data([1, "a"], class_name="Example")
+
+    def test_unchanged_files_are_not_queued(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        LazyTypeHintLive.flush()
+        for _ in range(3):
+            LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        assert LazyTypeHintLive._write_behind_queue is not None
+        assert len(LazyTypeHintLive._write_behind_queue) == 0
+
+    def test_reset_discards_pending_files(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        LazyTypeHintLive.reset()
+        LazyTypeHintLive.flush()
+        assert not LazyTypeHintLive._custom_class_dir_path.exists()
+
+
+@pytest.mark.usefixtures("_serial")
+class TestLazyTypeHintLiveManifest:
+    @pytest.fixture
+    def n_renders(self, monkeypatch: pytest.MonkeyPatch) -> List[str]:
+        renders: List[str] = []
+        create_custom_class_py = LazyTypeHintLive._create_custom_class_py
+
+        def counted_create(self: LazyTypeHintLive, string: str, class_name: str) -> None:
+            renders.append(class_name)
+            create_custom_class_py(self, string, class_name)
+
+        monkeypatch.setattr(LazyTypeHintLive, "_create_custom_class_py", counted_create)
+        return renders
+
+    @pytest.mark.parametrize("if_type_hint_exists", ["overwrite", "validate"])
+    def test_unchanged_type_hints_are_skipped(
+        self, n_renders: List[str], if_type_hint_exists: Literal["overwrite", "validate"]
+    ) -> None:
+        LazyTypeHintLive().from_data({"a": [1, 2]}, class_name="Example")
+        for _ in range(3):
+            LazyTypeHintLive(if_type_hint_exists=if_type_hint_exists).from_data({"a": [3]}, class_name="Example")
+        assert ["Example"] == n_renders
+
+    def test_changed_type_hints_are_written(self, n_renders: List[str]) -> None:
+        LazyTypeHintLive().from_data({"a": [1, 2]}, class_name="Example")
+        LazyTypeHintLive().from_data({"a": [1, "a"]}, class_name="Example")
+        LazyTypeHintLive(strategies=ParsingStrategies(list_strategy="Sequence")).from_data(
+            {"a": [1, "a"]}, class_name="Example"
+        )
+        assert ["Example"] * 3 == n_renders
+
+    def test_edited_module_is_written_again(self, n_renders: List[str]) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example")
+        path = LazyTypeHintLive._get_registry()["Example"].path
+        content = path.read_text(encoding="utf-8")
+        path.write_text(content.replace("a: int", "a: bytes"), encoding="utf-8")
+        LazyTypeHintLive().from_data({"a": 2}, class_name="Example")
+        assert ["Example"] * 2 == n_renders
+        assert content == path.read_text(encoding="utf-8")
+
+    def test_manifest_is_loaded(self, n_renders: List[str]) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        manifest = json.loads(LazyTypeHintLive._get_registry().manifest_path.read_text(encoding="utf-8"))
+        assert ["Example"] == list(manifest["classes"])
+        LazyTypeHintLive._registry = None
+        LazyTypeHintLive._shared_this_file_pyi = None
+        LazyTypeHintLive().from_data([3], class_name="Example")
+        assert ["Example"] == n_renders
+
+
+@pytest.mark.usefixtures("_serial")
+class TestLazyTypeHintLiveHashBasedValidation:
+    @pytest.fixture
+    def reads(self, monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+        paths_read: List[Path] = []
+        read = LazyTypeHintLive._read
+
+        def counted_read(_cls: Type[LazyTypeHintLive], path: Path) -> str:
+            paths_read.append(path)
+            return read(path)
+
+        monkeypatch.setattr(LazyTypeHintLive, "_read", classmethod(counted_read))
+        return paths_read
+
+    def test_valid_data_is_not_rendered(self, reads: List[Path], monkeypatch: pytest.MonkeyPatch) -> None:
+        LazyTypeHintLive().from_data({"a": 1, "___docstring_hidden_key_a": "Doc"}, class_name="Example")
+        monkeypatch.setattr(DataTypeTree, "get_str_all_nodes", None)
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": 2}, class_name="Example")
+        assert not reads
+
+    def test_invalid_data(self, reads: List[Path]) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example")
+        with pytest.raises(LazyTypeHintLiveError):
+            LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": "1"}, class_name="Example")
+        assert len(reads) == 1
+
+    def test_validation_without_fingerprint(self, reads: List[Path]) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example")
+        LazyTypeHintLive._get_registry().manifest_path.unlink()
+        LazyTypeHintLive._registry = None
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": 2}, class_name="Example")
+        assert len(reads) == 1
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": 2}, class_name="Example")
+        assert len(reads) == 1, "Fingerprint was not stored after validating"
+
+    def test_module_is_not_read_by_new_process(self, reads: List[Path]) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example")
+        LazyTypeHintLive._registry = None  # As if it was loaded by a new process
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": 2}, class_name="Example")
+        assert not reads
+
+    def test_module_status_is_stored_once_verified(self, reads: List[Path]) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example")
+        path = LazyTypeHintLive._get_registry()["Example"].path
+        os.utime(path, ns=(0, 0))  # Same content, different status
+        for _ in range(2):
+            LazyTypeHintLive._registry = None
+            LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": 2}, class_name="Example")
+        assert [path] == reads
+
+
+@pytest.mark.usefixtures("_serial")
+class TestLazyTypeHintLiveMultiProcess:
+    @staticmethod
+    def register_in_other_process(*class_names: str) -> "subprocess.Popen[bytes]":
+        code = (
+            "from lazy_type_hint.generators.lazy_type_hint_live import LazyTypeHintLive\n"
+            f"for class_name in {list(class_names)!r}:\n"
+            "    LazyTypeHintLive().from_data({'a': [1, 2]}, class_name=class_name)\n"
+        )
+        return subprocess.Popen([sys.executable, "-c", code], cwd=Path(__file__).parents[2])
+
+    def test_changes_made_by_other_process_are_kept(self) -> None:
+        LazyTypeHintLive().from_data([1, 2], class_name="Example1")
+        assert self.register_in_other_process("Example2").wait() == 0
+        LazyTypeHintLive().from_data([1, 2], class_name="Example3")
+        assert {"Example1", "Example2", "Example3"} == set(LazyTypeHintLive._read_classes_created())
+        assert {"Example1", "Example2", "Example3"} == set(LazyTypeHintLive._get_registry())
+        manifest = json.loads(LazyTypeHintLive._get_registry().manifest_path.read_text(encoding="utf-8"))
+        assert {"Example1", "Example2", "Example3"} == set(manifest["classes"])
+
+    def test_concurrent_processes(self) -> None:
+        processes = [self.register_in_other_process(*(f"Example{idx}_{jdx}" for jdx in range(3))) for idx in range(4)]
+        assert all(process.wait() == 0 for process in processes)
+        expected = {f"Example{idx}_{jdx}" for idx in range(4) for jdx in range(3)}
+        assert expected == set(LazyTypeHintLive._read_classes_created())
+        assert expected == set(LazyTypeHintLive._get_registry())
+
+    def test_changes_made_by_other_process_are_kept_with_write_behind(self) -> None:
+        LazyTypeHintLive.enable_write_behind(flush_interval=None)
+        try:
+            LazyTypeHintLive().from_data([1, 2], class_name="Example1")
+            LazyTypeHintLive.flush()
+            assert self.register_in_other_process("Example2").wait() == 0
+            LazyTypeHintLive().from_data([1, 2], class_name="Example3")
+        finally:
+            LazyTypeHintLive.disable_write_behind()
+        LazyTypeHintLive._registry = None  # Load everything from disk again
+        LazyTypeHintLive._shared_this_file_pyi = None
+        assert {"Example1", "Example2", "Example3"} == set(LazyTypeHintLive._read_classes_created())
+        assert {"Example1", "Example2", "Example3"} == set(LazyTypeHintLive._get_registry())
+
+    def test_concurrent_threads(self) -> None:
+        def register(idx: int) -> None:
+            for jdx in range(3):
+                LazyTypeHintLive().from_data({"a": [idx]}, class_name=f"Example{idx}_{jdx}")
+
+        threads = [threading.Thread(target=register, args=(idx,)) for idx in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        expected = {f"Example{idx}_{jdx}" for idx in range(4) for jdx in range(3)}
+        assert expected == set(LazyTypeHintLive._read_classes_created())
+        assert expected == set(LazyTypeHintLive._get_registry())
+        assert all(LazyTypeHintLive._get_registry().get_path(class_name).exists() for class_name in expected)
+
+
+@pytest.mark.usefixtures("_serial")
+class TestLazyTypeHintLiveSharding:
+    @pytest.fixture(autouse=True)
+    def _sharding(self) -> Any:
+        LazyTypeHintLive.enable_sharding(n_modules=2)
+        yield
+        LazyTypeHintLive.disable_sharding()
+
+    def test_classes_are_sharded(self) -> None:
+        LazyTypeHintLive().register_many({f"Example{idx}": {"a": [idx]} for idx in range(10)})
+        paths = {record.path for record in LazyTypeHintLive._get_registry().values()}
+        assert {path.name for path in paths} <= {"_shard_0.py", "_shard_1.py"}
+        assert set(LazyTypeHintLive._custom_class_dir_path.glob("*.py")) == paths
+        for idx in range(10):
+            path = LazyTypeHintLive._get_registry()[f"Example{idx}"].path
+            assert f"class Example{idx}(TypedDict)" in path.read_text(encoding="utf-8")
+            assert f"build.{path.stem} import Example{idx}" in str(LazyTypeHintLive._load_this_file_pyi())
+
+    def test_edited_module_is_written_again(self) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example")
+        path = LazyTypeHintLive._get_registry()["Example"].path
+        content = path.read_text(encoding="utf-8")
+        path.write_text(content.replace("a: int", "a: bytes"), encoding="utf-8")
+        LazyTypeHintLive().from_data({"a": 2}, class_name="Example")
+        assert content == path.read_text(encoding="utf-8")
+
+    def test_conflicting_class_gets_its_own_module(self) -> None:
+        LazyTypeHintLive.enable_sharding(n_modules=1)
+        LazyTypeHintLive().from_data({"a": {"b": 1}}, class_name="Example")
+        LazyTypeHintLive().from_data([1, 2], class_name="ExampleA")
+        registry = LazyTypeHintLive._get_registry()
+        assert registry["Example"].path.name == "_shard_0.py"
+        assert registry["ExampleA"].path.name == "ExampleA.py"
+
+    def test_class_is_replaced(self) -> None:
+        LazyTypeHintLive().from_data({"a": [1, 2]}, class_name="Example")
+        LazyTypeHintLive().from_data({"a": [1, "a"]}, class_name="Example")
+        content = LazyTypeHintLive._get_registry()["Example"].path.read_text(encoding="utf-8")
+        assert "a: List[Union[int, str]]" in content
+        assert "a: List[int]" not in content
+
+    def test_class_is_moved_to_shared_module(self) -> None:
+        LazyTypeHintLive.disable_sharding()
+        LazyTypeHintLive().from_data([1, 2], class_name="Example")
+        LazyTypeHintLive.enable_sharding(n_modules=1)
+        LazyTypeHintLive().from_data([1, "a"], class_name="Example")
+        this_file_pyi = str(LazyTypeHintLive._load_this_file_pyi())
+        assert "from lazy_type_hint.generators.build._shard_0 import Example" in this_file_pyi
+        assert "from lazy_type_hint.generators.build.Example import Example" not in this_file_pyi
+
+    def test_validation(self) -> None:
+        LazyTypeHintLive().from_data({"a": 1}, class_name="Example")
+        LazyTypeHintLive._registry = None
+        LazyTypeHintLive._build_store = BuildStore()
+        LazyTypeHintLive(if_type_hint_exists="validate").from_data(
+            {"a": 2, "___docstring_hidden_key_a": "Doc"}, class_name="Example"
+        )
+        with pytest.raises(LazyTypeHintLiveError):
+            LazyTypeHintLive(if_type_hint_exists="validate").from_data({"a": "1"}, class_name="Example")
@@ -0,0 +1,107 @@
+import importlib
+import os
+from pathlib import Path
+from typing import Any, Dict, Final, Mapping
+
+import pytest
+
+from lazy_type_hint import LazyTypeHint
+from lazy_type_hint.generators.lazy_type_hint_abc import LazyTypeHintError
+from lazy_type_hint.generators.lazy_type_hint_session import LazyTypeHintSession
+
+ADDRESS: Final = {"street": "Main", "zip": 1, "geo": {"lat": 1.0, "lon": 2.0}}
+PAYLOADS: Final[Mapping[str, object]] = {
+    "Order": {"id": 1, "address": ADDRESS, "items": [{"sku": "a", "qty": 1}]},
+    "Invoice": {"number": "1", "billing": dict(ADDRESS), "shipping": {"to": dict(ADDRESS)}},
+    "UserProfile": {"home": dict(ADDRESS), "tags": ["a"]},
+}
+
+
+@pytest.fixture
+def session() -> LazyTypeHintSession:
+    session = LazyTypeHintSession()
+    for class_name, data in PAYLOADS.items():
+        session.from_data(data, class_name=class_name)
+    return session
+
+
+class TestSharedAliases:
+    def test_shared_aliases_are_defined_once(self, session: LazyTypeHintSession) -> None:
+        modules = dict(session.iter_modules())
+        assert list(modules) == ["shared", "order", "invoice", "user_profile"]
+        assert modules["shared"].count("class OrderAddress(TypedDict):") == 1
+        assert modules["shared"].count("class OrderAddressGeo(TypedDict):") == 1
+        for module in ("order", "invoice", "user_profile"):
+            assert "(TypedDict):\n    street: str" not in modules[module]
+
+    def test_aliases_are_referenced_by_their_registered_name(self, session: LazyTypeHintSession) -> None:
+        invoice = session.get_class_module("Invoice")
+        assert "from .shared import InvoiceShipping, OrderAddress\n" in invoice
+        assert "billing: OrderAddress" in invoice
+        assert "to: OrderAddress" in session.get_shared_module()
+
+    def test_trees_are_still_standalone(self) -> None:
+        session = LazyTypeHintSession()
+        session.from_data(PAYLOADS["Order"], class_name="Order")
+        tree = session.from_data(PAYLOADS["Invoice"], class_name="Invoice")
+        string = tree.to_string()
+        assert "class OrderAddress(TypedDict):" in string
+        assert "billing: OrderAddress" in string
+        exec(string, {})
+
+    def test_same_output_as_without_session(self) -> None:
+        session = LazyTypeHintSession()
+        tree = session.from_data(PAYLOADS["Order"], class_name="Order")
+        assert tree.to_string() == LazyTypeHint().from_data(PAYLOADS["Order"], class_name="Order").to_string()
+
+    def test_cycles_are_not_shared(self) -> None:
+        data: Dict[str, Any] = {"value": 1}
+        data["next"] = data
+        session = LazyTypeHintSession()
+        session.from_data({"node": data}, class_name="Example")
+        assert "ExampleNode" not in session.get_shared_module()
+        assert "class ExampleNode(TypedDict):" in session.get_class_module("Example")
+
+
+class TestToDir:
+    def test_package_is_importable(
+        self, session: LazyTypeHintSession, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        session.to_dir(tmp_path / "session_types", create_non_existing_dir=True)
+        assert sorted(os.listdir(tmp_path / "session_types")) == [
+            "__init__.py",
+            "invoice.py",
+            "order.py",
+            "shared.py",
+            "user_profile.py",
+        ]
+        monkeypatch.syspath_prepend(str(tmp_path))
+        package = importlib.import_module("session_types")
+        assert package.Invoice.__annotations__.keys() == {"number", "billing", "shipping"}
+        assert package.UserProfile.__annotations__["home"] is package.Order.__annotations__["address"]
+
+    def test_non_existing_dir(self, session: LazyTypeHintSession, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="does not exist"):
+            session.to_dir(tmp_path / "session_types")
+
+
+class TestErrors:
+    def test_repeated_class_name(self, session: LazyTypeHintSession) -> None:
+        with pytest.raises(LazyTypeHintError, match="already in use"):
+            session.from_data({"a": 1}, class_name="Order")
+
+    def test_class_name_of_shared_alias(self, session: LazyTypeHintSession) -> None:
+        with pytest.raises(LazyTypeHintError, match="already in use"):
+            session.from_data({"a": 1}, class_name="OrderAddress")
+
+    def test_unknown_class(self, session: LazyTypeHintSession) -> None:
+        with pytest.raises(LazyTypeHintError, match="No class named"):
+            session.get_class_module("Unknown")
+
+
+@pytest.mark.parametrize(
+    ("class_name", "expected_module"),
+    (("Order", "order"), ("UserProfile", "user_profile"), ("HTTPResponse", "http_response"), ("V2Api", "v2_api")),
+)
+def test_get_module_name(class_name: str, expected_module: str) -> None:
+    assert LazyTypeHintSession.get_module_name(class_name) == expected_module
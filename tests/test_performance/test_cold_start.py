@@ -0,0 +1,112 @@
+"""Cold-start benchmarks, where each measurement is taken within a fresh interpreter.
+
+Budgets are given in milliseconds and are meant to catch regressions rather than small variations. The best of several
+runs is taken to reduce the noise. As they depend on the machine, they are only checked if the environment variable
+`LAZY_TYPE_HINT_COLD_START_BUDGETS` is set. Heavy libraries imported eagerly are checked regardless.
+"""
+import functools
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Final, Mapping
+
+import pytest
+
+ROOT_DIR: Final = Path(__file__).parents[2]
+N_RUNS: Final = 3
+"""Number of fresh interpreters used for each measurement. The best one is kept."""
+
+IMPORT_BUDGETS_MS: Final = {
+    "lazy_type_hint": 250,
+    "lazy_type_hint.strategies": 25,
+    "lazy_type_hint.utils": 100,
+    "lazy_type_hint.data_type_tree": 200,
+    "lazy_type_hint.generators.lazy_type_hint": 250,
+    "lazy_type_hint.generators.lazy_type_hint_live": 100,
+}
+"""Maximum time spent importing each module (including the modules it imports) when importing this package within a
+fresh interpreter."""
+
+DATA: Final = "{'name': 'Peter', 'age': 22, 'friends': [{'name': 'John', 'age': 21}], 'scores': (1.0, 2.0)}"
+FIRST_CALL_BUDGETS_MS: Final = {
+    "ParsingStrategies": ("from lazy_type_hint import ParsingStrategies", "ParsingStrategies()", 5),
+    "data_type_tree_factory": (
+        "from lazy_type_hint.data_type_tree import data_type_tree_factory",
+        f"data_type_tree_factory({DATA}, 'Example')",
+        25,
+    ),
+    "LazyTypeHint.from_data": (
+        "from lazy_type_hint import LazyTypeHint",
+        f"LazyTypeHint().from_data({DATA}, class_name='Example').to_string()",
+        50,
+    ),
+}
+"""Setup, statement and maximum time spent by its first call within a fresh interpreter."""
+
+HEAVY_MODULES: Final = ("numpy", "pandas")
+"""Modules that must only be imported once data that requires them is found."""
+
+IMPORT_TIME_PATTERN: Final = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\S+)")
+
+check_budgets: Final = pytest.mark.skipif(
+    not os.environ.get("LAZY_TYPE_HINT_COLD_START_BUDGETS"),
+    reason="Set LAZY_TYPE_HINT_COLD_START_BUDGETS to check the cold-start budgets",
+)
+
+
+def run_python(*args: str) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run([sys.executable, *args], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+
+
+def get_best_ms(measure: Callable[[], float]) -> float:
+    return min(measure() for _ in range(N_RUNS))
+
+
+@functools.lru_cache(maxsize=None)
+def get_best_import_ms() -> Mapping[str, float]:
+    """Best import time of each module of this package across multiple fresh interpreters that import it."""
+    runs = [measure_import_ms("lazy_type_hint") for _ in range(N_RUNS)]
+    return {module: min(run[module] for run in runs) for module in runs[0] if module.startswith("lazy_type_hint")}
+
+
+def measure_import_ms(module: str) -> Dict[str, float]:
+    """Cumulative time reported by `-X importtime` for each module imported by the given one, in milliseconds."""
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    return {match.group(3): int(match.group(2)) / 1000 for match in IMPORT_TIME_PATTERN.finditer(stderr)}
+
+
+def measure_first_call_ms(setup: str, statement: str) -> float:
+    code = (
+        f"import json, time\n{setup}\n"
+        f"start = time.perf_counter()\n{statement}\n"
+        "print(json.dumps((time.perf_counter() - start) * 1000))"
+    )
+    return float(json.loads(run_python("-c", code).stdout))
+
+
+@check_budgets
+@pytest.mark.parametrize("module", IMPORT_BUDGETS_MS)
+def test_import_time(module: str, record_property: Callable[[str, object], None]) -> None:
+    import_ms = get_best_import_ms()[module]
+    record_property("import_ms", import_ms)
+    assert import_ms < IMPORT_BUDGETS_MS[module], f"Importing {module} took {import_ms:.1f} ms"
+
+
+@check_budgets
+@pytest.mark.parametrize("name", FIRST_CALL_BUDGETS_MS)
+def test_first_call_time(name: str, record_property: Callable[[str, object], None]) -> None:
+    setup, statement, budget_ms = FIRST_CALL_BUDGETS_MS[name]
+    first_call_ms = get_best_ms(lambda: measure_first_call_ms(setup, statement))
+    record_property("first_call_ms", first_call_ms)
+    assert first_call_ms < budget_ms, f"First call to {name} took {first_call_ms:.1f} ms"
+
+
+@pytest.mark.parametrize("name", FIRST_CALL_BUDGETS_MS)
+def test_heavy_modules_are_not_imported(name: str) -> None:
+    setup, statement, _ = FIRST_CALL_BUDGETS_MS[name]
+    code = f"import json, sys\n{setup}\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    imported = set(json.loads(run_python("-c", code).stdout))
+    assert imported.isdisjoint(HEAVY_MODULES), f"{name} imported {sorted(imported.intersection(HEAVY_MODULES))}"
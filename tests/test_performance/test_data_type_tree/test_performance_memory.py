@@ -0,0 +1,112 @@
+"""Memory benchmarks of the tree construction, measured with `tracemalloc`.
+
+Budgets are given per node built and per megabyte of input data. The retained memory is the one still held by the
+tree once built (including the copies made by `DictMetadata` or the DataFrame-based trees), while the peak one also
+includes any temporary object allocated meanwhile.
+"""
+import gc
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Final, NamedTuple, Tuple
+
+import pandas as pd
+import pytest
+import yaml
+
+import lazy_type_hint
+from lazy_type_hint.data_type_tree import data_type_tree_factory
+from lazy_type_hint.utils import Instrumentation
+
+TEST_FILES_DIR: Final = Path(__file__).parent / "test_files"
+PACKAGE_DIR: Final = str(Path(lazy_type_hint.__file__).parent)
+MB: Final = 1024 * 1024
+
+
+class MemoryUsage(NamedTuple):
+    input_bytes: int
+    """Memory allocated to build the input data (or size of the file it is read from)."""
+    n_nodes: int
+    peak_bytes: int
+    retained_bytes: int
+    retained_bytes_by_file: Dict[str, int]
+    """Memory retained by the tree, by module of this package where it was allocated."""
+
+
+def read_yaml_file() -> Tuple[object, int]:
+    path = TEST_FILES_DIR / "big_file.yaml"
+    with open(path) as file:
+        return yaml.safe_load(file), path.stat().st_size
+
+
+def build_dict() -> Tuple[object, int]:
+    return {f"key{idx}": {"a": idx, "b": str(idx), "c": [idx, idx + 1]} for idx in range(2000)}, 0
+
+
+def build_list() -> Tuple[object, int]:
+    return [{"a": idx, "b": str(idx), "c": [float(idx)]} for idx in range(2000)], 0
+
+
+def build_dataframe() -> Tuple[object, int]:
+    return pd.DataFrame({f"column{idx}": range(1000) for idx in range(100)}), 0
+
+
+INPUTS: Final = {"dict": build_dict, "list": build_list, "DataFrame": build_dataframe, "YAML": read_yaml_file}
+"""Function that builds each input, returning the input and its size in bytes (0 to measure it instead)."""
+
+BUDGETS: Final = {
+    "dict": (1_200, 1_300, 15 * MB),
+    "list": (200, 250, 1 * MB),
+    "DataFrame": (3_000, 4_000, 2 * MB),
+    "YAML": (1_000, 1_100, 64 * MB),
+}
+"""Maximum retained bytes per node, peak bytes per node and peak bytes per megabyte of input, by input."""
+
+
+def measure_memory(build_input: Callable[[], Tuple[object, int]]) -> MemoryUsage:
+    data_type_tree_factory(build_input()[0], name="Example")  # Warm up any class-level cache
+
+    gc.collect()
+    tracemalloc.start()
+    data, input_bytes = build_input()
+    input_bytes = input_bytes or tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    instrumentation = Instrumentation()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with instrumentation.activate():
+            tree = data_type_tree_factory(data, name="Example")
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        gc.collect()  # Discarded nodes (such as merged ones) hold reference cycles with their parents
+        retained_bytes = tracemalloc.get_traced_memory()[0]
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del tree
+
+    retained_bytes_by_file = {
+        Path(stat.traceback[0].filename).name: stat.size
+        for stat in snapshot.statistics("filename")
+        if stat.traceback[0].filename.startswith(PACKAGE_DIR)
+    }
+    return MemoryUsage(
+        input_bytes, instrumentation.get_total().n_nodes, peak_bytes, retained_bytes, retained_bytes_by_file
+    )
+
+
+@pytest.mark.parametrize("input_name", INPUTS)
+def test_memory(input_name: str, record_property: Callable[[str, object], None]) -> None:
+    usage = measure_memory(INPUTS[input_name])
+    retained_per_node = usage.retained_bytes / usage.n_nodes
+    peak_per_node = usage.peak_bytes / usage.n_nodes
+    peak_per_input_mb = usage.peak_bytes / (usage.input_bytes / MB)
+    record_property("n_nodes", usage.n_nodes)
+    record_property("peak_bytes", usage.peak_bytes)
+    record_property("retained_bytes", usage.retained_bytes)
+    record_property("retained_bytes_by_file", usage.retained_bytes_by_file)
+
+    max_retained_per_node, max_peak_per_node, max_peak_per_input_mb = BUDGETS[input_name]
+    assert retained_per_node < max_retained_per_node, f"{retained_per_node:.0f} bytes retained per node"
+    assert peak_per_node < max_peak_per_node, f"{peak_per_node:.0f} bytes of peak memory per node"
+    assert peak_per_input_mb < max_peak_per_input_mb, f"{peak_per_input_mb / MB:.2f} MB of peak memory per input MB"
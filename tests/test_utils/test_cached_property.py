@@ -0,0 +1,88 @@
+from typing import List
+
+import pytest
+
+from lazy_type_hint.utils import CachedProperty, cached_property, invalidate_cached_properties
+
+
+class Dummy:
+    def __init__(self, data: List[int]) -> None:
+        self.data = data
+        self.calls: List[str] = []
+
+    @cached_property(depends_on=("data",))
+    def total(self) -> int:
+        self.calls.append("total")
+        return sum(self.data)
+
+    @cached_property(depends_on=("total",))
+    def description(self) -> str:
+        self.calls.append("description")
+        return f"Total: {self.total}"
+
+    @cached_property
+    def independent(self) -> int:
+        self.calls.append("independent")
+        return 1
+
+
+class SlottedDummy:
+    __slots__ = ("data", "_cached_total")
+
+    def __init__(self, data: List[int]) -> None:
+        self.data = data
+
+    @cached_property(depends_on=("data",))
+    def total(self) -> int:
+        return sum(self.data)
+
+
+class TestCachedProperty:
+    def test_value_is_computed_once(self) -> None:
+        dummy = Dummy([1, 2])
+        assert dummy.total == 3
+        assert dummy.total == 3
+        assert dummy.calls == ["total"]
+
+    def test_value_is_stored_per_instance(self) -> None:
+        assert Dummy([1]).total == 1
+        assert Dummy([2]).total == 2
+
+    def test_slots(self) -> None:
+        dummy = SlottedDummy([1, 2])
+        assert dummy.total == 3
+        assert Dummy.total.is_cached(Dummy([1])) is False
+        assert SlottedDummy.total.is_cached(dummy)
+
+    def test_class_access_returns_descriptor(self) -> None:
+        assert isinstance(Dummy.total, CachedProperty)
+        assert Dummy.total.name == "total"
+        assert Dummy.total.depends_on == frozenset({"data"})
+
+
+class TestInvalidateCachedProperties:
+    @pytest.fixture
+    def dummy(self) -> Dummy:
+        dummy = Dummy([1, 2])
+        assert dummy.description == "Total: 3"
+        assert dummy.independent == 1
+        dummy.calls.clear()
+        return dummy
+
+    def test_dependencies_are_invalidated_transitively(self, dummy: Dummy) -> None:
+        dummy.data.append(3)
+        assert invalidate_cached_properties(dummy, "data") == {"total", "description"}
+        assert dummy.description == "Total: 6"
+        assert dummy.independent == 1
+        assert dummy.calls == ["description", "total"]
+
+    def test_unrelated_attributes_do_not_invalidate(self, dummy: Dummy) -> None:
+        assert invalidate_cached_properties(dummy, "other") == set()
+        assert dummy.description == "Total: 3"
+        assert not dummy.calls
+
+    def test_all_values_are_invalidated_by_default(self, dummy: Dummy) -> None:
+        assert invalidate_cached_properties(dummy) == {"total", "description", "independent"}
+
+    def test_values_not_computed_yet(self) -> None:
+        assert invalidate_cached_properties(Dummy([1]), "data") == set()
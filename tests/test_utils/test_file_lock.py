@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from lazy_type_hint.utils import FileLock
+from lazy_type_hint.utils.file_lock import FileLockError
+
+
+class TestFileLock:
+    def test_lock_is_released(self, tmp_path: Path) -> None:
+        lock = FileLock(tmp_path / "file.lock")
+        with lock:
+            assert lock.is_locked
+        assert not lock.is_locked
+        with FileLock(tmp_path / "file.lock", timeout=0):
+            pass
+
+    def test_lock_is_reentrant(self, tmp_path: Path) -> None:
+        lock = FileLock(tmp_path / "file.lock")
+        with lock, lock:
+            assert lock.is_locked
+        assert not lock.is_locked
+
+    def test_timeout(self, tmp_path: Path) -> None:
+        with FileLock(tmp_path / "file.lock"):
+            other_lock = FileLock(tmp_path / "file.lock", timeout=0.05)
+            with pytest.raises(FileLockError):
+                other_lock.acquire()
+            assert not other_lock.is_locked
+
+    def test_release_without_acquiring(self, tmp_path: Path) -> None:
+        with pytest.raises(FileLockError):
+            FileLock(tmp_path / "file.lock").release()
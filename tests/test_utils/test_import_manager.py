@@ -89,3 +89,10 @@ from typing import (
         formatted_imports = import_manager.format(line_length=80)
         expected_output = ""
         assert expected_output == formatted_imports
+
+
+def test_get_used_in(import_manager: ImportManager) -> None:
+    import_manager.add("list").add("dict").add("numpy").add("pd.Scalar").add("annotations")
+    used = import_manager.get_used_in('Example: TypeAlias = List["np.ndarray"]\nOther = Scalar')
+    assert set(used) == {"list", "numpy", "pd.Scalar", "annotations"}
+    assert set(import_manager) == {"list", "dict", "numpy", "pd.Scalar", "annotations"}
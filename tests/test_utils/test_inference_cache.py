@@ -0,0 +1,49 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from lazy_type_hint.utils import InferenceCache
+from lazy_type_hint.utils.inference_cache import InferenceCacheError
+
+
+class TestInferenceCache:
+    def test_get_and_put(self, tmp_path: Path) -> None:
+        cache = InferenceCache(tmp_path / "cache")
+        key = cache.get_key("data", 1)
+        assert cache.get(key) is None
+        cache.put(key, {"a": "b"})
+        assert cache.get(key) == {"a": "b"}
+        assert InferenceCache(tmp_path / "cache").get(key) == {"a": "b"}
+
+    def test_key_depends_on_all_parts(self) -> None:
+        assert InferenceCache.get_key("data", 1) == InferenceCache.get_key("data", 1)
+        assert InferenceCache.get_key("data", 1) != InferenceCache.get_key("data", 2)
+
+    def test_invalid_entries_are_ignored(self, tmp_path: Path) -> None:
+        cache = InferenceCache(tmp_path)
+        key = cache.get_key("data")
+        (tmp_path / f"{key}{cache.suffix}").write_text("{invalid")
+        assert cache.get(key) is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache = InferenceCache(tmp_path, max_size=len('{"a": "b"}') * 2)
+        keys = [cache.get_key(idx) for idx in range(3)]
+        for idx, key in enumerate(keys[:2]):
+            cache.put(key, {"a": "b"})
+            os.utime(tmp_path / f"{key}{cache.suffix}", ns=(idx, idx))
+        cache.get(keys[0])
+        cache.put(keys[2], {"a": "b"})
+        assert cache.get(keys[0]) == {"a": "b"}
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) == {"a": "b"}
+
+    def test_clear(self, tmp_path: Path) -> None:
+        cache = InferenceCache(tmp_path)
+        cache.put(cache.get_key("data"), {"a": "b"})
+        cache.clear()
+        assert not list(tmp_path.iterdir())
+
+    def test_invalid_max_size(self, tmp_path: Path) -> None:
+        with pytest.raises(InferenceCacheError):
+            InferenceCache(tmp_path, max_size=0)
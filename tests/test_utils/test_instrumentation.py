@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+
+import lazy_type_hint.utils.instrumentation as instrumentation_module
+from lazy_type_hint.data_type_tree import data_type_tree_factory
+from lazy_type_hint.strategies import ParsingStrategies
+from lazy_type_hint.utils import Instrumentation
+
+
+class TestInstrumentation:
+    def test_nodes_are_counted_per_subclass(self) -> None:
+        instrumentation = Instrumentation()
+        with instrumentation.activate():
+            tree = data_type_tree_factory({"a": [1, 2.0], "b": "c"}, name="Example")
+            tree.get_str_all_nodes()
+        assert instrumentation.stats["DictDataTypeTree"].n_nodes == 1
+        assert instrumentation.stats["ListDataTypeTree"].n_nodes == 1
+        assert instrumentation.stats["InstanceDataTypeTree"].n_nodes == 3
+        assert instrumentation.get_total().construction_time > 0
+        assert instrumentation.get_total().render_time > 0
+
+    def test_inactive_instrumentation_records_nothing(self) -> None:
+        instrumentation = Instrumentation()
+        with instrumentation.activate():
+            pass
+        data_type_tree_factory([1, 2], name="Example")
+        assert Instrumentation.active is None
+        assert not instrumentation.stats
+
+    def test_own_time_excludes_nested_measurements(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        times = iter([0.0, 1.0, 3.0, 6.0])
+        monkeypatch.setattr(instrumentation_module, "time", SimpleNamespace(perf_counter=lambda: next(times)))
+        instrumentation = Instrumentation()
+        outer = instrumentation.start()
+        inner = instrumentation.start()
+        instrumentation.stop("Inner", "construction", inner)
+        instrumentation.stop("Outer", "hash", outer)
+        assert instrumentation.stats["Inner"].construction_time == 2.0
+        assert instrumentation.stats["Outer"].hash_time == 4.0
+        assert instrumentation.stats["Outer"].n_nodes == 0
+
+    def test_skipped_elements(self) -> None:
+        instrumentation = Instrumentation()
+        strategies = ParsingStrategies(check_max_n_elements_within_container=10, dict_strategy="dict")
+        with instrumentation.activate():
+            data_type_tree_factory([1] * 25, name="Example", strategies=strategies)
+            data_type_tree_factory(dict.fromkeys(range(15), 1), name="Example", strategies=strategies)
+        assert instrumentation.stats["ListDataTypeTree"].n_skipped_elements == 15
+        assert instrumentation.stats["DictDataTypeTree"].n_skipped_elements == 5
+
+    def test_merges(self) -> None:
+        instrumentation = Instrumentation()
+        with instrumentation.activate():
+            data_type_tree_factory([{"a": 1, "b": 2}, {"a": 1, "b": 2, "c": 3}], name="Example")
+        assert instrumentation.stats["DictDataTypeTree"].n_merges == 2
+
+    def test_format(self) -> None:
+        instrumentation = Instrumentation()
+        with instrumentation.activate():
+            data_type_tree_factory([1, 2], name="Example")
+        lines = instrumentation.format().splitlines()
+        assert lines[0].split() == ["Node", "Nodes", "Construction", "Hash", "Render", "Merges", "Skipped"]
+        assert {line.split()[0] for line in lines[1:]} == {"ListDataTypeTree", "InstanceDataTypeTree"}
+        assert set(instrumentation.to_dict()) == {"ListDataTypeTree", "InstanceDataTypeTree"}
@@ -0,0 +1,83 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, List, Mapping, cast
+
+import pytest
+
+from lazy_type_hint.utils import JsonlLineIndex, jsonl_line_index
+from lazy_type_hint.utils.jsonl_line_index import JsonlLineIndexError
+
+
+class TestJsonlLineIndex:
+    @pytest.fixture
+    def records(self) -> List[Any]:
+        return [{"idx": idx, "name": f"name{idx}"} for idx in range(100)]
+
+    @pytest.fixture
+    def jsonl_file(self, records: List[Any], tmp_path: str) -> Path:
+        path = Path(tmp_path) / "file.jsonl"
+        lines = [json.dumps(record) for record in records]
+        lines.insert(10, "")  # Empty lines must be ignored
+        path.write_text("\n".join(lines))  # No trailing new line
+        return path
+
+    def test_read_record(self, jsonl_file: Path, records: List[Any]) -> None:
+        with JsonlLineIndex(jsonl_file) as index:
+            assert len(records) == len(index)
+            assert [index.read_record(idx) for idx in range(len(index))] == records
+            with pytest.raises(IndexError):
+                index.read_record(len(records))
+
+    def test_index_is_persisted(self, jsonl_file: Path) -> None:
+        with JsonlLineIndex(jsonl_file) as index:
+            index_path = index.index_path
+        assert index_path.exists()
+        mtime_ns = os.stat(index_path).st_mtime_ns
+        with JsonlLineIndex(jsonl_file):
+            pass
+        assert mtime_ns == os.stat(index_path).st_mtime_ns, "The index was built again although it was up to date"
+
+    def test_index_is_kept_in_memory_if_it_cannot_be_persisted(
+        self, jsonl_file: Path, records: List[Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def atomic_write(*args: object, **kwargs: object) -> None:  # noqa: ARG001
+            raise PermissionError("Read-only directory")
+
+        monkeypatch.setattr(jsonl_line_index, "atomic_write", atomic_write)
+        with JsonlLineIndex(jsonl_file) as index:
+            assert not index.index_path.exists()
+            assert len(records) == len(index)
+            assert index.sample(len(records)) == records
+
+    def test_index_is_rebuilt_if_file_changes(self, jsonl_file: Path) -> None:
+        with JsonlLineIndex(jsonl_file):
+            pass
+        jsonl_file.write_text('{"a": 1}\n{"a": 2}\n')
+        with JsonlLineIndex(jsonl_file) as index:
+            assert len(index) == 2
+            assert index.read_record(1) == {"a": 2}
+
+    @pytest.mark.parametrize("n_records", [1, 10, 100, 1_000])
+    def test_sample(self, jsonl_file: Path, records: List[Any], n_records: int) -> None:
+        with JsonlLineIndex(jsonl_file) as index:
+            sample = index.sample(n_records, seed=0)
+            assert sample == index.sample(n_records, seed=0), "Same seed must return the same sample"
+        assert len(sample) == min(n_records, len(records))
+        assert all(record in records for record in sample)
+        assert sample == sorted(
+            sample, key=lambda record: cast(Mapping[str, int], record)["idx"]
+        ), "Sample must keep the order of the file"
+
+    def test_empty_file(self, tmp_path: str) -> None:
+        path = Path(tmp_path) / "file.jsonl"
+        path.write_text("")
+        with JsonlLineIndex(path) as index:
+            assert len(index) == 0
+            assert index.sample(5) == []
+
+    def test_errors(self, jsonl_file: Path, tmp_path: str) -> None:
+        with pytest.raises(JsonlLineIndexError):
+            JsonlLineIndex(Path(tmp_path) / "non_existing.jsonl")
+        with JsonlLineIndex(jsonl_file) as index, pytest.raises(JsonlLineIndexError):
+            index.sample(0)
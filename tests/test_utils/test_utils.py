@@ -1,10 +1,14 @@
-from typing import Any
+import os
+from fractions import Fraction
+from pathlib import Path
 
 import pytest
 
+from lazy_type_hint.data_type_tree.data_type_tree import DataTypeTree
 from lazy_type_hint.utils import (
-    cache_returned_value_per_instance,
+    atomic_write,
     is_string_python_keyword_compatible,
+    register_lazy_subclasses,
 )
 
 
@@ -38,27 +42,50 @@ def test_is_string_python_keyword_compatible(string: str, expected_output: bool)
     assert expected_output == is_string_python_keyword_compatible(string)
 
 
-class TestCacheReturnedValue:
-    class DummyClass:
-        """Class that will be used for testing purposes."""
+class TestAtomicWrite:
+    def test_write(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        with atomic_write(path) as file:
+            file.write("content")
+        assert path.read_text(encoding="utf-8") == "content"
+        assert ["file.txt"] == os.listdir(tmp_path)
 
-        def __init__(self) -> None:
-            self.cache_attr = None
+    def test_write_binary(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.bin"
+        with atomic_write(path, binary=True) as file:
+            file.write(b"content")
+        assert path.read_bytes() == b"content"
 
-        @cache_returned_value_per_instance
-        def dummy_method(self, arg: Any) -> Any:
-            self.cache_attr = arg
-            return arg
+    def test_file_is_untouched_on_failure(self, tmp_path: Path) -> None:
+        class DummyError(Exception):
+            pass
 
-    def test_cache_returned_value(self) -> None:
-        dummy_obj = self.DummyClass()
+        path = tmp_path / "file.txt"
+        path.write_text("old content", encoding="utf-8")
 
-        # Test initial call
-        result = dummy_obj.dummy_method(10)
-        assert result == 10
-        assert dummy_obj.cache_attr == 10
+        def write() -> None:
+            with atomic_write(path) as file:
+                file.write("new content")
+                raise DummyError
 
-        # Test cached call
-        result = dummy_obj.dummy_method(20)
-        assert result == 10
-        assert dummy_obj.cache_attr == 10
+        with pytest.raises(DummyError):
+            write()
+        assert path.read_text(encoding="utf-8") == "old content"
+        assert ["file.txt"] == os.listdir(tmp_path)
+
+    def test_permissions_are_kept(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.txt"
+        path.write_text("old content", encoding="utf-8")
+        os.chmod(path, 0o600)
+        with atomic_write(path) as file:
+            file.write("new content")
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_register_lazy_subclasses(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(DataTypeTree, "lazy_subclasses", {})
+    getattr_ = register_lazy_subclasses("module", "fractions", {"Fraction": "fractions"})
+    assert DataTypeTree.lazy_subclasses == {"fractions": ["fractions"]}
+    assert getattr_("Fraction") is Fraction
+    with pytest.raises(AttributeError, match="'module' has no attribute 'Other'"):
+        getattr_("Other")
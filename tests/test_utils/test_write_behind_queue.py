@@ -0,0 +1,100 @@
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from lazy_type_hint.utils.write_behind_queue import WriteBehindQueue, WriteBehindQueueError
+
+
+@pytest.fixture
+def queue() -> Iterator[WriteBehindQueue]:
+    queue = WriteBehindQueue(flush_interval=None)
+    yield queue
+    queue.close()
+
+
+class TestWriteBehindQueue:
+    def test_flush(self, queue: WriteBehindQueue, tmp_path: Path) -> None:
+        path = tmp_path / "dir" / "file.py"
+        assert queue.put(path, "a = 1")
+        assert not path.exists()
+        assert queue.get_pending(path) == "a = 1"
+        queue.flush()
+        assert path.read_text(encoding="utf-8") == "a = 1"
+        assert queue.get_pending(path) is None
+        assert len(queue) == 0
+
+    def test_latest_content_is_written(self, queue: WriteBehindQueue, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        queue.put(path, "a = 1")
+        queue.put(path, "a = 2")
+        assert len(queue) == 1
+        queue.flush()
+        assert path.read_text(encoding="utf-8") == "a = 2"
+
+    def test_duplicated_content_is_discarded(self, queue: WriteBehindQueue, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        assert queue.put(path, "a = 1")
+        assert not queue.put(path, "a = 1")
+        queue.flush()
+        assert not queue.put(path, "a = 1")
+        assert queue.put(path, "a = 2")
+
+    def test_discard(self, queue: WriteBehindQueue, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        queue.put(path, "a = 1")
+        queue.discard()
+        queue.flush()
+        assert not path.exists()
+
+    def test_failed_files_are_kept(self, queue: WriteBehindQueue, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        path.mkdir()
+        queue.put(path, "a = 1")
+        with pytest.raises(OSError):  # noqa: PT011
+            queue.flush()
+        assert queue.get_pending(path) == "a = 1"
+        path.rmdir()
+
+    def test_prepare_flush(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        events: List[str] = []
+
+        @contextmanager
+        def prepare_flush() -> Iterator[None]:
+            events.append("enter")
+            write_behind_queue.put(path, "a = 2")  # Newer content queued right before flushing is written as well
+            yield
+            events.append("exit")
+
+        write_behind_queue = WriteBehindQueue(flush_interval=None, prepare_flush=prepare_flush)
+        write_behind_queue.put(path, "a = 1")
+        write_behind_queue.flush()
+        assert events == ["enter", "exit"]
+        assert path.read_text() == "a = 2"
+
+    def test_close(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        queue = WriteBehindQueue(flush_interval=None)
+        queue.put(path, "a = 1")
+        queue.close()
+        assert path.exists()
+
+    def test_background_flush(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.py"
+        queue = WriteBehindQueue(flush_interval=0.01)
+        try:
+            queue.put(path, "a = 1")
+            for _ in range(500):
+                if path.exists():
+                    break
+                time.sleep(0.01)
+            assert path.read_text(encoding="utf-8") == "a = 1"
+        finally:
+            queue.close()
+
+    def test_invalid_flush_interval(self) -> None:
+        with pytest.raises(WriteBehindQueueError):
+            WriteBehindQueue(flush_interval=0)